@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""Beat clock accuracy and OSC traffic against a simulated Live transport.
+
+Compares sparse song-time sampling + local extrapolation with polling
+``current_song_time`` at display rate.
+
+    python benchmarks/bench_beat_clock.py
+"""
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from logic.beat_clock import BeatClock
+
+
+class SimulatedLiveTransport:
+    """Live's song position on a host whose clock drifts from ours"""
+
+    def __init__(self, bpm=128.0, skew=0.0005, seed=1):
+        self.bpm = bpm
+        self.skew = skew  # Host clock runs 0.05% fast
+        self.rng = random.Random(seed)
+
+    def song_time(self, t):
+        return t * (1 + self.skew) * self.bpm / 60.0
+
+    def reply(self, t):
+        """Reply to a request sent at ``t``: (arrival time, reported beat)"""
+        latency = self.rng.uniform(0.001, 0.015)  # LAN round-trip jitter
+        sampled_at = t + latency / 2
+        return t + latency, self.song_time(sampled_at)
+
+
+def run(duration=120.0, display_hz=60, sample_interval=2.0):
+    live = SimulatedLiveTransport()
+    sim_time = [0.0]
+    clock = BeatClock(time_fn=lambda: sim_time[0])
+    clock.set_tempo(live.bpm, t=0.0)
+    clock.set_playing(True, t=0.0)
+
+    errors = []
+    messages = 0
+    next_sample = 0.0
+    frame = 1.0 / display_hz
+    t = 0.0
+    while t < duration:
+        sim_time[0] = t
+        if t >= next_sample:
+            arrival, beat = live.reply(t)
+            clock.add_sample(beat, t=arrival)
+            messages += 2  # request + reply
+            next_sample += sample_interval
+        errors.append(abs(clock.beat_at(t) - live.song_time(t)))
+        t += frame
+
+    ms_per_beat = 60000.0 / live.bpm
+    errors_ms = sorted(e * ms_per_beat for e in errors)
+    streaming_messages = int(duration * display_hz) * 2
+    print(f"Simulated {duration:.0f}s at {live.bpm:.0f} BPM, {display_hz} Hz display, "
+          f"sample every {sample_interval:.1f}s")
+    print(f"  mean error : {sum(errors_ms) / len(errors_ms):6.2f} ms")
+    print(f"  p99 error  : {errors_ms[int(len(errors_ms) * 0.99)]:6.2f} ms")
+    print(f"  max error  : {errors_ms[-1]:6.2f} ms")
+    print(f"  OSC messages: {messages} (vs {streaming_messages} polling at display rate, "
+          f"{streaming_messages / messages:.0f}x less)")
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""Scroll frame cost of the virtualized clip grid (pooled ClipSlots and the
+single-canvas renderer) on a 256 x 64 set, vs building one ClipSlot per
+cell as the old ScrollView grid did.
+
+    python benchmarks/bench_clip_grid_scroll.py
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+os.environ.setdefault("KIVY_NO_ARGS", "1")
+os.environ.setdefault("KIVY_LOG_MODE", "PYTHON")
+
+from kivy.uix.boxlayout import BoxLayout
+
+from ui.widgets.clip_slot import ClipSlot
+from ui.widgets.clip_grid_canvas import ClipGridCanvas
+from ui.widgets.virtual_clip_grid import VirtualClipGrid
+
+TRACKS, SCENES = 256, 64
+VIEWPORT = (704, 240)
+
+
+def make_tracks():
+    return [{"name": f"Track {t}",
+             "clips": [{"status": "playing" if (t + s) % 9 == 0 else "empty",
+                        "name": f"Clip {s}" if (t * 7 + s) % 4 == 0 else "",
+                        "has_content": (t * 7 + s) % 4 == 0} for s in range(SCENES)]}
+            for t in range(TRACKS)]
+
+
+def bench_virtual(tracks, grid_class=VirtualClipGrid, steps=2000):
+    grid = grid_class(size=VIEWPORT)
+    grid.set_data(tracks)
+    allocated = grid.allocations
+
+    frames = []
+    for i in range(steps):
+        start = time.perf_counter()
+        # Diagonal sweep, a few pixels per frame like a finger drag
+        grid.scroll_to(x=(i * 7) % grid.max_scroll_x, y=(i * 3) % grid.max_scroll_y)
+        frames.append(time.perf_counter() - start)
+    frames.sort()
+    stats = grid.get_stats()
+    return {
+        "pool": stats["pool"],
+        "allocations_during_scroll": stats["allocations"] - allocated,
+        "mean_ms": sum(frames) / len(frames) * 1000,
+        "p99_ms": frames[int(len(frames) * 0.99)] * 1000,
+    }
+
+
+def bench_full_build(tracks):
+    """One widget per cell (previous ClipViewScreen layout)"""
+    start = time.perf_counter()
+    container = BoxLayout(orientation="horizontal")
+    for t, track in enumerate(tracks):
+        column = BoxLayout(orientation="vertical")
+        for s, clip in enumerate(track["clips"]):
+            column.add_widget(ClipSlot(track_index=t, scene_index=s, status=clip["status"]))
+        container.add_widget(column)
+    return (time.perf_counter() - start) * 1000, TRACKS * SCENES
+
+
+if __name__ == "__main__":
+    tracks = make_tracks()
+    for label, grid_class in (("widgets", VirtualClipGrid), ("canvas", ClipGridCanvas)):
+        result = bench_virtual(tracks, grid_class)
+        print(f"{label:8s} grid {TRACKS}x{SCENES}: pool {result['pool']} cells, "
+              f"{result['allocations_during_scroll']} allocations while scrolling, "
+              f"scroll frame mean {result['mean_ms']:.3f} ms  p99 {result['p99_ms']:.3f} ms")
+    build_ms, widgets = bench_full_build(tracks)
+    print(f"full build {TRACKS}x{SCENES}: {widgets} ClipSlots, {build_ms:.0f} ms to build")
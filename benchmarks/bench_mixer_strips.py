@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""Mixer screen-switch latency with 8, 32 and 128 tracks: the pooled
+MixerStrips row (reconcile + visible-only sync) vs clearing the row and
+building one TrackVolume per track on every on_enter, as before.
+
+    python benchmarks/bench_mixer_strips.py
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+os.environ.setdefault("KIVY_NO_ARGS", "1")
+os.environ.setdefault("KIVY_LOG_MODE", "PYTHON")
+
+from kivy.lang import Builder
+from kivy.metrics import dp
+from kivy.uix.boxlayout import BoxLayout
+from kivy.uix.scrollview import ScrollView
+
+from logic.state.app_state import AppState
+from ui.widgets.mixer_strips import MixerStrips
+from ui.widgets.track_volume import TrackVolume
+
+Builder.load_file(os.path.join(os.path.dirname(__file__), '..', 'ui', 'widgets', 'track_volume.kv'))
+
+TRACK_COUNTS = (8, 32, 128)
+SWITCHES = 5
+VIEWPORT = (800, 320)
+
+
+def make_state(count):
+    state = AppState()
+    state.init_project_from_live([f"Track {t + 1}" for t in range(count)])
+    return state
+
+
+def bench_rebuild(state, names):
+    """Previous _populate_mixers: clear and recreate every strip"""
+    container = BoxLayout(orientation="horizontal", size_hint_x=None)
+    times = []
+    for _ in range(SWITCHES):
+        start = time.perf_counter()
+        container.clear_widgets()
+        for index, name in enumerate(names):
+            mixer = TrackVolume(track_index=index, track_name=name, size_hint_x=None, width=dp(85))
+            track = state.m.tracks[index]
+            mixer.volume = track.volume
+            mixer.pan = track.pan
+            mixer.is_mute = track.mute
+            mixer.is_solo = track.solo
+            mixer.is_arm = track.arm
+            container.add_widget(mixer)
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def bench_pooled(state, names):
+    """MixerViewScreen._populate_mixers: reconcile, then sync visible strips"""
+    scroll = ScrollView(size=VIEWPORT, do_scroll_y=False)
+    strips = MixerStrips(size_hint_x=None, spacing=dp(3), padding=(dp(8), dp(10)))
+    scroll.add_widget(strips)
+    seen = 0
+    times = []
+    for switch in range(SWITCHES):
+        # Something changed while the user was on another screen
+        state.set_track_volume(switch % len(names), (switch % 10) / 10)
+        start = time.perf_counter()
+        strips.reconcile(names)
+        changes = state.changes_since(seen)
+        seen = changes.version
+        strips.mark_stale(None if changes.structure else changes.tracks)
+        strips.sync_visible(state)
+        times.append(time.perf_counter() - start)
+        if switch == 0:
+            strips.do_layout()
+            strips.width = strips.minimum_width
+    return times, strips.get_stats()
+
+
+def ms(values):
+    return sum(values) / len(values) * 1000
+
+
+if __name__ == "__main__":
+    for count in TRACK_COUNTS:
+        state = make_state(count)
+        names = [t.name for t in state.m.tracks.values()]
+        rebuild = bench_rebuild(state, names)
+        pooled, stats = bench_pooled(state, names)
+        print(f"{count:4d} tracks: rebuild {ms(rebuild):8.2f} ms/switch | "
+              f"pooled first {pooled[0] * 1000:8.2f} ms, then {ms(pooled[1:]):6.3f} ms/switch "
+              f"({stats['created']} strips created, {stats['synced']} syncs)")
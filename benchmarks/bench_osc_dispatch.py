@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""Per-message cost of the table-driven AbletonOSC dispatch loop.
+
+Feeds a full-sync burst (mixer values + clip statuses for a 64x16 set)
+through LiveIntegration's routes and reports microseconds per message.
+
+    python benchmarks/bench_osc_dispatch.py
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from logic.live_integration import LiveIntegration
+from logic.osc_routes import ROUTES
+from logic.state.app_state import AppState
+
+
+def run(tracks=64, scenes=16, rounds=5):
+    routes = {route.address: route for route in ROUTES}
+    state = AppState()
+    state.init_project(tracks=tracks, scenes=scenes)
+    live = LiveIntegration(state)
+
+    messages = []
+    for t in range(tracks):
+        messages.append(("/live/track/get/volume", (t, 0.7)))
+        messages.append(("/live/track/get/pan", (t, 0.0)))
+        messages.append(("/live/track/get/mute", (t, 0)))
+        for s in range(scenes):
+            messages.append(("/live/clip/get/name", (t, s, f"Clip {s}")))
+
+    best = None
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for address, args in messages:
+            live._enqueue_update(routes[address], address, *args)
+        live._drain_updates()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+
+    stats = live.get_dispatch_stats()
+    print(f"{len(messages)} messages per sync ({tracks}x{scenes})")
+    print(f"  decode+apply : {best * 1e6 / len(messages):6.1f} us/message (best of {rounds})")
+    print(f"  apply only   : {stats['us_per_message']:6.1f} us/message")
+    print(f"  drains       : {stats['drains']} ({stats['messages_per_drain']:.0f} messages each)")
+
+
+if __name__ == "__main__":
+    run()
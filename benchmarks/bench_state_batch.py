@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""Events emitted and wall time for a full 64x16 sync, with and without
+AppState.batch().
+
+    python benchmarks/bench_state_batch.py
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from logic.bus import bus
+from logic.state.app_state import AppState
+
+
+def sync(state, tracks, scenes):
+    for t in range(tracks):
+        state.set_track_volume(t, 0.5)
+        state.set_track_volume(t, 0.7)      # Live often reports a value twice
+        state.set_track_pan(t, 0.0)
+        state.set_track_mute(t, 0)
+        for s in range(scenes):
+            state.set_clip_name(t, s, f"Clip {s}")
+            state.set_clip_status(t, s, "playing" if s == 0 else "empty")
+
+
+def run(tracks=64, scenes=16, batched=False, field_topics=True, rounds=5):
+    emitted = []
+    original_emit = bus.emit
+    bus.emit = lambda topic, *a, **kw: emitted.append(topic) or original_emit(topic, *a, **kw)
+    try:
+        best = None
+        for _ in range(rounds):
+            state = AppState(use_grid_store=True)
+            state.init_project(tracks=tracks, scenes=scenes)
+            state.field_topics = field_topics
+            emitted.clear()
+            start = time.perf_counter()
+            if batched:
+                with state.batch():
+                    sync(state, tracks, scenes)
+            else:
+                sync(state, tracks, scenes)
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        return len(emitted), best
+    finally:
+        bus.emit = original_emit
+
+
+if __name__ == "__main__":
+    print("64x16 grid sync")
+    for label, kwargs in (("unbatched             ", {}),
+                          ("batch + field topics  ", {"batched": True}),
+                          ("batch, changeset only ", {"batched": True, "field_topics": False})):
+        events, best = run(**kwargs)
+        print(f"  {label}: {events:5d} events  {best * 1000:6.2f} ms")
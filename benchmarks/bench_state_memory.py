@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""Bytes per clip cell for large sets: legacy dict-backed dataclasses vs
+the slotted, interned, flyweight models, in both AppState modes (per-track
+clip dicts, and the NumPy grid store that main.py runs).
+
+    python benchmarks/bench_state_memory.py
+"""
+import os
+import sys
+import tracemalloc
+from dataclasses import dataclass, field
+from typing import Dict
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from logic.state.app_state import AppState
+from logic.state.models import ClipStatus, clip_slot
+
+PALETTE = [(1.0, 0.3, 0.3, 1.0), (0.0, 1.0, 0.5, 1.0), (0.0, 0.5, 1.0, 1.0), (1.0, 0.0, 1.0, 1.0)]
+
+
+# Pre-slots models, kept here only as the baseline
+@dataclass(frozen=True)
+class LegacyClip:
+    status: ClipStatus = ClipStatus.EMPTY
+    name: str = ""
+    color: tuple = (0.25, 0.25, 0.25, 1.0)
+
+
+@dataclass
+class LegacyTrack:
+    id: int
+    name: str
+    clips: Dict[int, LegacyClip] = field(default_factory=dict)
+
+
+def fill_ratio_clip(t, s):
+    """Deterministic ~25% filled set with palette colors"""
+    if (t * 7 + s) % 4:
+        return None
+    return (f"Clip {s}", tuple(PALETTE[t % len(PALETTE)]))
+
+
+def build_legacy(tracks, scenes):
+    result = {}
+    for t in range(tracks):
+        clips = {s: LegacyClip() for s in range(scenes)}
+        for s in range(scenes):
+            filled = fill_ratio_clip(t, s)
+            if filled:
+                # list(...) mimics a fresh tuple per OSC message
+                clips[s] = LegacyClip(ClipStatus.EMPTY, "".join(filled[0]), tuple(list(filled[1])))
+        result[t] = LegacyTrack(t, f"Track {t}", clips)
+    return result
+
+
+def build_current(tracks, scenes, use_grid_store=False):
+    state = AppState(use_grid_store=use_grid_store)
+    state.init_project(tracks=tracks, scenes=scenes)
+    for t in range(tracks):
+        clips = state.m.tracks[t].clips
+        for s in range(scenes):
+            filled = fill_ratio_clip(t, s)
+            if filled:
+                clip = clip_slot(ClipStatus.EMPTY, "".join(filled[0]), tuple(list(filled[1])))
+                if state.grid is not None:
+                    state.grid.set_clip(t, s, clip)
+                else:
+                    clips[s] = clip
+    return state
+
+
+def build_grid(tracks, scenes):
+    return build_current(tracks, scenes, use_grid_store=True)
+
+
+def measure(builder, tracks, scenes):
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    keep = builder(tracks, scenes)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del keep
+    return (after - before) / (tracks * scenes)
+
+
+if __name__ == "__main__":
+    for tracks, scenes in ((64, 16), (256, 64)):
+        legacy = measure(build_legacy, tracks, scenes)
+        current = measure(build_current, tracks, scenes)
+        grid = measure(build_grid, tracks, scenes)
+        print(f"{tracks}x{scenes}: legacy {legacy:6.1f} B/cell  "
+              f"slotted {current:6.1f} B/cell ({legacy / current:.1f}x smaller)  "
+              f"grid store {grid:6.1f} B/cell ({legacy / grid:.1f}x smaller)")
@@ -1,6 +1,7 @@
 # config/config.py
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Optional, Tuple
 
 @dataclass(frozen=True)
 class GraphicsConfig:
@@ -11,6 +12,8 @@ class GraphicsConfig:
     borderless: bool = True
     multisamples: int = 0
     maxfps: int = 60
+    idle_fps: int = 10        # Frame rate once the UI has been quiet for idle_after seconds
+    idle_after: float = 1.5
     fullscreen: bool = True  # Add fullscreen option
 
 @dataclass(frozen=True)
@@ -18,4 +21,8 @@ class AppConfig:
     """Main application configuration"""
     graphics: GraphicsConfig = GraphicsConfig()
     assets_path: Path = Path("assets")
+    snapshot_path: Path = Path.home() / ".push_controller" / "live_set.snapshot"
+    shared_state_name: Optional[str] = None  # Shared-memory mirror for hardware processes
+    demo_size: Optional[Tuple[int, int]] = None  # Synthetic (tracks, scenes) offline set, e.g. (128, 32)
+    clip_grid_mode: str = "widgets"  # "widgets" (pooled ClipSlots) | "canvas" (single canvas)
     debug: bool = False
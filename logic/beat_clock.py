@@ -0,0 +1,148 @@
+# logic/beat_clock.py
+import time
+import logging
+from collections import deque
+from typing import Callable, Deque, Dict, List, Optional, Tuple
+
+
+class BeatClock:
+    """Local song-position clock extrapolated from sparse Live samples
+
+    Live only reports ``current_song_time`` when asked, so instead of polling
+    at display rate we keep a local linear model ``beat = origin + rate * t``.
+    Each sample nudges the phase (PLL-style) and a least-squares fit over the
+    recent samples corrects the rate for clock skew between the two machines.
+    """
+
+    def __init__(self, window: int = 8, phase_gain: float = 0.5,
+                 max_skew: float = 0.01, resync_beats: float = 0.5,
+                 time_fn: Callable[[], float] = time.monotonic):
+        self.logger = logging.getLogger(__name__)
+        self.time_fn = time_fn
+
+        self.window = window
+        self.phase_gain = phase_gain      # Fraction of phase error corrected per sample
+        self.max_skew = max_skew          # Max rate deviation from tempo (1%)
+        self.resync_beats = resync_beats  # Larger errors are jumps (locate/loop), not drift
+
+        self.tempo = 120.0
+        self.playing = False
+
+        # Model: beat_at(t) = origin_beat + (t - origin_time) * rate
+        self._origin_time = time_fn()
+        self._origin_beat = 0.0
+        self._rate = self.tempo / 60.0
+        self._samples: Deque[Tuple[float, float]] = deque(maxlen=window)
+
+        # Called (no args) when the beat -> time mapping jumps: tempo, transport, resync
+        self._listeners: List[Callable[[], None]] = []
+
+        # Statistics
+        self.samples_received = 0
+        self.resyncs = 0
+        self.last_error = 0.0
+
+    # === QUERIES ===
+
+    def beat_at(self, t: Optional[float] = None) -> float:
+        """Extrapolated song position in beats at monotonic time ``t``"""
+        if not self.playing:
+            return self._origin_beat
+        if t is None:
+            t = self.time_fn()
+        return self._origin_beat + (t - self._origin_time) * self._rate
+
+    def time_of_beat(self, beat: float) -> Optional[float]:
+        """Monotonic time at which ``beat`` will be reached (None if stopped)"""
+        if not self.playing or self._rate <= 0:
+            return None
+        return self._origin_time + (beat - self._origin_beat) / self._rate
+
+    @property
+    def beats_per_second(self) -> float:
+        return self._rate
+
+    def add_listener(self, callback: Callable[[], None]):
+        """Re-plan beat-based schedules when tempo, transport or position jumps"""
+        self._listeners.append(callback)
+
+    def _notify(self):
+        for callback in list(self._listeners):
+            callback()
+
+    # === SAMPLES FROM LIVE ===
+
+    def set_tempo(self, bpm: float, t: Optional[float] = None):
+        """Tempo changed: re-anchor so the position stays continuous"""
+        if bpm <= 0:
+            return
+        t = self.time_fn() if t is None else t
+        self._reanchor(t, self.beat_at(t))
+        self.tempo = bpm
+        self._rate = bpm / 60.0
+        self._samples.clear()  # Old samples belong to the old rate
+        self._notify()
+
+    def set_playing(self, playing: bool, t: Optional[float] = None):
+        t = self.time_fn() if t is None else t
+        beat = self.beat_at(t)
+        self.playing = bool(playing)
+        self._reanchor(t, beat)
+        self._samples.clear()
+        self._notify()
+
+    def add_sample(self, beat: float, t: Optional[float] = None):
+        """Feed a ``current_song_time`` reply received at monotonic time ``t``"""
+        t = self.time_fn() if t is None else t
+        self.samples_received += 1
+
+        if not self.playing:
+            self._reanchor(t, beat)
+            return
+
+        error = beat - self.beat_at(t)
+        self.last_error = error
+
+        if abs(error) > self.resync_beats:
+            # Transport jumped (loop, locate, restart): hard resync
+            self.resyncs += 1
+            self._samples.clear()
+            self._samples.append((t, beat))
+            self._rate = self.tempo / 60.0
+            self._reanchor(t, beat)
+            self._notify()
+            return
+
+        self._samples.append((t, beat))
+        self._fit_rate()
+        self._reanchor(t, self.beat_at(t) + self.phase_gain * error)
+
+    def _reanchor(self, t: float, beat: float):
+        self._origin_time = t
+        self._origin_beat = beat
+
+    def _fit_rate(self):
+        """Least-squares slope over the sample window, clamped around tempo"""
+        n = len(self._samples)
+        if n < 3:
+            return
+        mean_t = sum(s[0] for s in self._samples) / n
+        mean_b = sum(s[1] for s in self._samples) / n
+        var = sum((s[0] - mean_t) ** 2 for s in self._samples)
+        if var <= 0:
+            return
+        cov = sum((s[0] - mean_t) * (s[1] - mean_b) for s in self._samples)
+        nominal = self.tempo / 60.0
+        slope = cov / var
+        self._rate = max(nominal * (1 - self.max_skew), min(nominal * (1 + self.max_skew), slope))
+
+    def get_stats(self) -> Dict[str, float]:
+        return {
+            "samples": self.samples_received,
+            "resyncs": self.resyncs,
+            "last_error_beats": self.last_error,
+            "rate": self._rate,
+        }
+
+# Global instance
+beat_clock = BeatClock()
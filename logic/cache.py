@@ -0,0 +1,261 @@
+# logic/cache.py
+"""Bounded LRU + TTL cache with a memory budget shared between caches.
+
+Every cache is capped by entry count, optionally expires entries after a
+TTL (swept actively on writes, not only on reads), supports invalidating
+whole ``(track, scene, ...)`` key prefixes when Live's structure changes,
+and charges an estimated byte size to a shared ``CacheBudget``. When the
+budget is exceeded the globally least-recently-used entry is evicted,
+whichever cache owns it.
+"""
+import itertools
+import logging
+import sys
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+_MISSING = object()
+
+
+def estimate_size(value: Any, depth: int = 3) -> int:
+    """Approximate retained bytes of plain dict/list/tuple/str data"""
+    size = sys.getsizeof(value)
+    if depth <= 0:
+        return size
+    if isinstance(value, dict):
+        size += sum(estimate_size(k, depth - 1) + estimate_size(v, depth - 1)
+                    for k, v in value.items())
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        size += sum(estimate_size(v, depth - 1) for v in value)
+    return size
+
+
+class CacheBudget:
+    """Byte budget shared by several BoundedCaches"""
+
+    def __init__(self, max_bytes: int = 8 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.used_bytes = 0
+        self.lock = threading.RLock()  # One lock for every cache on this budget
+        self._caches: List["BoundedCache"] = []
+        self._tick = itertools.count()
+
+    def register(self, cache: "BoundedCache"):
+        self._caches.append(cache)
+
+    def next_tick(self) -> int:
+        return next(self._tick)
+
+    def enforce(self):
+        """Evict globally-oldest entries until back under budget"""
+        while self.used_bytes > self.max_bytes:
+            oldest = None
+            for cache in self._caches:
+                tick = cache._oldest_tick()
+                if tick is not None and (oldest is None or tick < oldest[0]):
+                    oldest = (tick, cache)
+            if oldest is None:
+                return
+            oldest[1]._evict_oldest("budget")
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "max_bytes": self.max_bytes,
+            "used_bytes": self.used_bytes,
+            "caches": {cache.name: cache.get_stats() for cache in self._caches},
+        }
+
+
+class BoundedCache:
+    """LRU cache with entry bound, optional TTL and prefix invalidation"""
+
+    def __init__(self, name: str, max_entries: int = 1024, ttl: Optional[float] = None,
+                 budget: Optional[CacheBudget] = None,
+                 size_fn: Callable[[Any], int] = estimate_size,
+                 on_evict: Optional[Callable[[Hashable, Any, str], None]] = None,
+                 time_fn: Callable[[], float] = time.monotonic):
+        self.name = name
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.budget = budget
+        self.size_fn = size_fn
+        self.on_evict = on_evict  # on_evict(key, value, reason)
+        self.time_fn = time_fn
+        self.logger = logging.getLogger(__name__)
+
+        # key -> [value, expires_at, size, tick]
+        self._entries: "OrderedDict[Hashable, list]" = OrderedDict()
+        self._lock = budget.lock if budget else threading.RLock()
+        self._own_tick = itertools.count()
+        self._next_sweep = 0.0
+        if budget:
+            budget.register(self)
+
+        # Statistics
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key) -> bool:
+        entry = self._entries.get(key)
+        return entry is not None and not self._expired(entry, self.time_fn())
+
+    def _tick(self) -> int:
+        return self.budget.next_tick() if self.budget else next(self._own_tick)
+
+    def _expired(self, entry: list, now: float) -> bool:
+        return entry[1] is not None and entry[1] <= now
+
+    # === READS ===
+
+    def get(self, key, default=None):
+        """Value for ``key`` (counts hit/miss and refreshes LRU position)"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self._expired(entry, self.time_fn()):
+                self._remove(key, "expired")
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return default
+            self.hits += 1
+            entry[3] = self._tick()
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def peek(self, key, default=None):
+        """Value without touching LRU order or statistics"""
+        entry = self._entries.get(key)
+        if entry is None or self._expired(entry, self.time_fn()):
+            return default
+        return entry[0]
+
+    def get_or_compute(self, key, compute: Callable[[], Any]):
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            value = compute()
+            self.put(key, value)
+        return value
+
+    def items(self) -> List[Tuple[Hashable, Any]]:
+        now = self.time_fn()
+        with self._lock:
+            return [(k, e[0]) for k, e in self._entries.items() if not self._expired(e, now)]
+
+    # === WRITES ===
+
+    def put(self, key, value, ttl: Optional[float] = _MISSING):
+        """Insert/replace; evicts LRU entries past the entry or byte bound"""
+        ttl = self.ttl if ttl is _MISSING else ttl
+        now = self.time_fn()
+        size = self.size_fn(value) if self.budget else 0
+        with self._lock:
+            if key in self._entries:
+                self._remove(key, None)
+            self._entries[key] = [value, None if ttl is None else now + ttl, size, self._tick()]
+            if self.budget:
+                self.budget.used_bytes += size
+
+            if self.ttl is not None and now >= self._next_sweep:
+                self.purge_expired()
+            while len(self._entries) > self.max_entries:
+                self._evict_oldest("size")
+            if self.budget:
+                self.budget.enforce()
+
+    def resize(self, key):
+        """Re-measure an entry that was mutated in place"""
+        if not self.budget:
+            return
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                size = self.size_fn(entry[0])
+                self.budget.used_bytes += size - entry[2]
+                entry[2] = size
+                self.budget.enforce()
+
+    def invalidate(self, key) -> bool:
+        with self._lock:
+            if key not in self._entries:
+                return False
+            self._remove(key, "invalidated")
+            return True
+
+    def invalidate_prefix(self, prefix: tuple) -> int:
+        """Drop every tuple key starting with ``prefix`` (e.g. ``(track,)``)"""
+        n = len(prefix)
+        with self._lock:
+            keys = [k for k in self._entries if isinstance(k, tuple) and k[:n] == prefix]
+            for key in keys:
+                self._remove(key, "invalidated")
+        return len(keys)
+
+    def purge_expired(self) -> int:
+        """Active TTL sweep"""
+        now = self.time_fn()
+        with self._lock:
+            keys = [k for k, e in self._entries.items() if self._expired(e, now)]
+            for key in keys:
+                self._remove(key, "expired")
+            if self.ttl is not None:
+                self._next_sweep = now + self.ttl / 4
+        return len(keys)
+
+    def clear(self):
+        with self._lock:
+            for key in list(self._entries):
+                self._remove(key, "invalidated")
+
+    # === INTERNALS (lock held) ===
+
+    def _oldest_tick(self) -> Optional[int]:
+        if not self._entries:
+            return None
+        return next(iter(self._entries.values()))[3]
+
+    def _evict_oldest(self, reason: str):
+        key = next(iter(self._entries))
+        self._remove(key, reason)
+
+    def _remove(self, key, reason: Optional[str]):
+        value, _, size, _ = self._entries.pop(key)
+        if self.budget:
+            self.budget.used_bytes -= size
+        if reason is None:
+            return  # Replaced by put()
+        if reason == "expired":
+            self.expirations += 1
+        elif reason == "invalidated":
+            self.invalidations += 1
+        else:
+            self.evictions += 1
+        if self.on_evict:
+            try:
+                self.on_evict(key, value, reason)
+            except Exception as e:
+                self.logger.error(f"Cache {self.name} eviction callback failed: {e}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "bytes": sum(e[2] for e in self._entries.values()),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "invalidations": self.invalidations,
+        }
+
+
+# One memory budget for all UI-side caches
+cache_budget = CacheBudget()
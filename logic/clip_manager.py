@@ -1,68 +1,225 @@
-from typing import Dict
+from typing import Dict, List, Mapping, Optional, Tuple
 from logic.bus import bus
+from logic.beat_clock import BeatClock, beat_clock
+from logic.state.models import ClipStatus
 from kivy.clock import Clock
+import heapq
+import itertools
 import logging
+import math
+import time
+
+# AbletonOSC clip_trigger_quantization index -> launch grid in beats (4/4)
+LAUNCH_QUANTIZATION_BEATS = {
+    0: 0.0,          # None
+    1: 32.0,         # 8 Bars
+    2: 16.0,         # 4 Bars
+    3: 8.0,          # 2 Bars
+    4: 4.0,          # 1 Bar
+    5: 2.0,          # 1/2
+    6: 4.0 / 3,      # 1/2T
+    7: 1.0,          # 1/4
+    8: 2.0 / 3,      # 1/4T
+    9: 0.5,          # 1/8
+    10: 1.0 / 3,     # 1/8T
+    11: 0.25,        # 1/16
+    12: 1.0 / 6,     # 1/16T
+    13: 0.125,       # 1/32
+}
+
+IMMEDIATE = float("-inf")  # Launch target of unquantized / stopped-transport triggers
 
 class ClipManager:
     """Manages clip triggering logic and track exclusivity"""
-    
-    def __init__(self, app_state):
+
+    def __init__(self, app_state, clock: BeatClock = beat_clock, time_fn=time.monotonic):
         self.app_state = app_state
-        self.playing_clips: Dict[int, int] = {}  # {track_id: scene_id}
+        self.clock = clock
+        self.time_fn = time_fn
         self.logger = logging.getLogger(__name__)
+
+        # Global launch quantization (Live default: 1 bar)
+        self.launch_quantization = 4
+
+        # Pending launches: one beat-ordered heap serviced by one timer.
+        # Entries are (target_beat, seq, track, scene); IMMEDIATE fires on the
+        # next service. Cancelled entries are skipped lazily when they reach
+        # the top. Wall times are derived from the beat clock on every
+        # reschedule, so tempo changes and resyncs move pending launches too.
+        self._launch_heap: List[Tuple[float, int, int, int]] = []
+        self._pending: Dict[int, Tuple[int, int, float]] = {}  # track -> (seq, scene, target_beat)
+        self._seq = itertools.count()
+        self._timer = None
+        self.last_prediction_error = 0.0  # seconds, Live actual - predicted
+
+        self.clock.add_listener(self._reschedule)
         self._setup_event_handlers()
-    
+
+    @property
+    def playing_clips(self) -> Mapping[int, int]:
+        """{track_id: scene_id} derived from AppState (shared selector cache)"""
+        return self.app_state.selectors.get("playing_clips")
+
+    def _stop_other_clips(self, track_id: int, scene_id: int):
+        """Track exclusivity: clear any other clip marked playing on the track"""
+        for other, clip in self.app_state.m.tracks[track_id].clips.items():
+            if other != scene_id and clip.status is ClipStatus.PLAYING:
+                self.app_state.set_clip_status(track_id, other, "empty")
+
     def _setup_event_handlers(self):
         """Setup event bus handlers"""
         bus.on("clip:trigger", self.handle_clip_trigger)
         bus.on("track:stop", self.handle_track_stop)  # This method needs to exist
-    
+        bus.on("live:clip_status", self.handle_live_clip_status)
+        bus.on("live:launch_quantization", self.handle_launch_quantization)
+
     def handle_clip_trigger(self, **kwargs):
         """Handle clip trigger events with track exclusivity"""
         track = kwargs['track']
         scene = kwargs['scene']
         current_status = kwargs.get('current_status', 'empty')
-        
+
         # If clip is playing, stop the track
         if current_status == "playing":
             self.stop_track(track)
         else:
             # Stop current clip on track and start new one
             self.trigger_clip(track, scene)
-    
+
     def handle_track_stop(self, **kwargs):
         """Handle track stop events - ADD THIS METHOD"""
         track_id = kwargs.get('track', -1)
         if track_id >= 0:
             self.stop_track(track_id)
-    
+
+    def handle_launch_quantization(self, **kwargs):
+        """Global clip trigger quantization changed in Live"""
+        value = kwargs.get('value', 4)
+        if value in LAUNCH_QUANTIZATION_BEATS:
+            self.launch_quantization = value
+
+    def next_launch_beat(self, now: Optional[float] = None) -> float:
+        """Beat of the next launch quantization boundary (IMMEDIATE if none)"""
+        now = self.time_fn() if now is None else now
+        grid = LAUNCH_QUANTIZATION_BEATS.get(self.launch_quantization, 4.0)
+        if grid <= 0 or not self.clock.playing:
+            return IMMEDIATE  # No quantization / transport stopped: Live launches immediately
+
+        beat = self.clock.beat_at(now)
+        return (math.floor(beat / grid + 1e-9) + 1) * grid
+
+    def next_launch_time(self, now: Optional[float] = None) -> float:
+        """Monotonic time of the next launch quantization boundary"""
+        now = self.time_fn() if now is None else now
+        fire_time = self._fire_time(self.next_launch_beat(now), now)
+        return now if fire_time is None else fire_time
+
+    def _fire_time(self, beat: float, now: float) -> Optional[float]:
+        """Current wall time of a target beat (None while the transport is stopped)"""
+        if beat == IMMEDIATE:
+            return now
+        return self.clock.time_of_beat(beat)
+
     def trigger_clip(self, track_id: int, scene_id: int):
         """Handle track exclusivity logic"""
-        # Stop current clip if exists
-        if track_id in self.playing_clips:
-            old_scene = self.playing_clips[track_id]
-            self.app_state.set_clip_status(track_id, old_scene, "empty")
-        
-        # Queue new clip
+        # Re-trigger on the same track replaces the pending launch
+        self.cancel_launch(track_id)
+
+        # Queue new clip; the old one keeps playing until the boundary
         self.app_state.set_clip_status(track_id, scene_id, "queued")
-        
-        # Simulate quantization (later: real quantization)
-        Clock.schedule_once(
-            lambda dt: self._start_clip(track_id, scene_id),
-            0.5  # Fake quantization delay
-        )
-    
+
+        target_beat = self.next_launch_beat()
+        seq = next(self._seq)
+        heapq.heappush(self._launch_heap, (target_beat, seq, track_id, scene_id))
+        self._pending[track_id] = (seq, scene_id, target_beat)
+        self._reschedule()
+
+    def cancel_launch(self, track_id: int) -> bool:
+        """Cancel a pending launch on a track (lazy heap deletion)"""
+        pending = self._pending.pop(track_id, None)
+        if pending is None:
+            return False
+        _, scene_id, _ = pending
+        if self.playing_clips.get(track_id) != scene_id:
+            self.app_state.set_clip_status(track_id, scene_id, "empty")
+        self._reschedule()
+        return True
+
+    def _reschedule(self):
+        """Point the single timer at the earliest live heap entry.
+
+        Also the beat clock listener: the entry's wall time is recomputed, so
+        tempo changes and resyncs re-plan it. While the transport is stopped
+        quantized launches are held until it restarts (or Live reports them).
+        """
+        heap = self._launch_heap
+        while heap and self._pending.get(heap[0][2], (None,))[0] != heap[0][1]:
+            heapq.heappop(heap)
+
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if heap:
+            now = self.time_fn()
+            fire_time = self._fire_time(heap[0][0], now)
+            if fire_time is not None:
+                self._timer = Clock.schedule_once(self._service_launches, max(0.0, fire_time - now))
+
+    def _service_launches(self, dt=0):
+        """Fire every launch whose boundary has been reached"""
+        self._timer = None
+        now = self.time_fn()
+        heap = self._launch_heap
+        while heap:
+            fire_time = self._fire_time(heap[0][0], now)
+            if fire_time is None or fire_time > now + 0.001:
+                break
+            _, seq, track_id, scene_id = heapq.heappop(heap)
+            pending = self._pending.get(track_id)
+            if pending and pending[0] == seq:
+                del self._pending[track_id]
+                self._start_clip(track_id, scene_id)
+        self._reschedule()
+
     def _start_clip(self, track_id: int, scene_id: int):
         """Start clip after quantization"""
+        self._stop_other_clips(track_id, scene_id)
         self.app_state.set_clip_status(track_id, scene_id, "playing")
-        self.playing_clips[track_id] = scene_id
         self.logger.debug(f"Started clip {scene_id} on track {track_id}")
-    
+
+    def handle_live_clip_status(self, **kwargs):
+        """Reconcile predicted launches with Live's playing_status"""
+        track_id = kwargs.get('track', -1)
+        scene_id = kwargs.get('scene', -1)
+        status = kwargs.get('status', 'empty')
+        pending = self._pending.get(track_id)
+
+        if status == "playing":
+            if pending and pending[1] == scene_id:
+                now = self.time_fn()
+                predicted = self._fire_time(pending[2], now)
+                if predicted is not None:
+                    self.last_prediction_error = now - predicted
+            if pending:
+                # Live is the truth: whatever we predicted for this track is settled
+                del self._pending[track_id]
+                self._reschedule()
+            if track_id in self.app_state.m.tracks:
+                self._stop_other_clips(track_id, scene_id)
+                if self.playing_clips.get(track_id) != scene_id:
+                    self.app_state.set_clip_status(track_id, scene_id, "playing")
+        elif status == "queued":
+            return  # Live confirms the prediction
+        else:
+            if pending and pending[1] == scene_id:
+                # Launch was cancelled on Live's side
+                del self._pending[track_id]
+                self._reschedule()
+
     def stop_track(self, track_id: int):
         """Stop all clips on a track"""
-        if track_id in self.playing_clips:
-            scene_id = self.playing_clips[track_id]
+        self.cancel_launch(track_id)
+        scene_id = self.playing_clips.get(track_id)
+        if scene_id is not None:
             self.app_state.set_clip_status(track_id, scene_id, "empty")
-            del self.playing_clips[track_id]
             self.logger.debug(f"Stopped track {track_id}")
-
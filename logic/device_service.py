@@ -0,0 +1,281 @@
+# logic/device_service.py
+import logging
+import time
+from typing import Dict, List, Optional, Tuple
+
+from kivy.clock import Clock
+
+from .bus import bus
+from .cache import BoundedCache, CacheBudget, cache_budget
+
+PARAMS_PER_PAGE = 8  # One page per 8 encoders
+METADATA_RETRY = 2.0  # Seconds before an unanswered metadata request is re-sent
+
+PageKey = Tuple[int, int, int]  # (track, device, page)
+
+
+class DeviceDataService:
+    """Lazy, paged device parameter data on top of AbletonOSC
+
+    Only the page shown on the encoders (plus its neighbours) is fetched.
+    Static metadata (names, ranges) is fetched once per device; values are
+    fetched per page and kept fresh by parameter listeners.
+    """
+
+    def __init__(self, app_state=None, max_pages: int = 64, prefetch: int = 1,
+                 budget: Optional[CacheBudget] = cache_budget, time_fn=time.monotonic):
+        self.app_state = app_state
+        self.osc_client = None
+        self.logger = logging.getLogger(__name__)
+
+        # LRU of parameter pages: (track, device, page) -> list of param dicts
+        self.max_pages = max_pages
+        self.prefetch = prefetch
+        self._pages = BoundedCache("device_pages", max_entries=max_pages, budget=budget,
+                                   on_evict=self._on_page_evicted)
+        self._lock = self._pages._lock  # Share the cache lock (OSC thread + UI thread)
+        self._pending: Dict[PageKey, int] = {}
+
+        # Per-track / per-device metadata
+        self._devices: Dict[int, List[str]] = {}
+        self._param_counts: Dict[Tuple[int, int], int] = {}
+        self._param_meta: Dict[Tuple[int, int], Dict[str, list]] = {}
+        self._meta_requested: Dict[Tuple[int, int], float] = {}  # In flight -> sent at
+        self._time = time_fn
+
+    def attach(self, osc_client):
+        """Register AbletonOSC response handlers on a connected client"""
+        self.osc_client = osc_client
+        osc_client.register_handler("/live/track/get/devices/name", self._handle_device_names)
+        osc_client.register_handler("/live/device/get/num_parameters", self._handle_num_parameters)
+        osc_client.register_handler("/live/device/get/parameters/name", self._handle_param_meta)
+        osc_client.register_handler("/live/device/get/parameters/min", self._handle_param_meta)
+        osc_client.register_handler("/live/device/get/parameters/max", self._handle_param_meta)
+        osc_client.register_handler("/live/device/get/parameter/value", self._handle_param_value)
+        osc_client.register_handler("/live/device/get/parameter/value_string", self._handle_param_value_string)
+
+    def clear(self):
+        """Drop everything (e.g. after a structure change in Live)"""
+        with self._lock:
+            self._pages.clear()  # Stops listeners through _on_page_evicted
+            self._pending.clear()
+            self._devices.clear()
+            self._param_counts.clear()
+            self._param_meta.clear()
+            self._meta_requested.clear()
+
+    def invalidate_track(self, track: int):
+        """Drop every cached page of a track (devices changed)"""
+        with self._lock:
+            self._pages.invalidate_prefix((track,))
+            self._devices.pop(track, None)
+            for key in [k for k in self._param_counts if k[0] == track]:
+                del self._param_counts[key]
+                self._param_meta.pop(key, None)
+            for key in [k for k in self._meta_requested if k[0] == track]:
+                del self._meta_requested[key]
+
+    # === QUERIES (UI thread) ===
+
+    def devices(self, track: int) -> Optional[List[str]]:
+        """Device names for a track, requesting them if unknown"""
+        names = self._devices.get(track)
+        if names is None:
+            self.request_devices(track)
+        return names
+
+    def page_count(self, track: int, device: int) -> int:
+        count = self._param_counts.get((track, device))
+        if count is None:
+            return 1
+        return max(1, (count + PARAMS_PER_PAGE - 1) // PARAMS_PER_PAGE)
+
+    def get_page(self, track: int, device: int, page: int) -> Optional[List[Dict]]:
+        """Return a cached page (0-based) and prefetch its neighbours
+
+        Never blocks: returns None on a miss and the page arrives later
+        through a ``live:device_page`` event.
+        """
+        key = (track, device, page)
+        params = self._pages.get(key)
+
+        if (track, device) not in self._param_counts:
+            self._request_metadata(track, device)
+        else:
+            self._ensure_page(key)
+
+        for offset in range(1, self.prefetch + 1):
+            for neighbour in (page - offset, page + offset):
+                if 0 <= neighbour < self.page_count(track, device):
+                    self._ensure_page((track, device, neighbour))
+
+        return params
+
+    def set_value(self, track: int, device: int, param: int, value: float):
+        """Optimistically update a cached value and send it to Live"""
+        key = (track, device, param // PARAMS_PER_PAGE)
+        with self._lock:
+            params = self._pages.peek(key)
+            if params is not None:
+                params[param % PARAMS_PER_PAGE]["value"] = value
+        if self.osc_client:
+            self.osc_client.set_device_parameter(track, device, param, value)
+            self.osc_client.get_device_parameter_value_string(track, device, param)
+
+    # === REQUESTS ===
+
+    def request_devices(self, track: int):
+        if self.osc_client:
+            self.osc_client.get_track_devices(track)
+
+    def _request_metadata(self, track: int, device: int):
+        """Request count, names and ranges; re-sent if unanswered after METADATA_RETRY"""
+        now = self._time()
+        sent = self._meta_requested.get((track, device))
+        if not self.osc_client or (sent is not None and now - sent < METADATA_RETRY):
+            return
+        self._meta_requested[(track, device)] = now
+        self.osc_client.get_device_num_parameters(track, device)
+        self.osc_client.get_device_parameters(track, device)
+        self.osc_client.get_device_parameter_ranges(track, device)
+
+    def _ensure_page(self, key: PageKey):
+        """Fetch a page's values if not cached or already in flight"""
+        track, device, page = key
+        count = self._param_counts.get((track, device))
+        if count is None or not self.osc_client:
+            return
+
+        start = page * PARAMS_PER_PAGE
+        end = min(start + PARAMS_PER_PAGE, count)
+        if start >= end:
+            return
+
+        with self._lock:
+            if key in self._pages or key in self._pending:
+                return
+            meta = self._param_meta.get((track, device), {})
+            self._pending[key] = 2 * (end - start)  # value + value_string each
+            self._pages.put(key, [self._blank_param(i, meta) for i in range(start, end)])
+
+        for param in range(start, end):
+            self.osc_client.get_device_parameter_value(track, device, param)
+            self.osc_client.get_device_parameter_value_string(track, device, param)
+            self.osc_client.start_listen_device_parameter(track, device, param)
+
+    def _on_page_evicted(self, key: PageKey, params: List[Dict], reason: str):
+        self._pending.pop(key, None)
+        self._stop_listening(key)
+
+    def _stop_listening(self, key: PageKey):
+        if not self.osc_client:
+            return
+        track, device, page = key
+        start = page * PARAMS_PER_PAGE
+        count = self._param_counts.get((track, device), start + PARAMS_PER_PAGE)
+        for param in range(start, min(start + PARAMS_PER_PAGE, count)):
+            self.osc_client.stop_listen_device_parameter(track, device, param)
+
+    @staticmethod
+    def _blank_param(index: int, meta: Dict[str, list]) -> Dict:
+        names = meta.get("name", [])
+        mins = meta.get("min", [])
+        maxs = meta.get("max", [])
+        return {
+            "index": index,
+            "name": names[index] if index < len(names) else f"Param {index + 1}",
+            "value": None,
+            "display": "",
+            "min": mins[index] if index < len(mins) else 0.0,
+            "max": maxs[index] if index < len(maxs) else 1.0,
+        }
+
+    # === OSC HANDLERS (server thread) ===
+
+    def _handle_device_names(self, address: str, *args):
+        if len(args) < 1:
+            return
+        track = int(args[0])
+        names = [str(n) for n in args[1:]]
+        old = self._devices.get(track)
+        if old is not None and old != names:
+            self.invalidate_track(track)  # Device chain changed: cached pages are stale
+        self._devices[track] = names
+        if self.app_state:
+            # AppState is only written on the UI thread
+            Clock.schedule_once(lambda dt: self.app_state.set_track_devices(track, names), 0)
+        bus.emit("live:devices", track=track, devices=names)
+
+    def _handle_num_parameters(self, address: str, *args):
+        if len(args) < 3:
+            return
+        track, device, count = int(args[0]), int(args[1]), int(args[2])
+        self._param_counts[(track, device)] = count
+        self._meta_requested.pop((track, device), None)
+        bus.emit("live:device_info", track=track, device=device,
+                 pages=self.page_count(track, device))
+
+    def _handle_param_meta(self, address: str, *args):
+        if len(args) < 2:
+            return
+        track, device = int(args[0]), int(args[1])
+        field = address.rsplit("/", 1)[-1]  # name | min | max
+        values = list(args[2:])
+        with self._lock:
+            self._param_meta.setdefault((track, device), {})[field] = values
+            # Fill metadata into pages that were created before it arrived
+            for key, params in self._pages.items():
+                if key[:2] == (track, device):
+                    for param in params:
+                        if param["index"] < len(values):
+                            param[field] = values[param["index"]]
+                    self._pages.resize(key)  # Names change the page size in the budget
+
+    def _handle_param_value(self, address: str, *args):
+        """Response to a page fetch, or a listener push for a visible param"""
+        if len(args) < 4:
+            return
+        track, device, param = int(args[0]), int(args[1]), int(args[2])
+        self._update_param((track, device, param), "value", float(args[3]))
+
+    def _handle_param_value_string(self, address: str, *args):
+        if len(args) < 4:
+            return
+        track, device, param = int(args[0]), int(args[1]), int(args[2])
+        self._update_param((track, device, param), "display", str(args[3]))
+
+    def _update_param(self, ident: Tuple[int, int, int], field: str, value):
+        track, device, param = ident
+        key = (track, device, param // PARAMS_PER_PAGE)
+        listener_push = False
+        with self._lock:
+            params = self._pages.peek(key)
+            if params is None:
+                return  # Page was evicted, nothing to refresh
+            params[param % PARAMS_PER_PAGE][field] = value
+            pending = self._pending.get(key)
+            if pending is None:
+                listener_push = True
+            elif pending <= 1:
+                del self._pending[key]
+            else:
+                self._pending[key] = pending - 1
+                return
+            # Page complete (or a pushed display string): re-measure for the shared budget
+            if pending is not None or field == "display":
+                self._pages.resize(key)
+
+        # A listener value push invalidates the display text
+        if listener_push and field == "value" and self.osc_client:
+            self.osc_client.get_device_parameter_value_string(track, device, param)
+
+        bus.emit("live:device_page", track=track, device=device, page=key[2])
+
+    def get_stats(self) -> Dict[str, int]:
+        stats = self._pages.get_stats()
+        return {
+            "pages": stats["entries"],
+            "hits": stats["hits"],
+            "misses": stats["misses"],
+            "evictions": stats["evictions"],
+        }
@@ -1,18 +1,43 @@
-from typing import Optional
+from collections import deque
+from contextlib import nullcontext
+from functools import partial
+from typing import Deque, Optional, Tuple
 import logging
+import time
+from kivy.clock import Clock
 from .osc_client import OSCClient
 from .bus import bus
 from .performance_optimizer import performance_optimizer
+from .device_service import DeviceDataService
+from .beat_clock import beat_clock
+from .state.snapshot import SnapshotStore, set_fingerprint
+from .osc_routes import ROUTES, OSCRoute, Update, convert_live_color
 
 class LiveIntegration:
     """Integrates OSC communication with the application event bus"""
     
-    def __init__(self, app_state=None):
+    def __init__(self, app_state=None, snapshot_store: Optional[SnapshotStore] = None):
         self.app_state = app_state
         self.osc_client: Optional[OSCClient] = None
         self.logger = logging.getLogger(__name__)
         self.is_syncing = False
         self.polling_enabled = True  # NUEVO
+        self.song_time_interval = 2.0  # Sparse song-time samples for the beat clock
+        
+        # Warm start: last-synced set persisted between launches
+        self.snapshot_store = snapshot_store
+        self.set_fingerprint: Optional[str] = None
+        self.snapshot_loaded = False
+        self._snapshot_unverified = False
+        
+        # Paged device parameter data (lazy, LRU cached)
+        self.devices = DeviceDataService(app_state)
+        
+        # Incoming table-driven updates, drained once per frame on the UI thread
+        self._inbox: Deque[Tuple[OSCRoute, Update, float]] = deque()
+        self._drain_scheduled = False
+        self.dispatch_stats = {"messages": 0, "drains": 0, "dropped": 0, "errors": 0,
+                               "total_ms": 0.0}
         
         self._setup_bus_listeners()
     
@@ -39,6 +64,10 @@ class LiveIntegration:
         bus.on("mixer:pan", self._on_mixer_pan)
         bus.on("mixer:mute", self._on_mixer_mute)
         bus.on("mixer:solo", self._on_mixer_solo)
+        
+        # Undo/redo of journaled user edits
+        bus.on("edit:undo", lambda **kw: self.undo())
+        bus.on("edit:redo", lambda **kw: self.redo())
     
     def connect(self, host: str = "192.168.80.33", send_port: int = 11000, 
                 receive_port: int = 11001) -> bool:
@@ -71,6 +100,7 @@ class LiveIntegration:
     def disconnect(self):
         """Disconnect from Live"""
         self.polling_enabled = False  # Stop polling
+        self.save_snapshot()
         if self.osc_client:
             self.osc_client.disconnect()
             self.osc_client = None
@@ -81,23 +111,9 @@ class LiveIntegration:
         if not self.osc_client:
             return
         
-        # Track updates from Live (AbletonOSC format)
-        self.osc_client.register_handler("/live/track/get/volume", self._handle_track_volume_response)
-        self.osc_client.register_handler("/live/track/get/pan", self._handle_track_pan_response)
-        self.osc_client.register_handler("/live/track/get/mute", self._handle_track_mute_response)
-        self.osc_client.register_handler("/live/track/get/solo", self._handle_track_solo_response)
-        self.osc_client.register_handler("/live/track/get/arm", self._handle_track_arm_response)
-        self.osc_client.register_handler("/live/track/get/name", self._handle_track_name_response)
-        
-        # Clip updates from Live
-        self.osc_client.register_handler("/live/clip/get/playing_status", self._handle_clip_status_response)
-        self.osc_client.register_handler("/live/clip/get/name", self._handle_clip_name_response)
-        self.osc_client.register_handler("/live/clip/get/length", self._handle_clip_length_response)
-        self.osc_client.register_handler("/live/clip/get/has_audio_output", self._handle_clip_has_content_response)
-        
-        # Song-level info
-        self.osc_client.register_handler("/live/song/get/tempo", self._handle_tempo_response)
-        self.osc_client.register_handler("/live/song/get/track_names", self._handle_track_names_response)
+        # Table-driven AbletonOSC responses (see osc_routes.ROUTES)
+        for route in ROUTES:
+            self.osc_client.register_handler(route.address, partial(self._enqueue_update, route))
         
         # Live responses
         self.osc_client.register_handler("/live/test", self._handle_live_test)
@@ -106,6 +122,60 @@ class LiveIntegration:
         self.osc_client.register_handler("/live/song/track_added", self._handle_track_added)
         self.osc_client.register_handler("/live/song/track_removed", self._handle_track_removed)
         self.osc_client.register_handler("/live/song/changed", self._handle_song_changed)
+        
+        # Device parameters (paged)
+        self.devices.attach(self.osc_client)
+
+    # === WARM START SNAPSHOT ===
+    
+    def load_snapshot(self) -> bool:
+        """Populate app state from the persisted snapshot (call before first frame)"""
+        if not self.snapshot_store or not self.app_state:
+            return False
+        
+        loaded = self.snapshot_store.load()
+        if not loaded:
+            return False
+        
+        fingerprint, model = loaded
+        self.app_state.restore_model(model)
+        self.set_fingerprint = fingerprint
+        self.snapshot_loaded = True
+        self._snapshot_unverified = True  # Revalidated once, on the first fingerprint hit
+        self.logger.info(f"⚡ Warm start from snapshot {fingerprint} ({len(model.tracks)} tracks)")
+        bus.emit("live:snapshot_loaded", fingerprint=fingerprint)
+        return True
+    
+    def save_snapshot(self) -> bool:
+        """Persist the current state keyed by the last seen set fingerprint"""
+        if not self.snapshot_store or not self.app_state or not self.set_fingerprint:
+            return False
+        if not self.app_state.m.tracks:
+            return False
+        return self.snapshot_store.save(self.app_state.m, self.set_fingerprint)
+    
+    # Mixer fields re-read on a fingerprint hit (Live has no listeners for them here)
+    _MIXER_GETTERS = ("volume", "pan", "mute", "solo", "arm", "color")
+    
+    def _request_snapshot_deltas(self):
+        """Revalidate everything the fingerprint does not cover (once per loaded snapshot)"""
+        osc = self.osc_client
+        self._snapshot_unverified = False
+        for track_id, track in self.app_state.m.tracks.items():
+            for getter in self._MIXER_GETTERS:
+                osc.send_message(f"/live/track/get/{getter}", track_id)
+            for send_id in range(3):
+                osc.send_message("/live/track/get/send", track_id, send_id)
+            # Device chains may have changed while the app was closed
+            self.devices.invalidate_track(track_id)
+            self.devices.request_devices(track_id)
+            # Clips the snapshot knows about may have been renamed, recolored or deleted.
+            # New clips are picked up by the UI's visible-cell requests.
+            for scene_id, clip in track.clips.items():
+                if clip.name or clip.status.value != "empty":
+                    osc.send_message("/live/clip/get/name", track_id, scene_id)
+                    osc.send_message("/live/clip/get/playing_status", track_id, scene_id)
+                    osc.send_message("/live/clip/get/length", track_id, scene_id)
 
     def _request_initial_sync(self):
         """Request essential data from Live on connection (OPTIMIZED)"""
@@ -116,6 +186,13 @@ class LiveIntegration:
             self.osc_client.get_track_names()
             self.osc_client.send_message("/live/song/get/tempo")
             
+            # Beat clock: tempo and transport are pushed, song time is sampled sparsely
+            self.osc_client.send_message("/live/song/get/is_playing")
+            self.osc_client.send_message("/live/song/start_listen/tempo")
+            self.osc_client.send_message("/live/song/start_listen/is_playing")
+            self.osc_client.send_message("/live/song/get/current_song_time")
+            self.osc_client.send_message("/live/song/get/clip_trigger_quantization")
+            
             # PERFORMANCE: Don't request all clip data immediately
             # Load it lazily when user actually views clips
             
@@ -201,129 +278,129 @@ class LiveIntegration:
     
     # === INCOMING (Live → Push) ===
     
-    def _handle_track_volume(self, address: str, *args):
-        """Handle track volume update from Live"""
-        parts = address.split('/')
-        if len(parts) >= 4 and len(args) > 0:
-            track_id = int(parts[3])
-            value = float(args[0])
-            
-            # Update app state without triggering outgoing message
-            self.is_syncing = True
-            if self.app_state:
-                self.app_state.set_track_volume(track_id, value)
-            bus.emit("live:track_volume", track=track_id, value=value)
-            self.is_syncing = False
-    
-    def _handle_track_pan(self, address: str, *args):
-        """Handle track pan update from Live"""
-        parts = address.split('/')
-        if len(parts) >= 4 and len(args) > 0:
-            track_id = int(parts[3])
-            value = float(args[0])
-            
-            self.is_syncing = True
-            if self.app_state:
-                self.app_state.set_track_pan(track_id, value)
-            bus.emit("live:track_pan", track=track_id, value=value)
-            self.is_syncing = False
-    
-    def _handle_track_mute(self, address: str, *args):
-        """Handle track mute update from Live"""
-        parts = address.split('/')
-        if len(parts) >= 4 and len(args) > 0:
-            track_id = int(parts[3])
-            value = bool(args[0])
-            
-            self.is_syncing = True
-            if self.app_state:
-                self.app_state.set_track_mute(track_id, int(value))
-            bus.emit("live:track_mute", track=track_id, value=value)
+    def _enqueue_update(self, route: OSCRoute, address: str, *args):
+        """Decode a routed message (OSC thread) and queue it for the UI thread"""
+        update = route.decode(args)
+        if update is None:
+            self.dispatch_stats["dropped"] += 1
+            return
+        self._inbox.append((route, update, time.monotonic()))
+        if not self._drain_scheduled:
+            self._drain_scheduled = True
+            Clock.schedule_once(self._drain_updates, 0)
+    
+    def _drain_updates(self, dt=0):
+        """Generic dispatch loop: apply every queued update in one transaction"""
+        self._drain_scheduled = False
+        start = time.perf_counter()
+        count = 0
+        
+        self.is_syncing = True
+        try:
+            with self.app_state.batch() if self.app_state else nullcontext():
+                while self._inbox:
+                    route, update, received_at = self._inbox.popleft()
+                    count += 1
+                    try:
+                        self._apply_update(route, update, received_at)
+                    except Exception as e:
+                        # One bad message must not stall the queue or reach the Kivy loop
+                        self.dispatch_stats["errors"] += 1
+                        self.logger.error(f"Error applying {route.address} {update}: {e}")
+        finally:
             self.is_syncing = False
+        
+        if count:
+            stats = self.dispatch_stats
+            stats["messages"] += count
+            stats["drains"] += 1
+            stats["total_ms"] += (time.perf_counter() - start) * 1000
+    
+    def _apply_update(self, route: OSCRoute, update: Update, received_at: float):
+        """Run one table row: throttle, state setter, side-effect hook, bus topic"""
+        if route.throttle and performance_optimizer.should_throttle(
+                route.throttle, route.identifier(update),
+                trailing=partial(self._apply_trailing, route, update, received_at)):
+            return
+        self._deliver(route, update, received_at)
     
-    def _handle_track_solo(self, address: str, *args):
-        """Handle track solo update from Live"""
-        parts = address.split('/')
-        if len(parts) >= 4 and len(args) > 0:
-            track_id = int(parts[3])
-            value = bool(args[0])
-            
-            self.is_syncing = True
-            if self.app_state:
-                self.app_state.set_track_solo(track_id, int(value))
-            bus.emit("live:track_solo", track=track_id, value=value)
+    def _apply_trailing(self, route: OSCRoute, update: Update, received_at: float):
+        """Latest value of a throttled key, delivered when its interval ends"""
+        self.is_syncing = True
+        try:
+            self._deliver(route, update, received_at)
+        finally:
             self.is_syncing = False
     
-    def _handle_track_arm(self, address: str, *args):
-        """Handle track arm update from Live"""
-        parts = address.split('/')
-        if len(parts) >= 4 and len(args) > 0:
-            track_id = int(parts[3])
-            value = bool(args[0])
+    def _deliver(self, route: OSCRoute, update: Update, received_at: float):
+        if route.setter and self.app_state:
+            route.setter(self.app_state, update)
+        if route.hook:
+            getattr(self, route.hook)(update, received_at)
+        if route.topic:
+            bus.emit(route.topic, **update)
+        if route.batch_ui:
+            performance_optimizer.batch_ui_update(route.batch_ui, update)
+    
+    def undo(self) -> int:
+        """Revert the last user edit group in state and Live (one bundle)"""
+        if not self.app_state:
+            return 0
+        deltas = self.app_state.undo()
+        self._send_edits(deltas, undo=True)
+        return len(deltas)
+    
+    def redo(self) -> int:
+        """Re-apply the last undone edit group in state and Live"""
+        if not self.app_state:
+            return 0
+        deltas = self.app_state.redo()
+        self._send_edits(deltas, undo=False)
+        return len(deltas)
+    
+    def _send_edits(self, deltas, undo: bool):
+        if deltas and self.osc_client:
+            self.osc_client.send_bundle(
+                OSCClient.edit_message(d.field, d.track, d.old if undo else d.new, d.sub, d.param)
+                for d in deltas)
+    
+    def get_dispatch_stats(self) -> dict:
+        """Per-message dispatch overhead"""
+        stats = dict(self.dispatch_stats)
+        messages = stats["messages"]
+        stats["us_per_message"] = stats["total_ms"] * 1000 / messages if messages else 0.0
+        stats["messages_per_drain"] = messages / stats["drains"] if stats["drains"] else 0.0
+        return stats
+    
+    def _on_track_names(self, update: Update, received_at: float):
+        """Track names route hook (UI thread, inside the drain's AppState batch)"""
+        track_names = update["names"]
+        if track_names:
+            self.logger.info(f"📋 Live has {len(track_names)} tracks: {track_names}")
             
-            self.is_syncing = True
-            if self.app_state:
-                self.app_state.set_track_arm(track_id, int(value))
-            bus.emit("live:track_arm", track=track_id, value=value)
-            self.is_syncing = False
-    
-    def _handle_track_name(self, address: str, *args):
-        """Handle track name update from Live"""
-        parts = address.split('/')
-        if len(parts) >= 4 and len(args) > 0:
-            track_id = int(parts[3])
-            name = str(args[0])
-            bus.emit("live:track_name", track=track_id, name=name)
-    
-    def _handle_clip_status(self, address: str, *args):
-        """Handle clip status update from Live"""
-        parts = address.split('/')
-        if len(parts) >= 5 and len(args) > 0:
-            track_id = int(parts[3])
-            scene_id = int(parts[4])
-            status = str(args[0])
+            # Cheap reconcile: same ordered track names means the cached set still applies
+            fingerprint = set_fingerprint(track_names)
+            warm = (fingerprint == self.set_fingerprint and self.app_state is not None
+                    and len(self.app_state.m.tracks) == len(track_names))
+            self.set_fingerprint = fingerprint
             
-            self.is_syncing = True
-            if self.app_state:
-                self.app_state.set_clip_status(track_id, scene_id, status)
-            bus.emit("live:clip_status", track=track_id, scene=scene_id, status=status)
-            self.is_syncing = False
-    
-    def _handle_clip_name(self, address: str, *args):
-        """Handle clip name update from Live"""
-        parts = address.split('/')
-        if len(parts) >= 5 and len(args) > 0:
-            track_id = int(parts[3])
-            scene_id = int(parts[4])
-            name = str(args[0])
-            bus.emit("live:clip_name", track=track_id, scene=scene_id, name=name)
-    
-    def _handle_tempo(self, address: str, *args):
-        """Handle tempo update from Live"""
-        if len(args) > 0:
-            bpm = float(args[0])
-            bus.emit("live:tempo", bpm=bpm)
-    
-    def _handle_sync_complete(self, address: str, *args):
-        """Handle sync completion from Live"""
-        self.is_syncing = False
-        self.logger.info("Live sync completed")
-        bus.emit("live:sync_complete")
-    
-    def _handle_track_names_response(self, address: str, *args):
-        """Handle track names response from AbletonOSC (OPTIMIZED)"""
-        if args:
-            track_names = list(args)
-            self.logger.info(f"📋 Live has {len(track_names)} tracks: {track_names}")
-            bus.emit("live:track_names", names=track_names)
+            if warm:
+                if not self._snapshot_unverified:
+                    return  # Periodic poll of an unchanged, already synced set
+                self._request_snapshot_deltas()
+                bus.emit("live:track_names", names=track_names)
+                self.is_syncing = False
+                self.logger.info(f"⚡ Set {fingerprint} unchanged, revalidating snapshot")
+                return
             
             # Initialize app state with real Live tracks
             if self.app_state:
                 self.app_state.init_project_from_live(track_names)
+            bus.emit("live:track_names", names=track_names)
             
             # OPTIMIZED: Only request essential track data
             num_tracks = len(track_names)
-            for track_id in range(num_tracks):
+            for track_id in range(num_tracks if self.osc_client else 0):
                 # Only essential track properties first
                 self.osc_client.send_message(f"/live/track/get/volume", track_id)
                 self.osc_client.send_message(f"/live/track/get/name", track_id)
@@ -335,161 +412,24 @@ class LiveIntegration:
 
     def _handle_live_test(self, address: str, *args):
         """Handle test response from Live"""
-        self.logger.info(f"Live test response: {args}")
+        self.logger.info(f"✅ Live test response: {args}")
         bus.emit("live:connection_confirmed")
     
-    # === ABLETONOSC RESPONSE HANDLERS ===
+    # === ROUTE HOOKS (side effects beyond AppState) ===
     
-    def _handle_track_volume_response(self, address: str, *args):
-        """Handle track volume response from AbletonOSC"""
-        if len(args) >= 2:
-            track_id = int(args[0])
-            value = float(args[1])
-            
-            self.is_syncing = True
-            if self.app_state:
-                self.app_state.set_track_volume(track_id, value)
-            bus.emit("live:track_volume", track=track_id, value=value)
-            self.is_syncing = False
-            self.logger.debug(f"Live volume: Track {track_id} = {value:.2f}")
+    def _on_tempo_update(self, update: Update, received_at: float):
+        beat_clock.set_tempo(update["bpm"], t=received_at)
+        self.logger.debug(f"Live tempo: {update['bpm']} BPM")
     
-    def _handle_track_pan_response(self, address: str, *args):
-        """Handle track pan response from AbletonOSC"""
-        if len(args) >= 2:
-            track_id = int(args[0])
-            value = float(args[1])
-            
-            self.is_syncing = True
-            if self.app_state:
-                self.app_state.set_track_pan(track_id, value)
-            bus.emit("live:track_pan", track=track_id, value=value)
-            self.is_syncing = False
+    def _on_transport_update(self, update: Update, received_at: float):
+        beat_clock.set_playing(update["playing"], t=received_at)
+        # Fresh position right after start/stop
+        if update["playing"] and self.osc_client:
+            self.osc_client.send_message("/live/song/get/current_song_time")
     
-    def _handle_track_mute_response(self, address: str, *args):
-        """Handle track mute response from AbletonOSC"""
-        if len(args) >= 2:
-            track_id = int(args[0])
-            value = bool(args[1])
-            
-            self.is_syncing = True
-            if self.app_state:
-                self.app_state.set_track_mute(track_id, int(value))
-            bus.emit("live:track_mute", track=track_id, value=value)
-            self.is_syncing = False
-    
-    def _handle_track_solo_response(self, address: str, *args):
-        """Handle track solo response from AbletonOSC"""
-        if len(args) >= 2:
-            track_id = int(args[0])
-            value = bool(args[1])
-            
-            self.is_syncing = True
-            if self.app_state:
-                self.app_state.set_track_solo(track_id, int(value))
-            bus.emit("live:track_solo", track=track_id, value=value)
-            self.is_syncing = False
-    
-    def _handle_track_arm_response(self, address: str, *args):
-        """Handle track arm response from AbletonOSC"""
-        if len(args) >= 2:
-            track_id = int(args[0])
-            value = bool(args[1])
-            
-            self.is_syncing = True
-            if self.app_state:
-                self.app_state.set_track_arm(track_id, int(value))
-            bus.emit("live:track_arm", track=track_id, value=value)
-            self.is_syncing = False
-    
-    def _handle_track_name_response(self, address: str, *args):
-        """Handle track name response from AbletonOSC"""
-        if len(args) >= 2:
-            track_id = int(args[0])
-            name = str(args[1])
-            bus.emit("live:track_name", track=track_id, name=name)
-            self.logger.debug(f"Live track name: Track {track_id} = '{name}'")
-    
-    def _handle_clip_status_response(self, address: str, *args):
-        """Handle clip status response from AbletonOSC (OPTIMIZED)"""
-        if len(args) >= 3:
-            track_id = int(args[0])
-            scene_id = int(args[1])
-            status = str(args[2])
-            
-            # PERFORMANCE: Throttle rapid clip status updates
-            identifier = f"{track_id}:{scene_id}"
-            if performance_optimizer.should_throttle('clip_status', identifier):
-                return
-            
-            self.is_syncing = True
-            if self.app_state:
-                self.app_state.set_clip_status(track_id, scene_id, status)
-            
-            # PERFORMANCE: Batch UI updates
-            performance_optimizer.batch_ui_update('clip_status', {
-                'track': track_id, 
-                'scene': scene_id, 
-                'status': status
-            })
-            self.is_syncing = False
-    
-    def _handle_clip_name_response(self, address: str, *args):
-        """Handle clip name response from AbletonOSC"""
-        if len(args) >= 3:
-            track_id = int(args[0])
-            scene_id = int(args[1])
-            name = str(args[2])
-            bus.emit("live:clip_name", track=track_id, scene=scene_id, name=name)
-    
-    def _handle_clip_length_response(self, address: str, *args):
-        """Handle clip length response from AbletonOSC"""
-        if len(args) >= 3:
-            track_id = int(args[0])
-            scene_id = int(args[1])
-            length = float(args[2]) if args[2] != -1 else 0  # -1 means no clip
-            
-            has_content = length > 0
-            bus.emit("live:clip_has_content", track=track_id, scene=scene_id, has_content=has_content, length=length)
-
-    def _handle_clip_has_content_response(self, address: str, *args):
-        """Handle clip has_audio_output response from AbletonOSC"""
-        if len(args) >= 3:
-            track_id = int(args[0])
-            scene_id = int(args[1])
-            has_content = bool(args[2])
-            
-            bus.emit("live:clip_has_content", track=track_id, scene=scene_id, has_content=has_content)
-    
-    def _handle_tempo_response(self, address: str, *args):
-        """Handle tempo response from AbletonOSC"""
-        if len(args) > 0:
-            bpm = float(args[0])
-            bus.emit("live:tempo", bpm=bpm)
-            self.logger.debug(f"Live tempo: {bpm} BPM")
-    
-    def _handle_track_names_response(self, address: str, *args):
-        """Handle track names response from AbletonOSC"""
-        if args:
-            track_names = list(args)
-            self.logger.info(f"Live track names: {track_names}")
-            bus.emit("live:track_names", names=track_names)
-    
-    def _handle_live_test(self, address: str, *args):
-        """Handle test response from Live"""
-        self.logger.info(f"✅ Live test response: {args}")
-        bus.emit("live:connection_confirmed")
-    
-    def _handle_track_color_response(self, address: str, *args):
-        """Handle track color response from AbletonOSC"""
-        if len(args) >= 2:
-            track_id = int(args[0])
-            color_value = args[1]  # Puede ser RGB o índice de color
-            
-            # Convertir color de Live a RGBA
-            rgba_color = self._convert_live_color(color_value)
-            
-            bus.emit("live:track_color", track=track_id, color=rgba_color)
-            self.logger.debug(f"Live track color: Track {track_id} = {rgba_color}")
+    def _on_song_time_update(self, update: Update, received_at: float):
+        # Stamped with arrival time, not drain time
+        beat_clock.add_sample(update["beat"], t=received_at)
 
     def _handle_track_added(self, address: str, *args):
         """Handle when a track is added in Live"""
@@ -511,6 +451,8 @@ class LiveIntegration:
         if self.osc_client:
             self.logger.info("📡 Requesting full resync...")
             self.is_syncing = True
+            self.devices.clear()
+            performance_optimizer.invalidate_clip_data()
             
             # Re-request track names (will trigger UI update)
             self.osc_client.get_track_names()
@@ -542,35 +484,20 @@ class LiveIntegration:
                     self.logger.error(f"Polling error: {e}")
                     break
         
+        def song_time_loop():
+            # Sparse samples are enough: the beat clock extrapolates in between
+            while self.polling_enabled and self.osc_client and self.osc_client.is_connected:
+                if beat_clock.playing:
+                    self.osc_client.send_message("/live/song/get/current_song_time")
+                time.sleep(self.song_time_interval)
+        
         polling_thread = threading.Thread(target=poll_loop, daemon=True)
         polling_thread.start()
+        threading.Thread(target=song_time_loop, daemon=True).start()
 
     def _convert_live_color(self, live_color):
         """Convert Live color format to RGBA"""
-        if isinstance(live_color, (list, tuple)) and len(live_color) >= 3:
-            # Si Live envía RGB directamente
-            r, g, b = live_color[:3]
-            return (r/255.0, g/255.0, b/255.0, 1.0)
-        elif isinstance(live_color, int):
-            # Si Live envía índice de color, usar paleta de colores
-            live_colors = [
-                (1.0, 0.3, 0.3, 1.0),    # Rojo
-                (1.0, 0.6, 0.0, 1.0),    # Naranja
-                (1.0, 1.0, 0.0, 1.0),    # Amarillo
-                (0.5, 1.0, 0.0, 1.0),    # Verde claro
-                (0.0, 1.0, 0.0, 1.0),    # Verde
-                (0.0, 1.0, 0.5, 1.0),    # Verde agua
-                (0.0, 1.0, 1.0, 1.0),    # Cyan
-                (0.0, 0.5, 1.0, 1.0),    # Azul claro
-                (0.0, 0.0, 1.0, 1.0),    # Azul
-                (0.5, 0.0, 1.0, 1.0),    # Púrpura
-                (1.0, 0.0, 1.0, 1.0),    # Magenta
-                (1.0, 0.0, 0.5, 1.0),    # Rosa
-            ]
-            return live_colors[live_color % len(live_colors)]
-        else:
-            # Color por defecto
-            return (0.5, 0.5, 0.5, 1.0)
+        return convert_live_color(live_color)
 
     def _on_mixer_volume(self, **kwargs):
         """Handle mixer volume changes (same as track volume)"""
@@ -1,7 +1,8 @@
 import threading
 import logging
-from typing import Callable, Dict, Any, Optional, Tuple
+from typing import Callable, Dict, Any, Iterable, Optional, Tuple
 from pythonosc.udp_client import SimpleUDPClient
+from pythonosc import osc_bundle_builder, osc_message_builder
 from pythonosc.dispatcher import Dispatcher
 from pythonosc.osc_server import BlockingOSCUDPServer
 import time
@@ -219,6 +220,33 @@ class OSCClient:
             self.logger.error(f"Failed to send OSC message {address}: {e}")
             return False
     
+    def send_bundle(self, messages: Iterable[Tuple[str, tuple]]) -> bool:
+        """Send several (address, args) messages as one OSC bundle (one datagram)"""
+        messages = list(messages)
+        if not messages:
+            return True
+        if not self.is_connected or not self.client:
+            self.logger.warning(f"Cannot send OSC bundle - not connected ({len(messages)} messages)")
+            return False
+        
+        try:
+            bundle = osc_bundle_builder.OscBundleBuilder(osc_bundle_builder.IMMEDIATELY)
+            for address, args in messages:
+                msg = osc_message_builder.OscMessageBuilder(address=address)
+                for arg in args:
+                    msg.add_arg(arg)
+                bundle.add_content(msg.build())
+            self.client.send(bundle.build())
+            
+            self.messages_sent += len(messages)
+            self.last_message_time = time.time()
+            self.logger.debug(f"OSC Sent bundle: {len(messages)} messages")
+            return True
+            
+        except Exception as e:
+            self.logger.error(f"Failed to send OSC bundle: {e}")
+            return False
+    
     def register_handler(self, pattern: str, handler: Callable):
         """Register handler for incoming OSC messages"""
         self.handlers[pattern] = handler
@@ -309,32 +337,53 @@ class OSCClient:
     # === CONVENIENCE METHODS FOR LIVE CONTROL ===
     # (Los métodos existentes están bien, solo algunas mejoras menores)
     
+    @staticmethod
+    def edit_message(field: str, track_id: int, value: float,
+                     sub: int = 0, param: int = 0) -> Tuple[str, tuple]:
+        """(address, clamped args) of a mixer/device edit.
+
+        Single source for the setters below and for bundled edits
+        (undo/redo via send_bundle), so both always agree.
+        """
+        if field == "volume":
+            return f"/live/track/{track_id}/volume", (max(0.0, min(1.0, value)),)
+        if field == "pan":
+            return f"/live/track/{track_id}/pan", (max(-1.0, min(1.0, value)),)
+        if field == "send":
+            return f"/live/track/{track_id}/send/{'abc'[sub]}", (max(0.0, min(1.0, value)),)
+        if field in ("mute", "solo", "arm"):
+            return f"/live/track/{track_id}/{field}", (1 if value else 0,)
+        if field == "device_parameter":
+            return "/live/device/set/parameter/value", (track_id, sub, param, value)
+        raise ValueError(f"Unknown edit field: {field}")
+    
+    def _send_edit(self, field: str, track_id: int, value: float, sub: int = 0, param: int = 0):
+        address, args = self.edit_message(field, track_id, value, sub, param)
+        return self.send_message(address, *args)
+    
     def set_track_volume(self, track_id: int, value: float):
         """Set track volume (0.0 - 1.0)"""
-        value = max(0.0, min(1.0, value))  # MEJORADO: Clamp value
-        return self.send_message(f"/live/track/{track_id}/volume", value)
+        return self._send_edit("volume", track_id, value)
     
     def set_track_pan(self, track_id: int, value: float):
         """Set track pan (-1.0 - 1.0)"""
-        value = max(-1.0, min(1.0, value))  # MEJORADO: Clamp value
-        return self.send_message(f"/live/track/{track_id}/pan", value)
+        return self._send_edit("pan", track_id, value)
     
     def set_track_mute(self, track_id: int, muted: bool):
         """Set track mute state"""
-        return self.send_message(f"/live/track/{track_id}/mute", 1 if muted else 0)
+        return self._send_edit("mute", track_id, muted)
     
     def set_track_solo(self, track_id: int, soloed: bool):
         """Set track solo state"""
-        return self.send_message(f"/live/track/{track_id}/solo", 1 if soloed else 0)
+        return self._send_edit("solo", track_id, soloed)
     
     def set_track_arm(self, track_id: int, armed: bool):
         """Set track arm state"""
-        return self.send_message(f"/live/track/{track_id}/arm", 1 if armed else 0)
+        return self._send_edit("arm", track_id, armed)
     
     def set_track_send(self, track_id: int, send_id: str, value: float):
         """Set track send level (A, B, C)"""
-        value = max(0.0, min(1.0, value))  # MEJORADO: Clamp value
-        return self.send_message(f"/live/track/{track_id}/send/{send_id.lower()}", value)
+        return self._send_edit("send", track_id, value, sub="abc".index(send_id.lower()))
     
     def trigger_clip(self, track_id: int, scene_id: int):
         """Trigger clip"""
@@ -384,16 +433,42 @@ class OSCClient:
         return self.send_message("/live/song/get/scene_names")
     
     def get_track_devices(self, track_id: int):
-        """Get devices for a track"""
-        return self.send_message(f"/live/track/get/devices", track_id)
+        """Get device names for a track"""
+        return self.send_message(f"/live/track/get/devices/name", track_id)
     
     def get_device_parameters(self, track_id: int, device_id: int):
-        """Get device parameters"""
+        """Get device parameter names"""
         return self.send_message(f"/live/device/get/parameters/name", track_id, device_id)
     
+    def get_device_num_parameters(self, track_id: int, device_id: int):
+        """Get number of parameters of a device"""
+        return self.send_message(f"/live/device/get/num_parameters", track_id, device_id)
+    
+    def get_device_parameter_ranges(self, track_id: int, device_id: int):
+        """Get min/max of all device parameters (static metadata)"""
+        ok_min = self.send_message(f"/live/device/get/parameters/min", track_id, device_id)
+        ok_max = self.send_message(f"/live/device/get/parameters/max", track_id, device_id)
+        return ok_min and ok_max
+    
+    def get_device_parameter_value(self, track_id: int, device_id: int, param_id: int):
+        """Get a single device parameter value"""
+        return self.send_message(f"/live/device/get/parameter/value", track_id, device_id, param_id)
+    
+    def get_device_parameter_value_string(self, track_id: int, device_id: int, param_id: int):
+        """Get a single device parameter display string"""
+        return self.send_message(f"/live/device/get/parameter/value_string", track_id, device_id, param_id)
+    
+    def start_listen_device_parameter(self, track_id: int, device_id: int, param_id: int):
+        """Start listening for device parameter value changes"""
+        return self.send_message(f"/live/device/start_listen/parameter/value", track_id, device_id, param_id)
+    
+    def stop_listen_device_parameter(self, track_id: int, device_id: int, param_id: int):
+        """Stop listening for device parameter value changes"""
+        return self.send_message(f"/live/device/stop_listen/parameter/value", track_id, device_id, param_id)
+    
     def set_device_parameter(self, track_id: int, device_id: int, param_id: int, value: float):
         """Set device parameter value"""
-        return self.send_message(f"/live/device/set/parameter/value", track_id, device_id, param_id, value)
+        return self._send_edit("device_parameter", track_id, value, sub=device_id, param=param_id)
     
     def get_clip_info(self, track_id: int, scene_id: int):
         """Get clip information"""
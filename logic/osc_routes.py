@@ -0,0 +1,157 @@
+# logic/osc_routes.py
+"""Declarative AbletonOSC response table.
+
+Each row maps an address to a typed argument decoder, an optional AppState
+setter and an optional bus topic. LiveIntegration runs every row through one
+generic dispatch loop, so adding a Live property is one row here.
+"""
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from .cache import BoundedCache, cache_budget
+
+Update = Dict[str, Any]
+
+def args(*spec: Tuple[str, Callable]) -> Callable[[tuple], Optional[Update]]:
+    """Positional decoder: ``args(("track", int), ("value", float))``"""
+    count = len(spec)
+
+    def decode(values: tuple) -> Optional[Update]:
+        if len(values) < count:
+            return None
+        return {name: cast(values[i]) for i, (name, cast) in enumerate(spec)}
+
+    return decode
+
+def _decode_clip_length(values: tuple) -> Optional[Update]:
+    if len(values) < 3:
+        return None
+    length = float(values[2]) if values[2] != -1 else 0.0  # -1 means no clip
+    return {"track": int(values[0]), "scene": int(values[1]),
+            "has_content": length > 0, "length": length}
+
+def _decode_track_names(values: tuple) -> Optional[Update]:
+    return {"names": [str(name) for name in values]} if values else None
+
+def _decode_track_send(values: tuple) -> Optional[Update]:
+    if len(values) < 3 or not 0 <= int(values[1]) < 3:
+        return None
+    return {"track": int(values[0]), "send": "ABC"[int(values[1])], "value": float(values[2])}
+
+def _decode_track_color(values: tuple) -> Optional[Update]:
+    if len(values) < 2:
+        return None
+    return {"track": int(values[0]), "color": convert_live_color(values[1])}
+
+# Live color index palette
+LIVE_COLORS = [
+    (1.0, 0.3, 0.3, 1.0),    # Rojo
+    (1.0, 0.6, 0.0, 1.0),    # Naranja
+    (1.0, 1.0, 0.0, 1.0),    # Amarillo
+    (0.5, 1.0, 0.0, 1.0),    # Verde claro
+    (0.0, 1.0, 0.0, 1.0),    # Verde
+    (0.0, 1.0, 0.5, 1.0),    # Verde agua
+    (0.0, 1.0, 1.0, 1.0),    # Cyan
+    (0.0, 0.5, 1.0, 1.0),    # Azul claro
+    (0.0, 0.0, 1.0, 1.0),    # Azul
+    (0.5, 0.0, 1.0, 1.0),    # Púrpura
+    (1.0, 0.0, 1.0, 1.0),    # Magenta
+    (1.0, 0.0, 0.5, 1.0),    # Rosa
+]
+
+# Live sends the same few colors over and over
+_color_cache = BoundedCache("live_colors", max_entries=256, budget=cache_budget)
+
+def convert_live_color(live_color):
+    """Convert Live color format to RGBA (memoized)"""
+    key = tuple(live_color) if isinstance(live_color, list) else live_color
+    try:
+        return _color_cache.get_or_compute(key, lambda: _convert_live_color(live_color))
+    except TypeError:  # Unhashable payload
+        return _convert_live_color(live_color)
+
+def _convert_live_color(live_color):
+    if isinstance(live_color, (list, tuple)) and len(live_color) >= 3:
+        # Si Live envía RGB directamente
+        r, g, b = live_color[:3]
+        return (r/255.0, g/255.0, b/255.0, 1.0)
+    elif isinstance(live_color, int):
+        # Si Live envía índice de color, usar paleta de colores
+        return LIVE_COLORS[live_color % len(LIVE_COLORS)]
+    else:
+        # Color por defecto
+        return (0.5, 0.5, 0.5, 1.0)
+
+@dataclass(frozen=True)
+class OSCRoute:
+    """One AbletonOSC response: how to decode it and where it goes"""
+    address: str
+    decode: Callable[[tuple], Optional[Update]]
+    setter: Optional[Callable[[Any, Update], None]] = None  # (app_state, update)
+    topic: Optional[str] = None                             # bus topic, update as kwargs
+    hook: Optional[str] = None                              # LiveIntegration method(update)
+    throttle: Optional[str] = None                          # performance_optimizer key
+    batch_ui: Optional[str] = None                          # batched UI update type
+
+    def identifier(self, update: Update) -> str:
+        """Throttle identity of an update (per track / per clip)"""
+        if "scene" in update:
+            return f"{update['track']}:{update['scene']}"
+        return str(update.get("track", ""))
+
+ROUTES = (
+    # Track mixer
+    OSCRoute("/live/track/get/volume", args(("track", int), ("value", float)),
+             setter=lambda s, u: s.set_track_volume(u["track"], u["value"]),
+             topic="live:track_volume"),
+    OSCRoute("/live/track/get/pan", args(("track", int), ("value", float)),
+             setter=lambda s, u: s.set_track_pan(u["track"], u["value"]),
+             topic="live:track_pan"),
+    OSCRoute("/live/track/get/mute", args(("track", int), ("value", bool)),
+             setter=lambda s, u: s.set_track_mute(u["track"], int(u["value"])),
+             topic="live:track_mute"),
+    OSCRoute("/live/track/get/solo", args(("track", int), ("value", bool)),
+             setter=lambda s, u: s.set_track_solo(u["track"], int(u["value"])),
+             topic="live:track_solo"),
+    OSCRoute("/live/track/get/arm", args(("track", int), ("value", bool)),
+             setter=lambda s, u: s.set_track_arm(u["track"], int(u["value"])),
+             topic="live:track_arm"),
+    OSCRoute("/live/track/get/send", _decode_track_send,
+             setter=lambda s, u: s.set_track_send(u["track"], u["send"], u["value"]),
+             topic="live:track_send"),
+    OSCRoute("/live/track/get/name", args(("track", int), ("name", str)),
+             topic="live:track_name"),
+    OSCRoute("/live/track/get/color", _decode_track_color,
+             setter=lambda s, u: s.set_track_color(u["track"], u["color"]),
+             topic="live:track_color"),
+
+    # Clips
+    OSCRoute("/live/clip/get/playing_status", args(("track", int), ("scene", int), ("status", str)),
+             setter=lambda s, u: s.set_clip_status(u["track"], u["scene"], u["status"]),
+             topic="live:clip_status", throttle="clip_status", batch_ui="clip_status"),
+    OSCRoute("/live/clip/get/name", args(("track", int), ("scene", int), ("name", str)),
+             setter=lambda s, u: s.set_clip_name(u["track"], u["scene"], u["name"]),
+             topic="live:clip_name"),
+    OSCRoute("/live/clip/get/length", _decode_clip_length,
+             topic="live:clip_has_content"),
+    OSCRoute("/live/clip/get/has_audio_output", args(("track", int), ("scene", int), ("has_content", bool)),
+             topic="live:clip_has_content"),
+
+    # Song structure (reconcile runs on the UI thread like every other AppState write)
+    OSCRoute("/live/song/get/track_names", _decode_track_names, hook="_on_track_names"),
+
+    # Song / transport
+    OSCRoute("/live/song/get/tempo", args(("bpm", float)),
+             setter=lambda s, u: s.set_tempo(u["bpm"]),
+             topic="live:tempo", hook="_on_tempo_update"),
+    OSCRoute("/live/song/get/is_playing", args(("playing", bool)),
+             setter=lambda s, u: s.set_playing(u["playing"]),
+             topic="live:transport", hook="_on_transport_update"),
+    OSCRoute("/live/song/get/current_song_time", args(("beat", float)),
+             hook="_on_song_time_update"),
+    OSCRoute("/live/song/get/num_scenes", args(("count", int)),
+             setter=lambda s, u: s.set_scenes_count(u["count"]),
+             topic="live:num_scenes"),
+    OSCRoute("/live/song/get/clip_trigger_quantization", args(("value", int)),
+             topic="live:launch_quantization"),
+)
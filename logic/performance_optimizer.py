@@ -1,23 +1,217 @@
 # logic/performance_optimizer.py
+import inspect
+import itertools
 import time
-from collections import defaultdict
+from collections import OrderedDict, defaultdict
 from kivy.clock import Clock
-from typing import Dict, Any, List, Callable
+from typing import Dict, Any, List, Callable, Optional, Tuple
 import logging
 
+from .cache import BoundedCache, cache_budget
+
+class TimerWheel:
+    """Hashed timing wheel: many keyed deadlines, one Clock event
+
+    Deadlines fall into ``slots`` buckets of ``tick`` seconds. A key holds
+    at most one deadline; re-scheduling it replaces the callback. The Clock
+    interval only runs while something is pending.
+    """
+    
+    def __init__(self, tick: float = 0.01, slots: int = 64, time_fn=time.monotonic):
+        self.tick = tick
+        self.slots = slots
+        self.time_fn = time_fn
+        self._buckets: List[set] = [set() for _ in range(slots)]
+        self._entries: Dict[Any, Tuple[float, Callable[[], None]]] = {}
+        self._cursor = int(time_fn() / tick)  # Absolute tick serviced so far
+        self._event = None
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def __contains__(self, key) -> bool:
+        return key in self._entries
+    
+    def schedule(self, key, due: float, callback: Callable[[], None]):
+        """Run ``callback`` at monotonic time ``due`` (replaces key's pending one)"""
+        if key in self._entries:
+            due = min(due, self._entries[key][0])  # Never push an existing trailer back
+        if self._event is None:
+            self._cursor = int(self.time_fn() / self.tick)
+            self._event = Clock.schedule_interval(self.advance, self.tick)
+        self._entries[key] = (due, callback)
+        self._buckets[max(int(due / self.tick), self._cursor + 1) % self.slots].add(key)
+    
+    def cancel(self, key):
+        self._entries.pop(key, None)  # Bucket entry is skipped lazily
+    
+    def cancel_all(self):
+        """Drop every pending deadline and stop the Clock interval"""
+        self._entries.clear()
+        for bucket in self._buckets:
+            bucket.clear()
+        if self._event is not None:
+            self._event.cancel()
+            self._event = None
+    
+    def advance(self, dt=0):
+        """Fire every deadline up to now"""
+        now = self.time_fn()
+        target = int(now / self.tick)
+        # Never sweep more than one revolution per call
+        for tick in range(max(self._cursor + 1, target - self.slots + 1), target + 1):
+            bucket = self._buckets[tick % self.slots]
+            if not bucket:
+                continue
+            self._buckets[tick % self.slots] = set()
+            for key in bucket:
+                entry = self._entries.get(key)
+                if entry is None:
+                    continue
+                due, callback = entry
+                if due <= now:
+                    del self._entries[key]
+                    callback()
+                else:
+                    # Later revolution (or later within the current tick)
+                    self._buckets[max(int(due / self.tick), target + 1) % self.slots].add(key)
+        self._cursor = target
+        
+        if not self._entries and self._event is not None:
+            self._event.cancel()
+            self._event = None
+
+# Frame scheduler priorities (lower runs first)
+PRIORITY_HIGH = 0      # Direct feedback for user input
+PRIORITY_NORMAL = 10   # Live updates
+PRIORITY_LOW = 20      # Rebuilds, prefetch
+
+class FrameScheduler:
+    """Cooperative per-frame job runner with a time budget
+
+    Jobs are plain callables (one slice) or generators (resumed one ``next``
+    per slice until exhausted). Each frame runs the highest-priority slices
+    that fit in the budget; the budget shrinks when frames overrun the
+    target frame time and recovers when they don't.
+    """
+    
+    def __init__(self, budget_ms: float = 8.0, target_fps: int = 60,
+                 min_budget_ms: float = 2.0, time_fn=time.perf_counter):
+        self.logger = logging.getLogger(__name__)
+        self.time_fn = time_fn
+        self.max_budget_ms = budget_ms
+        self.min_budget_ms = min_budget_ms
+        self.budget_ms = budget_ms
+        self.frame_ms = 1000.0 / target_fps
+        
+        self._jobs: Dict[str, list] = {}  # name -> [priority, seq, job, cost_ms]
+        self._seq = itertools.count()
+        self._event = None
+        self.stats = {"frames": 0, "slices": 0, "completed": 0, "deferred": 0,
+                      "overruns": 0, "busy_ms": 0.0}
+    
+    def __len__(self) -> int:
+        return len(self._jobs)
+    
+    def __contains__(self, name: str) -> bool:
+        return name in self._jobs
+    
+    def set_budget(self, budget_ms: float):
+        self.max_budget_ms = self.budget_ms = max(self.min_budget_ms, budget_ms)
+    
+    def submit(self, name: str, job, priority: int = PRIORITY_NORMAL, cost_ms: float = 1.0):
+        """Queue a job; a pending job with the same name is replaced"""
+        if inspect.isgeneratorfunction(job):
+            job = job()
+        self._jobs[name] = [priority, next(self._seq), job, cost_ms]
+        if self._event is None:
+            self._event = Clock.schedule_interval(self.run_frame, 0)
+    
+    def cancel(self, name: str) -> bool:
+        entry = self._jobs.pop(name, None)
+        if entry is not None and inspect.isgenerator(entry[2]):
+            entry[2].close()
+        return entry is not None
+    
+    def run_frame(self, dt: float = 0.0):
+        """Run as many slices as fit in this frame's budget"""
+        self._adapt_budget(dt * 1000.0)
+        self.stats["frames"] += 1
+        start = self.time_fn()
+        spent = 0.0
+        
+        for name, entry in sorted(self._jobs.items(), key=lambda item: item[1][:2]):
+            # Keep resuming this job while its next slice fits
+            while self._jobs.get(name) is entry:  # Not cancelled/replaced meanwhile
+                if spent > 0 and spent + entry[3] > self.budget_ms:
+                    self.stats["deferred"] += 1
+                    break  # A cheaper job further down may still fit
+                slice_start = self.time_fn()
+                pending = self._run_slice(name, entry)
+                if pending:
+                    elapsed = (self.time_fn() - slice_start) * 1000.0
+                    entry[3] = 0.7 * entry[3] + 0.3 * elapsed  # Learn the real slice cost
+                spent = (self.time_fn() - start) * 1000.0
+        
+        self.stats["busy_ms"] += spent
+        if not self._jobs and self._event is not None:
+            self._event.cancel()
+            self._event = None
+    
+    def _run_slice(self, name: str, entry: list) -> bool:
+        """Run one slice; True if the job is still pending afterwards"""
+        job = entry[2]
+        self.stats["slices"] += 1
+        try:
+            if inspect.isgenerator(job):
+                next(job)
+                return True
+            job()
+        except StopIteration:
+            pass
+        except Exception as e:
+            self.logger.error(f"Frame job {name} failed: {e}")
+        if self._jobs.get(name) is entry:
+            del self._jobs[name]
+            self.stats["completed"] += 1
+        return False
+    
+    def _adapt_budget(self, frame_ms: float):
+        """Measured frame time over target -> less work next frame"""
+        if frame_ms <= 0:
+            return
+        if frame_ms > self.frame_ms * 1.1:
+            self.stats["overruns"] += 1
+            self.budget_ms = max(self.min_budget_ms, self.budget_ms * 0.75)
+        else:
+            self.budget_ms = min(self.max_budget_ms, self.budget_ms + 0.5)
+    
+    def get_stats(self) -> Dict[str, float]:
+        stats = dict(self.stats)
+        stats["pending"] = len(self._jobs)
+        stats["budget_ms"] = self.budget_ms
+        return stats
+
 class PerformanceOptimizer:
     """Optimiza el rendimiento de la GUI mediante batching y throttling"""
     
-    def __init__(self):
+    def __init__(self, batch_window: float = 0.05, time_fn=time.monotonic):
         self.logger = logging.getLogger(__name__)
+        self.time_fn = time_fn
         
-        # Batching para actualizaciones UI
-        self._pending_ui_updates: Dict[str, Any] = {}
-        self._ui_update_scheduled = False
-        self._batch_delay = 0.05  # 50ms batch window
+        # Batching para actualizaciones UI: (type, track, scene) -> (type, latest data),
+        # flushed in first-insertion order
+        self._pending_ui_updates: "OrderedDict[tuple, Tuple[str, Dict[str, Any]]]" = OrderedDict()
+        self._flush_event = None
+        self.batch_window = batch_window  # 50ms batch window
+        self.batch_stats = {"queued": 0, "coalesced": 0, "flushes": 0, "flushed": 0,
+                            "total_ms": 0.0, "max_ms": 0.0}
         
-        # Throttling para eventos rápidos
-        self._last_event_times: Dict[str, float] = {}
+        # Throttling para eventos rápidos (monotonic, LRU-bounded keys)
+        self._last_event_times: "OrderedDict[str, float]" = OrderedDict()
+        self.max_throttle_keys = 4096
+        self.trailers = TimerWheel(time_fn=time_fn)  # Trailing delivery of the latest throttled value
+        self.throttle_stats = {"passed": 0, "throttled": 0, "trailing": 0}
         self._throttle_intervals = {
             'clip_status': 0.1,    # Max 10 updates/sec per clip
             'track_volume': 0.05,  # Max 20 updates/sec per track
@@ -25,52 +219,94 @@ class PerformanceOptimizer:
             'clip_name': 0.2,      # Max 5 updates/sec per clip name
         }
         
-        # Lazy loading para datos pesados
-        self._clip_data_cache: Dict[tuple, Dict] = {}
-        self._cache_expiry = 30.0  # Cache expires after 30 seconds
+        # Lazy loading para datos pesados (bounded, expires after 30 seconds)
+        self._cache_expiry = 30.0
+        self._clip_data_cache = BoundedCache("clip_data", max_entries=4096,
+                                             ttl=self._cache_expiry, budget=cache_budget)
+        
+    def should_throttle(self, event_type: str, identifier: str,
+                        trailing: Optional[Callable[[], None]] = None) -> bool:
+        """Check if event should be throttled
         
-    def should_throttle(self, event_type: str, identifier: str) -> bool:
-        """Check if event should be throttled"""
+        With ``trailing``, a throttled event is not lost: the latest callback
+        per key runs once when the interval ends.
+        """
         key = f"{event_type}:{identifier}"
-        current_time = time.time()
+        current_time = self.time_fn()
+        last = self._last_event_times.get(key)
         
-        if key in self._last_event_times:
-            elapsed = current_time - self._last_event_times[key]
+        if last is not None:
             interval = self._throttle_intervals.get(event_type, 0.1)
-            
-            if elapsed < interval:
+            if current_time - last < interval:
+                self.throttle_stats["throttled"] += 1
+                if trailing is not None:
+                    self.trailers.schedule(key, last + interval,
+                                            lambda: self._fire_trailing(key, trailing))
                 return True  # Should throttle
         
-        self._last_event_times[key] = current_time
+        self.trailers.cancel(key)  # A fresh leading event supersedes any trailer
+        self._touch(key, current_time)
+        self.throttle_stats["passed"] += 1
         return False
     
+    def _fire_trailing(self, key: str, callback: Callable[[], None]):
+        self._touch(key, self.time_fn())
+        self.throttle_stats["trailing"] += 1
+        callback()
+    
+    def _touch(self, key: str, when: float):
+        times = self._last_event_times
+        times[key] = when
+        times.move_to_end(key)
+        while len(times) > self.max_throttle_keys:
+            times.popitem(last=False)
+    
     def batch_ui_update(self, update_type: str, data: Dict[str, Any]):
-        """Add UI update to batch"""
-        self._pending_ui_updates[update_type] = data
+        """Add UI update to batch; a newer update for the same cell replaces the older one"""
+        key = (update_type, data.get('track'), data.get('scene'))
+        if key in self._pending_ui_updates:
+            self.batch_stats["coalesced"] += 1
+        self._pending_ui_updates[key] = (update_type, data)  # Keeps first-insertion position
+        self.batch_stats["queued"] += 1
         
-        if not self._ui_update_scheduled:
-            self._ui_update_scheduled = True
-            Clock.schedule_once(self._process_batched_updates, self._batch_delay)
+        if self._flush_event is None:
+            self._flush_event = Clock.schedule_once(self._schedule_flush, self.batch_window)
+    
+    def set_batch_window(self, seconds: float):
+        """Change the batching window (takes effect from the next batch)"""
+        self.batch_window = max(0.0, seconds)
+    
+    def _schedule_flush(self, dt):
+        """Window closed: deliver in the next frame slot that has budget"""
+        frame_scheduler.submit("performance:ui_batch", lambda: self._process_batched_updates(0),
+                               priority=PRIORITY_NORMAL, cost_ms=1.0)
+    
+    def flush(self):
+        """Deliver pending UI updates now"""
+        if self._flush_event is not None:
+            self._flush_event.cancel()
+        frame_scheduler.cancel("performance:ui_batch")
+        self._process_batched_updates(0)
     
     def _process_batched_updates(self, dt):
         """Process all batched UI updates at once"""
+        self._flush_event = None
         if not self._pending_ui_updates:
-            self._ui_update_scheduled = False
             return
         
-        start_time = time.time()
-        updates_processed = 0
+        start_time = time.perf_counter()
+        pending = self._pending_ui_updates
+        self._pending_ui_updates = OrderedDict()
         
         # Group similar updates
         clip_updates = []
         track_updates = []
         
-        for update_type, data in self._pending_ui_updates.items():
+        for update_type, data in pending.values():
             if 'clip' in update_type:
                 clip_updates.append((update_type, data))
             elif 'track' in update_type:
                 track_updates.append((update_type, data))
-            updates_processed += 1
         
         # Process in batches
         if clip_updates:
@@ -78,12 +314,20 @@ class PerformanceOptimizer:
         if track_updates:
             self._process_track_batch(track_updates)
         
-        # Clear batch
-        self._pending_ui_updates.clear()
-        self._ui_update_scheduled = False
-        
-        elapsed = (time.time() - start_time) * 1000
-        self.logger.debug(f"⚡ Processed {updates_processed} UI updates in {elapsed:.1f}ms")
+        elapsed = (time.perf_counter() - start_time) * 1000
+        stats = self.batch_stats
+        stats["flushes"] += 1
+        stats["flushed"] += len(pending)
+        stats["total_ms"] += elapsed
+        stats["max_ms"] = max(stats["max_ms"], elapsed)
+        self.logger.debug(f"⚡ Processed {len(pending)} UI updates in {elapsed:.1f}ms")
+    
+    def get_batch_stats(self) -> Dict[str, float]:
+        """Batcher counters and flush cost"""
+        stats = dict(self.batch_stats)
+        stats["avg_ms"] = stats["total_ms"] / stats["flushes"] if stats["flushes"] else 0.0
+        stats["pending"] = len(self._pending_ui_updates)
+        return stats
     
     def _process_clip_batch(self, clip_updates: List[tuple]):
         """Process batched clip updates efficiently"""
@@ -113,37 +357,31 @@ class PerformanceOptimizer:
         
         # Emit single event per track
         for track, data in merged_data.items():
-            bus.emit("ui:track_batch_update", track=track, **data)
+            bus.emit("ui:track_batch_update", **dict(data, track=track))
     
     def cache_clip_data(self, track: int, scene: int, data: Dict):
         """Cache clip data to avoid redundant updates"""
-        key = (track, scene)
-        current_time = time.time()
-        
-        self._clip_data_cache[key] = {
-            'data': data,
-            'timestamp': current_time
-        }
+        self._clip_data_cache.put((track, scene), data)
     
     def get_cached_clip_data(self, track: int, scene: int) -> Dict:
         """Get cached clip data if still valid"""
-        key = (track, scene)
-        cached = self._clip_data_cache.get(key)
-        
-        if cached:
-            age = time.time() - cached['timestamp']
-            if age < self._cache_expiry:
-                return cached['data']
-            else:
-                # Remove expired cache
-                del self._clip_data_cache[key]
-        
-        return {}
+        return self._clip_data_cache.get((track, scene), {})
+    
+    def invalidate_clip_data(self, track: Optional[int] = None, scene: Optional[int] = None):
+        """Drop cached clip data for one clip, one track, or everything"""
+        if track is None:
+            self._clip_data_cache.clear()
+        elif scene is None:
+            self._clip_data_cache.invalidate_prefix((track,))
+        else:
+            self._clip_data_cache.invalidate((track, scene))
     
     def clear_cache(self):
         """Clear all cached data"""
         self._clip_data_cache.clear()
         self._last_event_times.clear()
+        self.trailers.cancel_all()
 
-# Global instance
+# Global instances
 performance_optimizer = PerformanceOptimizer()
+frame_scheduler = FrameScheduler()
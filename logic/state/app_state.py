@@ -1,18 +1,82 @@
-from .models import AppStateModel, TrackState, ClipSlotState, ClipStatus
+from .models import (AppStateModel, TrackState, ClipSlotState, ClipStatus, StateChanges,
+                     EMPTY_CLIP, clip_slot, intern_color)
+from .grid_store import ClipGridStore
+from .selectors import Selectors, register_default_selectors
+from .journal import Delta, DeltaJournal
+from .demo_data import DemoSet, demo_set_for
 from ..bus import bus
-from dataclasses import dataclass, field
-from typing import Dict, Optional
-from enum import Enum
+from contextlib import contextmanager
+from dataclasses import dataclass, field, replace
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+import logging
 
-class ClipStatus(Enum):
-    EMPTY = "empty"
-    PLAYING = "playing"
-    QUEUED = "queued"
-    RECORDING = "recording"
+_CLIP_STATUSES = frozenset(status.value for status in ClipStatus)
+
+# Scenes a clip update may add beyond the last known scene count
+SCENE_GROWTH_MARGIN = 64
+
+
+def changeset_field_events(changes) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """Adapter: expand a ``state:changeset`` diff back into per-field topics"""
+    for key, data in changes:
+        yield f"state:{key}", data
 
 class AppState:
-    def __init__(self):
+    # Events that signal intent, not a change of stored state
+    _NON_MUTATING = frozenset({"clip_triggered", "track_focused"})
+    # Event fields that identify what was written (everything else is the new value)
+    _IDENTITY_FIELDS = ("track", "scene", "send", "device", "param")
+
+    def __init__(self, use_grid_store: bool = False):
         self.m = AppStateModel()
+        self._scene_baseline = self.m.scenes_count  # Last authoritative scene count
+        self.logger = logging.getLogger(__name__)
+        
+        # Optional struct-of-arrays clip grid (O(1) in-place clip updates)
+        self.use_grid_store = use_grid_store
+        self.grid: Optional[ClipGridStore] = None
+        
+        # Dirty-region tracking: every mutation bumps ``version`` and stamps
+        # the cell/track it touched, so consumers can pull changes_since(v)
+        self.version = 0
+        self._cell_versions: Dict[Tuple[int, int], int] = {}
+        self._track_versions: Dict[int, int] = {}
+        self._structure_version = 0
+        self._transport_version = 0
+        self._field_versions: Dict[str, int] = {}  # event key -> last version
+        
+        # Memoized derived values keyed on the field versions above
+        self.selectors = Selectors(self)
+        register_default_selectors(self.selectors)
+        
+        # Undo history of user-originated mixer/device edits (bounded ring)
+        self.journal = DeltaJournal()
+        
+        # Optional shared-memory mirror (see attach_mirror)
+        self.mirror = None
+        
+        # Offline/demo datasets, built once and shared by every screen.
+        # demo_size = (tracks, scenes) serves a synthetic set instead of the built-in demo
+        self.demo_size: Optional[Tuple[int, int]] = None
+        self._demo_sets: Dict[Optional[Tuple[int, int]], DemoSet] = {}
+        
+        # Transactions: while batch() is open, events are merged per field
+        # and published as one ``state:changeset`` on commit
+        self.field_topics = True  # Also replay merged per-field topics on commit
+        self._batch_depth = 0
+        self._batch_changes: Dict[tuple, Tuple[str, Dict[str, Any]]] = {}
+
+    def _attach_grid(self):
+        """Move clip data into the array store and expose per-track views"""
+        if not self.use_grid_store:
+            return
+        tracks = max(self.m.tracks) + 1 if self.m.tracks else 0
+        self.grid = ClipGridStore(tracks, self.m.scenes_count)
+        for track_id, track in self.m.tracks.items():
+            for scene_id, clip in track.clips.items():
+                if scene_id < self.m.scenes_count:
+                    self.grid.set_clip(track_id, scene_id, clip)
+            track.clips = self.grid.track_view(track_id)
 
     def _emit(self, key, **data):
         """Proxy event emission through the global bus.
@@ -23,16 +87,101 @@ class AppState:
         ``on_volume(track, value)`` fail with ``TypeError``.  Expanding ``data``
         fixes the issue so callbacks receive named arguments.
         """
+        self._mark_dirty(key, data)
+        if self._batch_depth and key not in self._NON_MUTATING:
+            # Same field written twice in one batch: last write wins
+            field_key = (key, *(data.get(name) for name in self._IDENTITY_FIELDS))
+            self._batch_changes.pop(field_key, None)  # Keep commit order = last write order
+            self._batch_changes[field_key] = (key, data)
+            return
         bus.emit(f"state:{key}", **data)
 
+    @contextmanager
+    def batch(self):
+        """Defer notifications and publish one merged changeset on exit"""
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth:
+                self._commit_batch()
+
+    def _commit_batch(self):
+        if not self._batch_changes:
+            return
+        changes = tuple(self._batch_changes.values())
+        self._batch_changes = {}
+        bus.emit("state:changeset", version=self.version, changes=changes)
+        if self.field_topics:
+            for topic, data in changeset_field_events(changes):
+                bus.emit(topic, **data)
+
+    def _mark_dirty(self, key, data):
+        """Stamp the region touched by a state event with a new version"""
+        if key in self._NON_MUTATING:
+            return
+        self.version += 1
+        self._field_versions[key] = self.version
+        if key == "tracks_changed":
+            self._structure_version = self.version
+            self._cell_versions.clear()
+            self._track_versions.clear()
+        elif "scene" in data:
+            self._cell_versions[(data["track"], data["scene"])] = self.version
+        elif "track" in data:
+            self._track_versions[data["track"]] = self.version
+        else:
+            self._transport_version = self.version
+
+    @property
+    def structure_version(self) -> int:
+        return self._structure_version
+
+    def field_version(self, key: str) -> int:
+        """Version of the last write to a field (by event key)"""
+        return self._field_versions.get(key, 0)
+
+    def changes_since(self, version: int) -> StateChanges:
+        """Compact dirty sets for everything modified after ``version``"""
+        if self._structure_version > version:
+            return StateChanges(version=self.version, structure=True)
+        if version >= self.version:
+            return StateChanges(version=self.version)
+        return StateChanges(
+            version=self.version,
+            cells=frozenset(k for k, v in self._cell_versions.items() if v > version),
+            tracks=frozenset(k for k, v in self._track_versions.items() if v > version),
+            transport=self._transport_version > version,
+        )
+
+    def attach_mirror(self, mirror, interval: float = 1 / 60.0):
+        """Publish grid/mixer into a SharedStateMirror for hardware processes"""
+        self.mirror = mirror
+        mirror.attach(self, interval)
+
+    def demo_set(self, tracks: Optional[int] = None, scenes: Optional[int] = None) -> DemoSet:
+        """Shared read-only demo dataset (``demo_size`` unless a size is given)"""
+        size = (tracks, scenes) if tracks is not None and scenes is not None else self.demo_size
+        demo = self._demo_sets.get(size)
+        if demo is None:
+            demo = self._demo_sets[size] = demo_set_for(size)
+        return demo
+
+    def load_demo_set(self, tracks: Optional[int] = None, scenes: Optional[int] = None) -> DemoSet:
+        """Replace the project with a demo dataset (offline mode / perf testing)"""
+        demo = self.demo_set(tracks, scenes)
+        demo.apply_to(self)
+        return demo
+
     def init_project(self, tracks=8, scenes=8):
         """Initialize project with tracks and scenes"""
-        self.m.scenes_count = scenes
+        self.m.scenes_count = self._scene_baseline = scenes
         self.m.tracks = {}
         
         for t in range(tracks):
             # Create clips for this track
-            clips_dict = {s: ClipSlotState() for s in range(scenes)}
+            clips_dict = dict.fromkeys(range(scenes), EMPTY_CLIP)
             
             # Create track with all data
             tr = TrackState(
@@ -42,16 +191,17 @@ class AppState:
             )
             self.m.tracks[t] = tr
             
+        self._attach_grid()
         self._emit("tracks_changed", tracks=self.m.tracks)
 
     def init_project_from_live(self, track_names: list, scenes=12):
         """Initialize project dynamically from Live track data"""
-        self.m.scenes_count = scenes
+        self.m.scenes_count = self._scene_baseline = scenes
         self.m.tracks = {}
         
         for track_id, track_name in enumerate(track_names):
             # Create clips for this track
-            clips_dict = {s: ClipSlotState() for s in range(scenes)}
+            clips_dict = dict.fromkeys(range(scenes), EMPTY_CLIP)
             
             # Create track with Live data
             tr = TrackState(
@@ -61,21 +211,75 @@ class AppState:
             )
             self.m.tracks[track_id] = tr
             
+        self._attach_grid()
         self._emit("tracks_changed", tracks=self.m.tracks)
         self.logger.info(f"✅ App state initialized with {len(track_names)} tracks from Live")
 
+    def set_scenes_count(self, scenes: int):
+        """Live reported its scene count: resize every track's clip row"""
+        if scenes < 0:
+            return
+        self._scene_baseline = scenes
+        self._resize_scenes(scenes)
+
+    def _resize_scenes(self, scenes: int):
+        """Resize every track's clip row (structure change)"""
+        if scenes == self.m.scenes_count:
+            return
+        self.m.scenes_count = scenes
+        if self.grid is not None:
+            # Track views read the store shape, so they follow the resize
+            self.grid.resize(self.grid.shape[0], scenes)
+        else:
+            for track in self.m.tracks.values():
+                clips = {s: c for s, c in track.clips.items() if s < scenes}
+                for scene_id in range(scenes):
+                    clips.setdefault(scene_id, EMPTY_CLIP)
+                track.clips = clips
+        self._emit("tracks_changed", tracks=self.m.tracks)
+
+    def _ensure_scene(self, scene_id: int) -> bool:
+        """Grow the grid for a scene beyond the known count (num_scenes not seen yet).
+
+        Growth is capped at SCENE_GROWTH_MARGIN past the last authoritative
+        count, so a corrupt scene index cannot allocate a huge grid.
+        """
+        if scene_id < 0 or scene_id >= self._scene_baseline + SCENE_GROWTH_MARGIN:
+            self.logger.warning(f"Ignoring clip update for out-of-range scene {scene_id}")
+            return False
+        if scene_id >= self.m.scenes_count:
+            self._resize_scenes(scene_id + 1)
+        return True
+
+    def _clip_status(self, status: str) -> str:
+        """Validate a status string from Live; unknown values are treated as empty"""
+        if status in _CLIP_STATUSES:
+            return status
+        self.logger.warning(f"Unknown clip status {status!r}, treating as empty")
+        return ClipStatus.EMPTY.value
+
+    def restore_model(self, model: AppStateModel):
+        """Replace the whole model (e.g. from a warm-start snapshot)"""
+        self.m = model
+        self._scene_baseline = model.scenes_count
+        self._attach_grid()
+        self._emit("tracks_changed", tracks=self.m.tracks)
+
     def set_clip_status(self, track_id: int, scene_id: int, status: str):
         """Update clip status creating new immutable objects"""
+        status = self._clip_status(status)
+        if self.grid is not None:
+            if track_id in self.m.tracks and self._ensure_scene(scene_id):
+                self.grid.set_status(track_id, scene_id, status)
+                self._emit("clip_changed", track=track_id, scene=scene_id, status=status)
+            return
+        
         if track_id in self.m.tracks:
             old_track = self.m.tracks[track_id]
-            old_clip = old_track.clips.get(scene_id, ClipSlotState())
+            old_clip = old_track.clips.get(scene_id, EMPTY_CLIP)
             
             # Create new clip with updated status
-            new_clip = ClipSlotState(
-                status=ClipStatus(status),
-                name=old_clip.name,
-                color=old_clip.color
-            )
+            new_clip = clip_slot(status, old_clip.name, old_clip.color)
             
             # Create new clips dict
             new_clips = old_track.clips.copy()
@@ -86,6 +290,8 @@ class AppState:
                 id=old_track.id,
                 name=old_track.name,
                 clips=new_clips,
+                color=old_track.color,
+                devices=old_track.devices,
                 volume=old_track.volume,
                 pan=old_track.pan,
                 sends=old_track.sends,
@@ -98,44 +304,143 @@ class AppState:
             self.m.tracks[track_id] = new_track
             self._emit("clip_changed", track=track_id, scene=scene_id, status=status)
 
+    def set_clip_name(self, track_id: int, scene_id: int, name: str):
+        """Update clip name keeping the clip immutable"""
+        if self.grid is not None:
+            if track_id in self.m.tracks and self._ensure_scene(scene_id):
+                self.grid.set_name(track_id, scene_id, name)
+                self._emit("clip_name", track=track_id, scene=scene_id, name=name)
+            return
+        
+        if track_id in self.m.tracks:
+            track = self.m.tracks[track_id]
+            old_clip = track.clips.get(scene_id, EMPTY_CLIP)
+            new_clips = track.clips.copy()
+            new_clips[scene_id] = clip_slot(old_clip.status, name, old_clip.color)
+            self.m.tracks[track_id] = replace(track, clips=new_clips)
+            self._emit("clip_name", track=track_id, scene=scene_id, name=name)
+
+    def set_track_color(self, track_index: int, color: tuple):
+        if track_index in self.m.tracks:
+            self.m.tracks[track_index].color = intern_color(color)
+            self._emit("track_color", track=track_index, color=color)
+
+    # transport
+    def set_tempo(self, bpm: float):
+        self.m.transport.tempo = bpm
+        self._emit("tempo", bpm=bpm)
+
+    def set_playing(self, playing: bool):
+        self.m.transport.playing = bool(playing)
+        self._emit("transport", playing=bool(playing))
+
     # mixer
     def set_volume(self, t:int, v:float):
         v = max(0.0, min(1.0, v))
         self.m.tracks[t].volume = v
         self._emit("track_volume", track=t, value=v)
     
-    def set_track_volume(self, track_index: int, value: float):
+    def set_track_volume(self, track_index: int, value: float, user: bool = False):
         if track_index in self.m.tracks:
-            self.m.tracks[track_index].volume = value
+            track = self.m.tracks[track_index]
+            if user:
+                self.journal.record("volume", track_index, track.volume, value)
+            track.volume = value
             self._emit("track_volume", track=track_index, value=value)
     
-    def set_track_pan(self, track_index: int, value: float):
+    def set_track_pan(self, track_index: int, value: float, user: bool = False):
         if track_index in self.m.tracks:
-            self.m.tracks[track_index].pan = value
+            track = self.m.tracks[track_index]
+            if user:
+                self.journal.record("pan", track_index, track.pan, value)
+            track.pan = value
             self._emit("track_pan", track=track_index, value=value)
     
-    def set_track_send(self, track_index: int, send: str, value: float):
+    def set_track_send(self, track_index: int, send: str, value: float, user: bool = False):
         if track_index in self.m.tracks:
             send_map = {"A": 0, "B": 1, "C": 2}
             if send in send_map:
-                self.m.tracks[track_index].sends[send_map[send]] = value
+                sends = self.m.tracks[track_index].sends
+                if user:
+                    self.journal.record("send", track_index, sends[send_map[send]], value,
+                                        sub=send_map[send])
+                sends[send_map[send]] = value
                 self._emit("track_send", track=track_index, send=send, value=value)
     
-    def set_track_mute(self, track_index: int, value: int):
+    def set_track_mute(self, track_index: int, value: int, user: bool = False):
         if track_index in self.m.tracks:
-            self.m.tracks[track_index].mute = bool(value)
+            track = self.m.tracks[track_index]
+            if user:
+                self.journal.record("mute", track_index, float(track.mute), float(bool(value)))
+            track.mute = bool(value)
             self._emit("track_mute", track=track_index, value=value)
     
-    def set_track_solo(self, track_index: int, value: int):
+    def set_track_solo(self, track_index: int, value: int, user: bool = False):
         if track_index in self.m.tracks:
-            self.m.tracks[track_index].solo = bool(value)
+            track = self.m.tracks[track_index]
+            if user:
+                self.journal.record("solo", track_index, float(track.solo), float(bool(value)))
+            track.solo = bool(value)
             self._emit("track_solo", track=track_index, value=value)
     
-    def set_track_arm(self, track_index: int, value: int):
+    def set_track_arm(self, track_index: int, value: int, user: bool = False):
         if track_index in self.m.tracks:
-            self.m.tracks[track_index].arm = bool(value)
+            track = self.m.tracks[track_index]
+            if user:
+                self.journal.record("arm", track_index, float(track.arm), float(bool(value)))
+            track.arm = bool(value)
             self._emit("track_arm", track=track_index, value=value)
     
+    # devices
+    def set_track_devices(self, track_index: int, devices: List[str]):
+        if track_index in self.m.tracks:
+            self.m.tracks[track_index].devices = list(devices)
+            self._emit("track_devices", track=track_index, devices=list(devices))
+
+    def set_device_parameter(self, track_index: int, device: int, param: int, value: float,
+                             user: bool = False, previous: Optional[float] = None):
+        """Store a device parameter value (``previous`` seeds undo on first edit)"""
+        key = (track_index, device, param)
+        old = self.m.device_params.get(key, value if previous is None else previous)
+        if user:
+            self.journal.record("device_parameter", track_index, old, value, sub=device, param=param)
+        self.m.device_params[key] = value
+        self._emit("device_parameter", track=track_index, device=device, param=param, value=value)
+    
+    # undo / redo
+    def undo(self) -> List[Delta]:
+        """Revert the last user edit group; returns the reverted deltas"""
+        deltas = self.journal.undo()
+        with self.batch():
+            for delta in deltas:
+                self._apply_delta(delta, delta.old)
+        return deltas
+    
+    def redo(self) -> List[Delta]:
+        """Re-apply the last undone edit group"""
+        deltas = self.journal.redo()
+        with self.batch():
+            for delta in deltas:
+                self._apply_delta(delta, delta.new)
+        return deltas
+    
+    def _apply_delta(self, delta: Delta, value: float):
+        field, track = delta.field, delta.track
+        if field == "volume":
+            self.set_track_volume(track, value)
+        elif field == "pan":
+            self.set_track_pan(track, value)
+        elif field == "send":
+            self.set_track_send(track, "ABC"[delta.sub], value)
+        elif field == "mute":
+            self.set_track_mute(track, int(value))
+        elif field == "solo":
+            self.set_track_solo(track, int(value))
+        elif field == "arm":
+            self.set_track_arm(track, int(value))
+        elif field == "device_parameter":
+            self.set_device_parameter(track, delta.sub, delta.param, value)
+    
     def trigger_clip(self, track_index: int, scene_index: int):
         """Handle clip triggering"""
         if track_index in self.m.tracks and scene_index < self.m.scenes_count:
@@ -0,0 +1,120 @@
+"""Shared, immutable demo / offline datasets.
+
+Screens fall back to demo tracks when Live is not connected. Instead of
+every screen rebuilding its own lists of dicts on each focus or populate
+call, ``AppState.demo_set()`` builds a ``DemoSet`` once and serves the
+same read-only instance to everyone. ``synthetic_set()`` generates larger
+deterministic sets (e.g. 128 x 32) for performance testing of each screen.
+"""
+from functools import lru_cache
+from random import Random
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Tuple
+
+# The classic 10-track demo (formerly duplicated in ClipView and MixerView)
+DEMO_TRACKS: Tuple[Tuple[str, Tuple[float, float, float, float]], ...] = (
+    ("Kick", (0, 0.016, 1, 1)),
+    ("Hats", (0, 1, 0.05, 1)),
+    ("Bass", (1, 0.6, 0, 1)),
+    ("Tom", (1, 0.85, 0, 1)),
+    ("FX", (1, 0, 0.48, 1)),
+    ("Pad", (0, 1, 0.97, 1)),
+    ("Lead", (1, 0.57, 0, 1)),
+    ("Keys", (0, 0.016, 1, 1)),
+    ("Perc", (0.8, 0.2, 0.8, 1)),
+    ("Vocal", (0.2, 0.8, 0.2, 1)),
+)
+DEMO_SCENES = 12
+# (track, scene) -> (status, name)
+DEMO_CLIPS = {
+    (0, 0): ("playing", "Kick Loop"),
+    (1, 1): ("queued", "Hats Pattern"),
+    (2, 2): ("empty", "Bass Line"),
+    (3, 0): ("playing", "Tom Beat"),
+    (8, 0): ("playing", "Perc Loop"),
+    (9, 1): ("queued", "Vocal Chop"),
+}
+
+PALETTE = tuple(color for _, color in DEMO_TRACKS[:8])
+
+
+def _clip(status: str = "empty", name: str = "") -> Mapping:
+    return MappingProxyType({"status": status, "name": name,
+                             "has_content": bool(name) or status != "empty"})
+
+
+# Flyweight for every empty cell of every set
+EMPTY_DEMO_CLIP = _clip()
+
+
+class DemoSet:
+    """Read-only tracks in the screens' ``{"name", "color", "clips"}`` format"""
+    __slots__ = ("tracks", "scenes")
+
+    def __init__(self, tracks: Tuple[Mapping, ...], scenes: int):
+        self.tracks = tracks
+        self.scenes = scenes
+
+    def __len__(self) -> int:
+        return len(self.tracks)
+
+    def names(self) -> List[str]:
+        return [t["name"] for t in self.tracks]
+
+    def mutable_tracks(self) -> List[Dict]:
+        """Private editable copy for a screen that applies live updates on top"""
+        return [{"name": t["name"], "color": t["color"],
+                 "clips": [dict(c) for c in t["clips"]]} for t in self.tracks]
+
+    def apply_to(self, app_state):
+        """Load the set into AppState as one changeset"""
+        with app_state.batch():
+            app_state.init_project_from_live(self.names(), scenes=self.scenes)
+            for t, track in enumerate(self.tracks):
+                app_state.set_track_color(t, track["color"])
+                for s, clip in enumerate(track["clips"]):
+                    if clip is EMPTY_DEMO_CLIP:
+                        continue
+                    if clip["name"]:
+                        app_state.set_clip_name(t, s, clip["name"])
+                    if clip["status"] != "empty":
+                        app_state.set_clip_status(t, s, clip["status"])
+
+
+def _freeze(tracks: List[Tuple[str, tuple, List[Mapping]]], scenes: int) -> DemoSet:
+    return DemoSet(tuple(MappingProxyType({"name": name, "color": color, "clips": tuple(clips)})
+                         for name, color, clips in tracks), scenes)
+
+
+@lru_cache(maxsize=1)
+def builtin_set() -> DemoSet:
+    """The 10 x 12 demo the UI shows when Live is offline (one shared instance)"""
+    tracks = []
+    for t, (name, color) in enumerate(DEMO_TRACKS):
+        clips = [_clip(*DEMO_CLIPS[(t, s)]) if (t, s) in DEMO_CLIPS else EMPTY_DEMO_CLIP
+                 for s in range(DEMO_SCENES)]
+        tracks.append((name, color, clips))
+    return _freeze(tracks, DEMO_SCENES)
+
+
+def synthetic_set(tracks: int, scenes: int, fill: float = 0.25, playing: float = 0.05,
+                  seed: int = 0) -> DemoSet:
+    """Deterministic tracks x scenes set with ``fill`` of cells holding clips"""
+    rng = Random(seed)
+    result = []
+    for t in range(tracks):
+        clips = []
+        for s in range(scenes):
+            roll = rng.random()
+            if roll >= fill:
+                clips.append(EMPTY_DEMO_CLIP)
+            else:
+                status = "playing" if roll < playing else "empty"
+                clips.append(_clip(status, f"Clip {t + 1}.{s + 1}"))
+        result.append((f"Track {t + 1}", PALETTE[t % len(PALETTE)], clips))
+    return _freeze(result, scenes)
+
+
+def demo_set_for(size: Optional[Tuple[int, int]] = None) -> DemoSet:
+    """Built-in demo, or a synthetic (tracks, scenes) set"""
+    return builtin_set() if size is None else synthetic_set(*size)
@@ -0,0 +1,148 @@
+"""Struct-of-arrays clip grid backed by NumPy.
+
+Each clip attribute is a dense ``tracks x scenes`` array, so an update is an
+in-place O(1) write and grid-wide questions ("what is playing in scene 5?")
+are single vectorized expressions instead of walks over TrackState dicts.
+"""
+from collections.abc import Mapping
+from typing import Dict, Iterator, List, Tuple
+
+import numpy as np
+
+from .models import DEFAULT_COLOR, ClipSlotState, ClipStatus, clip_slot
+
+# Stable status codes for the uint8 status array
+STATUS_CODES: Dict[str, int] = {"empty": 0, "playing": 1, "queued": 2, "recording": 3}
+CODE_STATUSES: List[ClipStatus] = [ClipStatus.EMPTY, ClipStatus.PLAYING,
+                                   ClipStatus.QUEUED, ClipStatus.RECORDING]
+
+
+def pack_color(rgba) -> int:
+    """RGBA floats -> RGBA8888"""
+    r, g, b, a = (max(0, min(255, int(round(c * 255)))) for c in rgba)
+    return (r << 24) | (g << 16) | (b << 8) | a
+
+
+def unpack_color(value: int) -> Tuple[float, float, float, float]:
+    value = int(value)
+    return ((value >> 24 & 0xFF) / 255.0, (value >> 16 & 0xFF) / 255.0,
+            (value >> 8 & 0xFF) / 255.0, (value & 0xFF) / 255.0)
+
+
+class ClipGridStore:
+    """Dense tracks x scenes clip grid"""
+
+    def __init__(self, tracks: int = 0, scenes: int = 0):
+        self.names: List[str] = [""]          # Interned clip names, index 0 = no name
+        self._name_index: Dict[str, int] = {"": 0}
+        self._default_color = pack_color(DEFAULT_COLOR)
+        self._allocate(tracks, scenes)
+
+    def _allocate(self, tracks: int, scenes: int):
+        shape = (tracks, scenes)
+        self.status = np.zeros(shape, dtype=np.uint8)
+        self.color = np.full(shape, self._default_color, dtype=np.uint32)
+        self.has_content = np.zeros(shape, dtype=bool)
+        self.name_idx = np.zeros(shape, dtype=np.uint32)
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return self.status.shape
+
+    def resize(self, tracks: int, scenes: int):
+        """Grow/shrink keeping the overlapping region"""
+        old = (self.status, self.color, self.has_content, self.name_idx)
+        t, s = min(tracks, self.shape[0]), min(scenes, self.shape[1])
+        self._allocate(tracks, scenes)
+        for new, prev in zip((self.status, self.color, self.has_content, self.name_idx), old):
+            new[:t, :s] = prev[:t, :s]
+
+    def intern(self, name: str) -> int:
+        idx = self._name_index.get(name)
+        if idx is None:
+            idx = self._name_index[name] = len(self.names)
+            self.names.append(name)
+        return idx
+
+    # === O(1) IN-PLACE UPDATES ===
+
+    def set_status(self, track: int, scene: int, status: str):
+        self.status[track, scene] = STATUS_CODES[status]
+        if status != "empty":
+            self.has_content[track, scene] = True
+
+    def set_name(self, track: int, scene: int, name: str):
+        self.name_idx[track, scene] = self.intern(name)
+
+    def set_color(self, track: int, scene: int, rgba):
+        self.color[track, scene] = pack_color(rgba)
+
+    def set_has_content(self, track: int, scene: int, has_content: bool):
+        self.has_content[track, scene] = has_content
+
+    def set_clip(self, track: int, scene: int, clip: ClipSlotState):
+        self.status[track, scene] = STATUS_CODES[clip.status.value]
+        self.name_idx[track, scene] = self.intern(clip.name)
+        self.color[track, scene] = pack_color(clip.color)
+        self.has_content[track, scene] = bool(clip.name) or clip.status.value != "empty"
+
+    def get_clip(self, track: int, scene: int) -> ClipSlotState:
+        """Materialize one cell as the classic immutable ClipSlotState"""
+        return clip_slot(CODE_STATUSES[self.status[track, scene]],
+                         self.names[self.name_idx[track, scene]],
+                         unpack_color(self.color[track, scene]))
+
+    # === VECTORIZED QUERIES ===
+
+    def tracks_with_status_in_scene(self, scene: int, status: str = "playing") -> np.ndarray:
+        """Track ids whose clip in ``scene`` has ``status``"""
+        return np.flatnonzero(self.status[:, scene] == STATUS_CODES[status])
+
+    def tracks_with_any(self, status: str = "queued") -> np.ndarray:
+        """Track ids with at least one clip in ``status``"""
+        return np.flatnonzero((self.status == STATUS_CODES[status]).any(axis=1))
+
+    def cells_with_status(self, status: str) -> np.ndarray:
+        """(N, 2) array of (track, scene) in ``status``"""
+        return np.argwhere(self.status == STATUS_CODES[status])
+
+    def playing_scene_per_track(self) -> np.ndarray:
+        """Scene playing on each track, -1 when none"""
+        playing = self.status == STATUS_CODES["playing"]
+        return np.where(playing.any(axis=1), playing.argmax(axis=1), -1)
+
+    def fully_playing_scenes(self) -> np.ndarray:
+        """Scenes where every clip with content is playing"""
+        playing = self.status == STATUS_CODES["playing"]
+        idle_content = self.has_content & ~playing
+        return np.flatnonzero(playing.any(axis=0) & ~idle_content.any(axis=0))
+
+    def track_view(self, track: int) -> "GridClipsView":
+        return GridClipsView(self, track)
+
+
+class GridClipsView(Mapping):
+    """Read-only ``{scene: ClipSlotState}`` view over one track row
+
+    Lets ``TrackState.clips`` keep working for existing consumers while the
+    data lives in the arrays.
+    """
+    __slots__ = ("_store", "_track")
+
+    def __init__(self, store: ClipGridStore, track: int):
+        self._store = store
+        self._track = track
+
+    def __getitem__(self, scene: int) -> ClipSlotState:
+        if not 0 <= scene < self._store.shape[1]:
+            raise KeyError(scene)
+        return self._store.get_clip(self._track, scene)
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(range(self._store.shape[1]))
+
+    def __len__(self) -> int:
+        return self._store.shape[1]
+
+    def copy(self) -> Dict[int, ClipSlotState]:
+        return dict(self.items())
@@ -0,0 +1,171 @@
+"""Bounded binary journal of user edits with undo/redo.
+
+Every user-originated mixer/device mutation is packed into a fixed-size
+record ``(field, track, sub, param, old, new, timestamp, group)`` inside a
+preallocated ring, so memory stays constant however long the set runs.
+Consecutive drags of the same continuous control are coalesced into one
+record that keeps the original ``old`` value.
+"""
+from contextlib import contextmanager
+from typing import List, NamedTuple, Optional
+import struct
+import time
+
+# Field ids stored in the record's first byte
+FIELD_IDS = {"volume": 1, "pan": 2, "send": 3, "mute": 4, "solo": 5, "arm": 6,
+             "device_parameter": 7}
+FIELD_NAMES = {v: k for k, v in FIELD_IDS.items()}
+
+# Continuous controls whose consecutive edits merge into one undo step
+COALESCED_FIELDS = frozenset({"volume", "pan", "send", "device_parameter"})
+
+# field, track, sub (send index / device), param, old, new, timestamp, group
+_RECORD = struct.Struct("<BhhHffdI")
+
+
+class Delta(NamedTuple):
+    field: str
+    track: int
+    sub: int
+    param: int
+    old: float
+    new: float
+    timestamp: float
+    group: int
+
+
+class DeltaJournal:
+    """Fixed-capacity ring of packed edit records"""
+
+    def __init__(self, capacity: int = 4096, coalesce_window: float = 0.5,
+                 time_fn=time.monotonic):
+        self.capacity = capacity
+        self.coalesce_window = coalesce_window
+        self.time_fn = time_fn
+        self._buf = bytearray(capacity * _RECORD.size)
+
+        self._start = 0   # Absolute index of the oldest record still in the ring
+        self._cursor = 0  # Absolute index one past the last applied record
+        self._end = 0     # Absolute index one past the last record (redo tail)
+        self._next_group = 1
+        self._open_group: Optional[int] = None
+        self._sealed = True  # Last record may not be coalesced into
+
+        # Statistics
+        self.recorded = 0
+        self.coalesced = 0
+        self.dropped = 0
+
+    @property
+    def nbytes(self) -> int:
+        return len(self._buf)
+
+    def __len__(self) -> int:
+        return self._end - self._start
+
+    def _read(self, index: int) -> Delta:
+        field, track, sub, param, old, new, ts, group = _RECORD.unpack_from(
+            self._buf, (index % self.capacity) * _RECORD.size)
+        return Delta(FIELD_NAMES[field], track, sub, param, old, new, ts, group)
+
+    def _write(self, index: int, delta: Delta):
+        _RECORD.pack_into(self._buf, (index % self.capacity) * _RECORD.size,
+                          FIELD_IDS[delta.field], delta.track, delta.sub, delta.param,
+                          delta.old, delta.new, delta.timestamp, delta.group)
+
+    # === RECORDING ===
+
+    def record(self, field: str, track: int, old: float, new: float,
+               sub: int = 0, param: int = 0):
+        """Append one user edit (no-op when the value did not change)"""
+        if old == new:
+            return
+        now = self.time_fn()
+
+        if field in COALESCED_FIELDS and not self._sealed and self._cursor > self._start:
+            last = self._read(self._cursor - 1)
+            if ((last.field, last.track, last.sub, last.param) == (field, track, sub, param)
+                    and now - last.timestamp <= self.coalesce_window
+                    and (self._open_group is None or last.group == self._open_group)):
+                self._write(self._cursor - 1, last._replace(new=new, timestamp=now))
+                self._end = self._cursor  # A new edit invalidates redo
+                self.coalesced += 1
+                return
+
+        group = self._open_group
+        if group is None:
+            group = self._next_group
+            self._next_group += 1
+
+        self._end = self._cursor  # Drop the redo tail
+        if self._end - self._start >= self.capacity:
+            self._start += 1
+            self.dropped += 1
+        self._write(self._end, Delta(field, track, sub, param, old, new, now, group))
+        self._end += 1
+        self._cursor = self._end
+        self._sealed = False
+        self.recorded += 1
+
+    @contextmanager
+    def group(self):
+        """Record several edits as a single undo step"""
+        if self._open_group is not None:
+            yield  # Nested: join the outer group
+            return
+        self._open_group = self._next_group
+        self._next_group += 1
+        self._sealed = True
+        try:
+            yield
+        finally:
+            self._open_group = None
+            self._sealed = True
+
+    # === UNDO / REDO ===
+
+    def undo(self) -> List[Delta]:
+        """Step back one group; returns its deltas newest first"""
+        if self._cursor <= self._start:
+            return []
+        group = self._read(self._cursor - 1).group
+        deltas = []
+        while self._cursor > self._start:
+            delta = self._read(self._cursor - 1)
+            if delta.group != group:
+                break
+            deltas.append(delta)
+            self._cursor -= 1
+        self._sealed = True
+        return deltas
+
+    def redo(self) -> List[Delta]:
+        """Re-apply the next undone group; returns its deltas oldest first"""
+        if self._cursor >= self._end:
+            return []
+        group = self._read(self._cursor).group
+        deltas = []
+        while self._cursor < self._end:
+            delta = self._read(self._cursor)
+            if delta.group != group:
+                break
+            deltas.append(delta)
+            self._cursor += 1
+        self._sealed = True
+        return deltas
+
+    def can_undo(self) -> bool:
+        return self._cursor > self._start
+
+    def can_redo(self) -> bool:
+        return self._cursor < self._end
+
+    def get_stats(self) -> dict:
+        return {
+            "records": len(self),
+            "capacity": self.capacity,
+            "bytes": self.nbytes,
+            "recorded": self.recorded,
+            "coalesced": self.coalesced,
+            "dropped": self.dropped,
+        }
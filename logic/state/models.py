@@ -1,6 +1,26 @@
 from dataclasses import dataclass, field
-from typing import Dict, Optional
+from typing import Dict, FrozenSet, List, Optional, Tuple
 from enum import Enum
+import sys
+
+from ..cache import BoundedCache
+
+# __slots__ dataclasses drop the per-instance __dict__ (Python 3.10+)
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+DEFAULT_COLOR = (0.25, 0.25, 0.25, 1.0)
+
+# Shared color tuples: thousands of cells reuse a handful of palette colors.
+# LRU-bounded, so arbitrary RGB values from Live are not pinned forever;
+# an evicted color stays valid where it is used, it is just no longer shared.
+_COLOR_POOL = BoundedCache("color_pool", max_entries=1024)
+
+def intern_color(rgba) -> tuple:
+    """Return the shared instance of an RGBA tuple"""
+    rgba = tuple(rgba)
+    if rgba == DEFAULT_COLOR:
+        return DEFAULT_COLOR  # Identity is relied on by clip_slot()
+    return _COLOR_POOL.get_or_compute(rgba, lambda: rgba)
 
 class ClipStatus(Enum):
     EMPTY = "empty"
@@ -8,21 +28,34 @@ class ClipStatus(Enum):
     QUEUED = "queued"
     RECORDING = "recording"
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_SLOTS)
 class ClipSlotState:
     status: ClipStatus = ClipStatus.EMPTY
     name: str = ""
-    color: tuple[float, float, float, float] = (0.25, 0.25, 0.25, 1.0)
+    color: tuple[float, float, float, float] = DEFAULT_COLOR
 
     @property
     def is_playing(self) -> bool:
         return self.status == ClipStatus.PLAYING
 
-@dataclass
+# Flyweight shared by every empty cell
+EMPTY_CLIP = ClipSlotState()
+
+def clip_slot(status=ClipStatus.EMPTY, name: str = "", color=DEFAULT_COLOR) -> ClipSlotState:
+    """Build a clip with interned status/name/color (EMPTY_CLIP when blank)"""
+    status = ClipStatus(status)
+    color = intern_color(color)
+    if status is ClipStatus.EMPTY and not name and color is DEFAULT_COLOR:
+        return EMPTY_CLIP
+    return ClipSlotState(status=status, name=sys.intern(name), color=color)
+
+@dataclass(**_SLOTS)
 class TrackState:
     id: int
     name: str
     clips: Dict[int, ClipSlotState] = field(default_factory=dict)
+    color: tuple[float, float, float, float] = DEFAULT_COLOR
+    devices: List[str] = field(default_factory=list)
     volume: float = field(default=0.8)
     pan: float = field(default=0.0)
     sends: list[float] = field(default_factory=lambda: [0.0, 0.0, 0.0])
@@ -34,16 +67,30 @@ class TrackState:
         if not 0 <= self.volume <= 1:
             raise ValueError("Volume must be between 0 and 1")
 
-@dataclass
+@dataclass(**_SLOTS)
 class TransportState:
     playing: bool = False
     recording: bool = False
     loop: bool = False
     tempo: float = 120.0
 
-@dataclass
+@dataclass(**_SLOTS)
 class AppStateModel:
     tracks: Dict[int, TrackState] = field(default_factory=dict)
     scenes_count: int = 8
     current_track: int = 0
-    transport: TransportState = field(default_factory=TransportState)
\ No newline at end of file
+    transport: TransportState = field(default_factory=TransportState)
+    device_params: Dict[Tuple[int, int, int], float] = field(default_factory=dict)  # (track, device, param)
+
+@dataclass(frozen=True)
+class StateChanges:
+    """What changed since a consumer's last seen version"""
+    version: int
+    cells: FrozenSet[Tuple[int, int]] = frozenset()  # (track, scene) clip cells
+    tracks: FrozenSet[int] = frozenset()              # track-level fields (mixer, name, color)
+    structure: bool = False                           # layout replaced: repaint everything
+    transport: bool = False
+
+    @property
+    def empty(self) -> bool:
+        return not (self.cells or self.tracks or self.structure or self.transport)
@@ -0,0 +1,123 @@
+"""Memoized derived state.
+
+A selector is declared once with the AppState fields (event keys such as
+``clip_changed`` or ``track_solo``) it reads. Its value is cached together
+with the versions of those fields and recomputed only when one of them has
+moved, so every consumer shares one answer instead of rescanning the grid.
+"""
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Optional, Tuple
+import logging
+
+from .models import ClipStatus
+
+
+@dataclass
+class Selector:
+    """One declared derived value"""
+    name: str
+    fields: Tuple[str, ...]             # AppState event keys this value reads
+    compute: Callable[[Any], Any]       # compute(app_state) -> immutable value
+    uses: Tuple[str, ...] = ()          # Other selectors this one is built from
+    value: Any = None
+    key: Optional[tuple] = None         # Input versions the cached value was built from
+    hits: int = 0
+    misses: int = 0
+
+
+class Selectors:
+    """Registry and cache of derived values over one AppState"""
+
+    def __init__(self, app_state):
+        self.app_state = app_state
+        self.logger = logging.getLogger(__name__)
+        self._selectors: Dict[str, Selector] = {}
+
+    def define(self, name: str, fields, compute: Callable[[Any], Any], uses=()):
+        """Declare a derived value and the fields/selectors it depends on"""
+        for dep in uses:
+            if dep not in self._selectors:
+                raise KeyError(f"Selector '{name}' uses undefined selector '{dep}'")
+        self._selectors[name] = Selector(name, tuple(fields), compute, tuple(uses))
+
+    def _input_key(self, selector: Selector) -> tuple:
+        state = self.app_state
+        key = (state.structure_version,) + tuple(state.field_version(f) for f in selector.fields)
+        for dep in selector.uses:
+            key += self._input_key(self._selectors[dep])
+        return key
+
+    def get(self, name: str) -> Any:
+        """Cached value, recomputed only if an input version changed"""
+        selector = self._selectors[name]
+        key = self._input_key(selector)
+        if key == selector.key:
+            selector.hits += 1
+            return selector.value
+        selector.misses += 1
+        selector.value = selector.compute(self.app_state)
+        selector.key = key
+        return selector.value
+
+    def dependencies(self, name: str) -> Tuple[str, ...]:
+        """All state fields a selector transitively depends on"""
+        selector = self._selectors[name]
+        fields = list(selector.fields)
+        for dep in selector.uses:
+            fields.extend(f for f in self.dependencies(dep) if f not in fields)
+        return tuple(fields)
+
+    def get_stats(self) -> Dict[str, Dict[str, int]]:
+        return {name: {"hits": s.hits, "misses": s.misses}
+                for name, s in self._selectors.items()}
+
+
+# === DEFAULT SELECTORS ===
+
+def _playing_clips(state) -> MappingProxyType:
+    """{track: scene} of the clip playing on each track"""
+    if state.grid is not None:
+        scenes = state.grid.playing_scene_per_track()
+        return MappingProxyType({int(t): int(s) for t, s in enumerate(scenes) if s >= 0})
+    playing = {}
+    for track_id, track in state.m.tracks.items():
+        for scene_id, clip in track.clips.items():
+            if clip.status is ClipStatus.PLAYING:
+                playing[track_id] = scene_id
+                break
+    return MappingProxyType(playing)
+
+
+def _fully_playing_scenes(state) -> Tuple[int, ...]:
+    """Scenes where every clip with content is playing"""
+    if state.grid is not None:
+        return tuple(int(s) for s in state.grid.fully_playing_scenes())
+    scenes = []
+    for scene_id in range(state.m.scenes_count):
+        any_playing, all_playing = False, True
+        for track in state.m.tracks.values():
+            clip = track.clips.get(scene_id)
+            if clip is None:
+                continue
+            if clip.status is ClipStatus.PLAYING:
+                any_playing = True
+            elif clip.name or clip.status is not ClipStatus.EMPTY:
+                all_playing = False
+                break
+        if any_playing and all_playing:
+            scenes.append(scene_id)
+    return tuple(scenes)
+
+
+def _tracks_where(attr: str) -> Callable[[Any], frozenset]:
+    return lambda state: frozenset(t for t, track in state.m.tracks.items() if getattr(track, attr))
+
+
+def register_default_selectors(selectors: Selectors):
+    selectors.define("playing_clips", ("clip_changed",), _playing_clips)
+    selectors.define("fully_playing_scenes", ("clip_changed", "clip_name"), _fully_playing_scenes)
+    selectors.define("soloed_tracks", ("track_solo",), _tracks_where("solo"))
+    selectors.define("any_soloed", (), lambda state: bool(state.selectors.get("soloed_tracks")),
+                     uses=("soloed_tracks",))
+    selectors.define("armed_tracks", ("track_arm",), _tracks_where("arm"))
@@ -0,0 +1,307 @@
+"""Shared-memory mirror of the clip grid and mixer for hardware processes.
+
+The UI process publishes AppState into a ``multiprocessing.shared_memory``
+segment guarded by a seqlock (even sequence = stable, odd = write in
+progress). Out-of-process handlers (Teensy serial, NeoTrellis I2C) map the
+same segment by name, read consistent snapshots without pickling, and push
+button/encoder input back through a single-producer/single-consumer command
+ring that the UI process drains on its own clock.
+
+Layout (all NumPy views over the one buffer)::
+
+    header   uint64[8]   magic, seq, tracks, scenes, max_tracks, max_scenes, ring_capacity, layout
+    status   uint8[max_tracks, max_scenes]    grid_store.STATUS_CODES
+    color    uint32[max_tracks, max_scenes]   RGBA8888
+    volume   float32[max_tracks]
+    pan      float32[max_tracks]
+    flags    uint8[max_tracks]                mute | solo << 1 | arm << 2
+    ring     uint64[16]  head (producer) at 0, tail (consumer) at 8
+    commands COMMAND_DTYPE[ring_capacity]
+"""
+from multiprocessing import shared_memory
+from typing import Dict, List, NamedTuple, Optional
+import logging
+
+import numpy as np
+
+from .grid_store import STATUS_CODES, pack_color
+
+MAGIC = 0x50534853484D0001  # "PSHSHM" + layout 1
+_HEADER_WORDS = 8
+_H_MAGIC, _H_SEQ, _H_TRACKS, _H_SCENES, _H_MAX_TRACKS, _H_MAX_SCENES, _H_RING, _H_LAYOUT = range(8)
+
+# Hardware -> UI commands
+CMD_TRIGGER_CLIP = 1
+CMD_STOP_TRACK = 2
+CMD_VOLUME = 3
+CMD_PAN = 4
+CMD_MUTE = 5
+CMD_SOLO = 6
+CMD_ARM = 7
+
+COMMAND_DTYPE = np.dtype([("cmd", "u1"), ("track", "i2"), ("scene", "i2"), ("value", "f4")])
+
+
+class MirrorSnapshot(NamedTuple):
+    seq: int
+    status: np.ndarray   # (tracks, scenes) uint8
+    color: np.ndarray    # (tracks, scenes) uint32
+    volume: np.ndarray
+    pan: np.ndarray
+    flags: np.ndarray
+
+
+def _layout(max_tracks: int, max_scenes: int, ring_capacity: int) -> Dict[str, tuple]:
+    """name -> (offset, dtype, shape), 8-byte aligned"""
+    fields = [
+        ("header", np.uint64, (_HEADER_WORDS,)),
+        ("status", np.uint8, (max_tracks, max_scenes)),
+        ("color", np.uint32, (max_tracks, max_scenes)),
+        ("volume", np.float32, (max_tracks,)),
+        ("pan", np.float32, (max_tracks,)),
+        ("flags", np.uint8, (max_tracks,)),
+        ("ring", np.uint64, (16,)),
+        ("commands", COMMAND_DTYPE, (ring_capacity,)),
+    ]
+    layout, offset = {}, 0
+    for name, dtype, shape in fields:
+        layout[name] = (offset, dtype, shape)
+        offset += int(np.prod(shape)) * np.dtype(dtype).itemsize
+        offset = (offset + 7) & ~7
+    layout["_size"] = (offset, None, None)
+    return layout
+
+
+class SharedStateMirror:
+    """One shared segment; the creator publishes, attachers read and push commands"""
+
+    def __init__(self, name: Optional[str] = None, max_tracks: int = 128, max_scenes: int = 64,
+                 ring_capacity: int = 256, create: bool = True):
+        self.logger = logging.getLogger(__name__)
+        self.owner = create
+
+        if create:
+            size = _layout(max_tracks, max_scenes, ring_capacity)["_size"][0]
+            self.shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+        else:
+            self.shm = shared_memory.SharedMemory(name=name)
+            header = np.ndarray((_HEADER_WORDS,), np.uint64, self.shm.buf)
+            if int(header[_H_MAGIC]) != MAGIC:
+                self.shm.close()
+                raise ValueError(f"Shared segment '{name}' is not a state mirror")
+            max_tracks = int(header[_H_MAX_TRACKS])
+            max_scenes = int(header[_H_MAX_SCENES])
+            ring_capacity = int(header[_H_RING])
+            del header
+
+        self.max_tracks = max_tracks
+        self.max_scenes = max_scenes
+        self.ring_capacity = ring_capacity
+        for field, (offset, dtype, shape) in _layout(max_tracks, max_scenes, ring_capacity).items():
+            if dtype is not None:
+                setattr(self, f"_{field}", np.ndarray(shape, dtype, self.shm.buf, offset))
+
+        if create:
+            self._header[:] = 0
+            self._header[_H_MAX_TRACKS] = max_tracks
+            self._header[_H_MAX_SCENES] = max_scenes
+            self._header[_H_RING] = ring_capacity
+            self._header[_H_LAYOUT] = 1
+            self._ring[:] = 0
+            self._header[_H_MAGIC] = MAGIC  # Last: segment is valid
+
+        self._seen_version = -1
+        self._event = None
+
+        # Statistics
+        self.publishes = 0
+        self.commands_applied = 0
+        self.commands_dropped = 0  # Out-of-range track/scene
+        self.read_retries = 0
+
+    @property
+    def name(self) -> str:
+        return self.shm.name
+
+    # === WRITER SIDE (UI process) ===
+
+    def _begin_write(self):
+        self._header[_H_SEQ] += 1  # Odd: readers retry
+
+    def _end_write(self):
+        self._header[_H_SEQ] += 1
+
+    def publish(self, app_state):
+        """Write the full grid and mixer"""
+        self._seen_version = app_state.version
+        tracks = min(len(app_state.m.tracks), self.max_tracks)
+        scenes = min(app_state.m.scenes_count, self.max_scenes)
+
+        self._begin_write()
+        try:
+            self._header[_H_TRACKS] = tracks
+            self._header[_H_SCENES] = scenes
+            grid = app_state.grid
+            if grid is not None and grid.shape[0] >= tracks and grid.shape[1] >= scenes:
+                self._status[:tracks, :scenes] = grid.status[:tracks, :scenes]
+                self._color[:tracks, :scenes] = grid.color[:tracks, :scenes]
+            else:
+                for t in range(tracks):
+                    for s in range(scenes):
+                        self._write_cell(app_state, t, s)
+            for t in range(tracks):
+                self._write_track(app_state, t)
+        finally:
+            self._end_write()
+        self.publishes += 1
+
+    def sync(self, app_state):
+        """Write only what changed since the last publish (AppState.changes_since)"""
+        changes = app_state.changes_since(self._seen_version)
+        if changes.structure or self._seen_version < 0:
+            self.publish(app_state)
+            return
+        if changes.empty:
+            return
+        self._seen_version = changes.version
+
+        self._begin_write()
+        try:
+            for t, s in changes.cells:
+                if t < self.max_tracks and s < self.max_scenes:
+                    self._write_cell(app_state, t, s)
+            for t in changes.tracks:
+                if t < self.max_tracks:
+                    self._write_track(app_state, t)
+        finally:
+            self._end_write()
+        self.publishes += 1
+
+    def _write_cell(self, app_state, t: int, s: int):
+        track = app_state.m.tracks.get(t)
+        if track is None or s not in track.clips:
+            return
+        clip = track.clips[s]
+        self._status[t, s] = STATUS_CODES[clip.status.value]
+        self._color[t, s] = pack_color(clip.color)
+
+    def _write_track(self, app_state, t: int):
+        track = app_state.m.tracks.get(t)
+        if track is None:
+            return
+        self._volume[t] = track.volume
+        self._pan[t] = track.pan
+        self._flags[t] = int(track.mute) | (int(track.solo) << 1) | (int(track.arm) << 2)
+
+    # === READER SIDE (hardware process) ===
+
+    def read(self, max_retries: int = 100) -> Optional[MirrorSnapshot]:
+        """Consistent copy of the published state (None if the writer never settled)"""
+        header = self._header
+        for _ in range(max_retries):
+            seq = int(header[_H_SEQ])
+            if seq & 1:
+                self.read_retries += 1
+                continue
+            tracks, scenes = int(header[_H_TRACKS]), int(header[_H_SCENES])
+            snapshot = MirrorSnapshot(
+                seq,
+                self._status[:tracks, :scenes].copy(),
+                self._color[:tracks, :scenes].copy(),
+                self._volume[:tracks].copy(),
+                self._pan[:tracks].copy(),
+                self._flags[:tracks].copy(),
+            )
+            if int(header[_H_SEQ]) == seq:
+                return snapshot
+            self.read_retries += 1
+        return None
+
+    def sequence(self) -> int:
+        """Cheap change check for readers: poll this before read()"""
+        return int(self._header[_H_SEQ])
+
+    # === COMMAND RING (hardware -> UI, single producer / single consumer) ===
+
+    def push_command(self, cmd: int, track: int, scene: int = 0, value: float = 0.0) -> bool:
+        """Producer: enqueue one command; False when the ring is full"""
+        head, tail = int(self._ring[0]), int(self._ring[8])
+        if head - tail >= self.ring_capacity:
+            return False
+        slot, commands = head % self.ring_capacity, self._commands
+        commands["cmd"][slot], commands["track"][slot] = cmd, track
+        commands["scene"][slot], commands["value"][slot] = scene, value
+        self._ring[0] = head + 1  # Publish after the entry is written
+        return True
+
+    def drain_commands(self) -> List[tuple]:
+        """Consumer: take every pending (cmd, track, scene, value)"""
+        head, tail = int(self._ring[0]), int(self._ring[8])
+        commands = []
+        for i in range(tail, head):
+            entry = self._commands[i % self.ring_capacity]
+            commands.append((int(entry["cmd"]), int(entry["track"]),
+                             int(entry["scene"]), float(entry["value"])))
+        self._ring[8] = head
+        return commands
+
+    # === UI PROCESS INTEGRATION ===
+
+    def attach(self, app_state, interval: float = 1 / 60.0):
+        """Publish changes and apply hardware commands on the Kivy clock"""
+        from kivy.clock import Clock
+        self.publish(app_state)
+        self._event = Clock.schedule_interval(lambda dt: self.service(app_state), interval)
+
+    def service(self, app_state):
+        self.sync(app_state)
+        for command in self.drain_commands():
+            self._apply_command(app_state, *command)
+
+    def _apply_command(self, app_state, cmd: int, track: int, scene: int, value: float):
+        """Route hardware input through the same bus topics as the touch UI"""
+        from ..bus import bus
+        tracks = app_state.m.tracks
+        clip = tracks[track].clips.get(scene) if track in tracks else None
+        if track not in tracks or (cmd == CMD_TRIGGER_CLIP and clip is None):
+            # Bad input from the hardware process must never reach the UI loop
+            self.commands_dropped += 1
+            self.logger.warning(f"Dropped hardware command {cmd}: no cell {track}/{scene}")
+            return
+        self.commands_applied += 1
+        if cmd == CMD_TRIGGER_CLIP:
+            bus.emit("clip:trigger", track=track, scene=scene,
+                     current_status=clip.status.value)
+        elif cmd == CMD_STOP_TRACK:
+            bus.emit("track:stop", track=track)
+        elif cmd == CMD_VOLUME:
+            bus.emit("track:volume", track=track, value=value)
+        elif cmd == CMD_PAN:
+            bus.emit("track:pan", track=track, value=value)
+        elif cmd in (CMD_MUTE, CMD_SOLO, CMD_ARM):
+            topic = {CMD_MUTE: "track:mute", CMD_SOLO: "track:solo", CMD_ARM: "track:arm"}[cmd]
+            bus.emit(topic, track=track, value=bool(value))
+        else:
+            self.logger.warning(f"Unknown hardware command {cmd}")
+
+    def get_stats(self) -> dict:
+        return {
+            "bytes": self.shm.size,
+            "seq": self.sequence(),
+            "publishes": self.publishes,
+            "commands_applied": self.commands_applied,
+            "commands_dropped": self.commands_dropped,
+            "read_retries": self.read_retries,
+        }
+
+    def close(self):
+        """Detach; the creating process also unlinks the segment"""
+        if self._event is not None:
+            self._event.cancel()
+            self._event = None
+        # Drop NumPy views before closing the buffer they point into
+        for field in ("header", "status", "color", "volume", "pan", "flags", "ring", "commands"):
+            setattr(self, f"_{field}", None)
+        self.shm.close()
+        if self.owner:
+            self.shm.unlink()
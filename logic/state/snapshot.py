@@ -0,0 +1,208 @@
+"""Compact binary snapshot of the last-synced Live set.
+
+The snapshot lets the app paint the clip grid before the first OSC round-trip
+completes. It is keyed by a set fingerprint so a stale snapshot from another
+set is never shown as if it were current.
+"""
+import hashlib
+import logging
+import os
+import struct
+import zlib
+from pathlib import Path
+from typing import Iterable, List, Optional, Tuple
+
+from .models import (AppStateModel, ClipStatus, TrackState, TransportState,
+                     EMPTY_CLIP, clip_slot, intern_color)
+
+SNAPSHOT_MAGIC = b"PSHS"
+SNAPSHOT_VERSION = 1
+
+_HEADER = struct.Struct("<4sH")
+_SET = struct.Struct("<fHH")          # tempo, scenes_count, track count
+_TRACK = struct.Struct("<I4BffBBHH")  # name idx, rgba, volume, pan, flags, sends, devices, clips
+_CLIP = struct.Struct("<HBI4B")       # scene, status, name idx, rgba
+
+# Stable on-disk status codes (never reorder, only append)
+_STATUS_CODES = [ClipStatus.EMPTY, ClipStatus.PLAYING, ClipStatus.QUEUED, ClipStatus.RECORDING]
+_STATUS_TO_CODE = {status.value: code for code, status in enumerate(_STATUS_CODES)}
+
+
+def set_fingerprint(track_names: Iterable[str]) -> str:
+    """Cheap identity of a Live set derived from its ordered track names"""
+    digest = hashlib.sha1()
+    for name in track_names:
+        digest.update(str(name).encode("utf-8"))
+        digest.update(b"\x00")
+    return digest.hexdigest()[:16]
+
+
+def _pack_color(rgba) -> Tuple[int, int, int, int]:
+    return tuple(max(0, min(255, int(round(c * 255)))) for c in rgba)
+
+
+def _unpack_color(rgba) -> Tuple[float, float, float, float]:
+    return tuple(round(c / 255.0, 3) for c in rgba)
+
+
+class _StringTable:
+    """Interns strings so repeated clip/device names are stored once"""
+
+    def __init__(self):
+        self.strings: List[str] = []
+        self._index = {}
+
+    def add(self, text: str) -> int:
+        idx = self._index.get(text)
+        if idx is None:
+            idx = self._index[text] = len(self.strings)
+            self.strings.append(text)
+        return idx
+
+
+def _pack_str(text: str) -> bytes:
+    raw = text.encode("utf-8")
+    return struct.pack("<H", len(raw)) + raw
+
+
+def encode_snapshot(model: AppStateModel, fingerprint: str) -> bytes:
+    """Serialize the model into a compressed binary blob"""
+    table = _StringTable()
+    body = bytearray(_SET.pack(model.transport.tempo, model.scenes_count, len(model.tracks)))
+
+    for track_id in sorted(model.tracks):
+        track = model.tracks[track_id]
+        # Only non-empty cells are stored, the rest are implicit
+        clips = [
+            (scene, clip) for scene, clip in sorted(track.clips.items())
+            if clip.status.value != ClipStatus.EMPTY.value or clip.name
+        ]
+        flags = int(track.mute) | (int(track.solo) << 1) | (int(track.arm) << 2)
+        body += _TRACK.pack(
+            table.add(track.name), *_pack_color(track.color),
+            track.volume, track.pan, flags,
+            len(track.sends), len(track.devices), len(clips)
+        )
+        body += struct.pack(f"<{len(track.sends)}f", *track.sends)
+        body += struct.pack(f"<{len(track.devices)}I", *(table.add(d) for d in track.devices))
+        for scene, clip in clips:
+            body += _CLIP.pack(
+                scene, _STATUS_TO_CODE.get(clip.status.value, 0),
+                table.add(clip.name), *_pack_color(clip.color)
+            )
+
+    payload = bytearray(_pack_str(fingerprint))
+    payload += struct.pack("<I", len(table.strings))
+    for text in table.strings:
+        payload += _pack_str(text)
+    payload += body
+
+    return _HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION) + zlib.compress(bytes(payload))
+
+
+def decode_snapshot(data: bytes) -> Tuple[str, AppStateModel]:
+    """Inverse of encode_snapshot, raises ValueError on foreign or corrupt data"""
+    if len(data) < _HEADER.size:
+        raise ValueError("Snapshot too short")
+    magic, version = _HEADER.unpack_from(data)
+    if magic != SNAPSHOT_MAGIC or version != SNAPSHOT_VERSION:
+        raise ValueError(f"Unsupported snapshot {magic!r} v{version}")
+
+    try:
+        buf = zlib.decompress(data[_HEADER.size:])
+    except zlib.error as e:
+        raise ValueError(f"Corrupt snapshot: {e}") from e
+
+    offset = 0
+
+    def read_str():
+        nonlocal offset
+        (length,) = struct.unpack_from("<H", buf, offset)
+        offset += 2
+        text = buf[offset:offset + length].decode("utf-8")
+        offset += length
+        return text
+
+    try:
+        fingerprint = read_str()
+        (count,) = struct.unpack_from("<I", buf, offset)
+        offset += 4
+        strings = [read_str() for _ in range(count)]
+
+        tempo, scenes_count, track_count = _SET.unpack_from(buf, offset)
+        offset += _SET.size
+
+        model = AppStateModel(scenes_count=scenes_count,
+                              transport=TransportState(tempo=round(tempo, 3)))
+        for track_id in range(track_count):
+            (name_idx, r, g, b, a, volume, pan, flags,
+             n_sends, n_devices, n_clips) = _TRACK.unpack_from(buf, offset)
+            offset += _TRACK.size
+            sends = list(struct.unpack_from(f"<{n_sends}f", buf, offset))
+            offset += 4 * n_sends
+            devices = [strings[i] for i in struct.unpack_from(f"<{n_devices}I", buf, offset)]
+            offset += 4 * n_devices
+
+            clips = dict.fromkeys(range(scenes_count), EMPTY_CLIP)
+            for _ in range(n_clips):
+                scene, code, clip_name_idx, cr, cg, cb, ca = _CLIP.unpack_from(buf, offset)
+                offset += _CLIP.size
+                clips[scene] = clip_slot(_STATUS_CODES[code], strings[clip_name_idx],
+                                         _unpack_color((cr, cg, cb, ca)))
+
+            model.tracks[track_id] = TrackState(
+                id=track_id,
+                name=strings[name_idx],
+                clips=clips,
+                color=intern_color(_unpack_color((r, g, b, a))),
+                devices=devices,
+                volume=max(0.0, min(1.0, volume)),
+                pan=pan,
+                sends=[round(s, 4) for s in sends],
+                mute=bool(flags & 1),
+                solo=bool(flags & 2),
+                arm=bool(flags & 4),
+            )
+    except (struct.error, IndexError, UnicodeDecodeError) as e:
+        raise ValueError(f"Corrupt snapshot: {e}") from e
+
+    return fingerprint, model
+
+
+class SnapshotStore:
+    """Reads and writes the snapshot file atomically"""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.logger = logging.getLogger(__name__)
+
+    def save(self, model: AppStateModel, fingerprint: str) -> bool:
+        """Write snapshot, returns False on I/O errors"""
+        try:
+            data = encode_snapshot(model, fingerprint)
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, self.path)
+            self.logger.debug(f"Saved snapshot {fingerprint} ({len(data)} bytes)")
+            return True
+        except OSError as e:
+            self.logger.warning(f"Could not save snapshot: {e}")
+            return False
+
+    def load(self) -> Optional[Tuple[str, AppStateModel]]:
+        """Return (fingerprint, model) or None if missing/unreadable"""
+        try:
+            data = self.path.read_bytes()
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            self.logger.warning(f"Could not read snapshot: {e}")
+            return None
+
+        try:
+            return decode_snapshot(data)
+        except ValueError as e:
+            self.logger.warning(f"Ignoring snapshot: {e}")
+            return None
@@ -20,6 +20,8 @@ from config.config import AppConfig
 from logic.state.app_state import AppState
 from logic.clip_manager import ClipManager
 from logic.live_integration import LiveIntegration
+from logic.state.snapshot import SnapshotStore
+from logic.state.shared_mirror import SharedStateMirror
 
 from ui.screens.clip_view import ClipViewScreen
 from ui.screens.devices_view import DevicesViewScreen
@@ -30,14 +32,21 @@ from ui.screens.mixer_view import MixerViewScreen
 # IMPORTANT: Import ALL widget classes BEFORE loading KV files
 from ui.widgets.clip_grid import ClipGrid
 from ui.widgets.track_volume import TrackVolume
+from ui.widgets.mixer_strips import MixerStrips
 from ui.widgets.screen_header import ScreenHeader
 from ui.widgets.status_bar import StatusBar
 from ui.widgets.navigation_bar import NavigationBar
 from ui.widgets.nav_button import NavButton
 from ui.widgets.clip_slot import ClipSlot
+from ui.widgets.virtual_clip_grid import VirtualClipGrid
+from ui.widgets.clip_grid_canvas import ClipGridCanvas
 from ui.widgets.track_header import TrackHeader
 from ui.widgets.track_channel import TrackChannel
 from ui.widgets.icon_button import IconButton
+from ui.icon_atlas import icon_atlas
+from ui.frame_governor import FrameGovernor
+from ui.animation_ticker import animation_ticker
+from logic.performance_optimizer import frame_scheduler
 
 
 
@@ -48,6 +57,7 @@ class PushControllerApp(App):
         self.state: Optional[AppState] = None
         self.clip_manager: Optional[ClipManager] = None
         self.live_integration: Optional[LiveIntegration] = None  # ADD THIS
+        self.frame_governor: Optional[FrameGovernor] = None
         
     def build(self):
         # 1. Apply configuration
@@ -96,6 +106,8 @@ class PushControllerApp(App):
         """Load asset resources"""
         assets_path = Path(__file__).parent / self.config_app.assets_path
         resource_add_path(str(assets_path / "icons"))
+        # One atlas texture for all icons (falls back to loose PNGs if not built)
+        icon_atlas.load(assets_path / "icons")
     
     def _load_kv_files(self):
         """Load KV files automatically"""
@@ -115,19 +127,30 @@ class PushControllerApp(App):
     
     def _init_business_logic(self):
         """Initialize state and business logic"""
-        self.state = AppState()
+        self.state = AppState(use_grid_store=True)
+        self.state.demo_size = self.config_app.demo_size  # Offline set served to every screen
         # Don't init_project here - let Live integration do it dynamically
         
+        if self.config_app.shared_state_name:
+            self.state.attach_mirror(SharedStateMirror(self.config_app.shared_state_name))
+        
         self.clip_manager = ClipManager(self.state)
-        self.live_integration = LiveIntegration(self.state)
+        self.live_integration = LiveIntegration(
+            self.state,
+            snapshot_store=SnapshotStore(self.config_app.snapshot_path)
+        )
+        
+        # Warm start: show the last-synced set before the first frame
+        self.live_integration.load_snapshot()
         
         # Try to connect (will initialize tracks from Live)
         try:
             self.live_integration.connect()
         except Exception as e:
             self.logger.warning(f"Could not connect to Live on startup: {e}")
-            # Fallback to default if Live not available
-            self.state.init_project(tracks=8, scenes=12)
+            # Fallback to default if Live not available (keep snapshot if loaded)
+            if not self.state.m.tracks:
+                self.state.init_project(tracks=8, scenes=12)
     
     def _setup_window(self):
         """Setup window events and properties"""
@@ -137,6 +160,14 @@ class PushControllerApp(App):
         # Set fullscreen if configured
         if self.config_app.graphics.fullscreen:
             Window.fullscreen = 'auto'
+        
+        # Drop to idle_fps when nothing is happening, full rate on any activity
+        graphics = self.config_app.graphics
+        self.frame_governor = FrameGovernor(graphics.maxfps, graphics.idle_fps, graphics.idle_after)
+        self.frame_governor.add_busy_source(lambda: animation_ticker.active)
+        self.frame_governor.add_busy_source(lambda: len(frame_scheduler) > 0)
+        self.frame_governor.add_change_source(lambda: self.state.version)
+        self.frame_governor.attach(Window)
     
     def _on_key_down(self, window, key, scancode, codepoint, modifier):
         """Handle key press events"""
@@ -156,8 +187,13 @@ class PushControllerApp(App):
     
     def on_stop(self):
         """Cleanup on app shutdown"""
+        if self.frame_governor:
+            self.logger.info(f"Frame governor: {self.frame_governor.get_stats()}")
+            self.frame_governor.detach()
         if self.live_integration:
             self.live_integration.disconnect()
+        if self.state and self.state.mirror:
+            self.state.mirror.close()
         return super().on_stop()
     
     def _create_ui(self):
@@ -169,7 +205,8 @@ class PushControllerApp(App):
             name='clip_view',
             app_state=self.state,
             clip_manager=self.clip_manager,
-            live_integration=self.live_integration  # AGREGAR ESTO
+            live_integration=self.live_integration,  # AGREGAR ESTO
+            grid_mode=self.config_app.clip_grid_mode
         )
         sm.add_widget(clip_view)
         
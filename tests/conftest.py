@@ -0,0 +1,54 @@
+import os
+import sys
+
+# Ensure project root is on the import path for test execution
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import pytest
+
+from logic.state.app_state import AppState
+
+
+class RecordingOSC:
+    """Minimal OSCClient stand-in that records outgoing requests."""
+
+    def __init__(self):
+        self.sent = []
+
+    def register_handler(self, pattern, handler):
+        pass
+
+    def send_message(self, address, *args):
+        self.sent.append((address, args))
+
+    def __getattr__(self, name):
+        return lambda *args: self.sent.append((name, args))
+
+
+@pytest.fixture
+def osc():
+    return RecordingOSC()
+
+
+@pytest.fixture
+def make_state():
+    """AppState factory: ``make_state(tracks, scenes)``, or from Live with ``names``"""
+    def make(tracks=2, scenes=None, names=None, use_grid_store=False):
+        state = AppState(use_grid_store=use_grid_store)
+        if names is not None:
+            state.init_project_from_live(list(names), *(() if scenes is None else (scenes,)))
+        else:
+            state.init_project(tracks=tracks, scenes=4 if scenes is None else scenes)
+        return state
+    return make
+
+
+@pytest.fixture
+def make_tracks():
+    """Clip grid track dicts; ``labelled`` names every clip "track/scene" """
+    def make(tracks, scenes, labelled=False):
+        return [{"name": f"Track {t}", "color": (1, 0, 0, 1),
+                 "clips": [{"status": "empty", "name": f"{t}/{s}" if labelled else "",
+                            "has_content": labelled} for s in range(scenes)]}
+                for t in range(tracks)]
+    return make
@@ -0,0 +1,61 @@
+import os
+import sys
+
+# Ensure project root is on the import path for test execution
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from logic.beat_clock import BeatClock
+from ui.animation_ticker import BLINK, BLINK_OFF, PULSE, AnimationTicker
+
+
+class FakeColor:
+    def __init__(self):
+        self.rgba = (0, 0, 0, 0)
+
+
+def make_ticker():
+    now = [0.0]
+    clock = BeatClock(time_fn=lambda: now[0])
+    clock.set_tempo(120.0)
+    clock.set_playing(True)
+    return AnimationTicker(beat_clock=clock, time_fn=lambda: now[0], schedule=False), now
+
+
+def test_blink_follows_the_beat_and_writes_only_on_change():
+    ticker, now = make_ticker()
+    color = FakeColor()
+    ticker.animate("cell", color, BLINK, (1.0, 0.5, 0.0, 1.0))
+    assert color.rgba == (1.0, 0.5, 0.0, 1.0)  # On the beat
+
+    writes = ticker.color_writes
+    now[0] = 0.1  # 0.2 beat: still on
+    ticker.tick()
+    assert ticker.color_writes == writes
+
+    now[0] = 0.3  # 0.6 beat at 120 bpm: off
+    ticker.tick()
+    assert color.rgba == (BLINK_OFF, 0.5 * BLINK_OFF, 0.0, 1.0)
+
+
+def test_pulse_decays_between_beats():
+    ticker, now = make_ticker()
+    color = FakeColor()
+    ticker.animate("cell", color, PULSE, (1.0, 1.0, 1.0, 1.0))
+    start = color.rgba[0]
+    now[0] = 0.4
+    ticker.tick()
+    assert color.rgba[0] < start
+    now[0] = 0.5  # Next beat
+    ticker.tick()
+    assert color.rgba[0] == start
+
+
+def test_idle_when_nothing_animates():
+    ticker, _ = make_ticker()
+    assert not ticker.active
+    ticker.animate("a", FakeColor(), BLINK, (1, 1, 1, 1))
+    ticker.animate(("grid", 3), FakeColor(), PULSE, (1, 1, 1, 1))
+    assert ticker.active and len(ticker) == 2
+    ticker.stop("a")
+    ticker.stop_owner("grid")
+    assert not ticker.active
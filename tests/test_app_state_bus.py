@@ -6,11 +6,10 @@ from kivy.clock import Clock
 # Ensure project root is on the import path for test execution
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from logic.state.app_state import AppState
 from logic.bus import bus
 
 
-def test_set_track_volume_emits_named_arguments():
+def test_set_track_volume_emits_named_arguments(make_state):
     """AppState should emit track and value as keyword arguments."""
     received = []
 
@@ -20,11 +19,69 @@ def test_set_track_volume_emits_named_arguments():
     bus._subs.clear()
     bus.on("state:track_volume", handler)
 
-    state = AppState()
-    state.init_project(tracks=1, scenes=1)
+    state = make_state(tracks=1, scenes=1)
     state.set_track_volume(0, 0.5)
 
     # Process scheduled bus event
     Clock.tick()
 
     assert received == [(0, 0.5)]
+
+
+def test_changes_since_reports_only_dirty_cells_and_tracks(make_state):
+    state = make_state(tracks=4, scenes=4)
+    seen = state.version
+
+    state.set_clip_status(1, 2, "playing")
+    state.set_clip_status(1, 2, "queued")
+    state.set_track_volume(3, 0.4)
+
+    changes = state.changes_since(seen)
+    assert changes.cells == {(1, 2)}
+    assert changes.tracks == {3}
+    assert not changes.structure
+    assert state.changes_since(changes.version).empty
+
+    state.init_project(tracks=2, scenes=2)
+    assert state.changes_since(changes.version).structure
+
+
+def test_batch_merges_writes_into_one_changeset(make_state):
+    state = make_state(tracks=2, scenes=2)
+    Clock.tick()
+    changesets, volumes = [], []
+    bus.on("state:changeset", lambda **kw: changesets.append(kw["changes"]))
+    bus.on("state:track_volume", lambda track, value: volumes.append((track, value)))
+
+    with state.batch():
+        state.set_track_volume(1, 0.2)
+        state.set_clip_status(0, 1, "queued")
+        state.set_track_volume(1, 0.9)
+    Clock.tick()
+
+    assert changesets == [(("clip_changed", {"track": 0, "scene": 1, "status": "queued"}),
+                           ("track_volume", {"track": 1, "value": 0.9}))]
+    assert volumes == [(1, 0.9)]
+
+
+def test_batch_keeps_every_device_parameter_and_undo_restores_them(make_state):
+    state = make_state(tracks=1, scenes=1)
+    Clock.tick()
+    changesets = []
+    bus.on("state:changeset", lambda **kw: changesets.append(kw["changes"]))
+
+    with state.batch():
+        for device, param in ((0, 1), (0, 2), (1, 1)):
+            state.set_device_parameter(0, device, param, 0.5)
+    Clock.tick()
+    written = {(d["device"], d["param"]) for key, d in changesets[-1] if key == "device_parameter"}
+    assert written == {(0, 1), (0, 2), (1, 1)}
+
+    with state.journal.group():
+        for device, param in ((0, 1), (0, 2), (1, 1)):
+            state.set_device_parameter(0, device, param, 0.9, user=True)
+    state.undo()
+    Clock.tick()
+    assert all(state.m.device_params[(0, d, p)] == 0.5 for d, p in ((0, 1), (0, 2), (1, 1)))
+    restored = [d for key, d in changesets[-1] if key == "device_parameter"]
+    assert len(restored) == 3
@@ -0,0 +1,36 @@
+import os
+import sys
+
+# Ensure project root is on the import path for test execution
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from logic.beat_clock import BeatClock
+
+
+def test_extrapolation_tracks_skewed_host_clock():
+    """Sparse samples keep the local position within a few ms of Live."""
+    clock = BeatClock(time_fn=lambda: 0.0)
+    clock.set_tempo(120.0, t=0.0)
+    clock.set_playing(True, t=0.0)
+
+    live_beat = lambda t: t * 1.001 * 2.0  # Live host clock 0.1% fast
+    for t in range(0, 40, 2):
+        clock.add_sample(live_beat(t), t=float(t))
+
+    assert abs(clock.beat_at(41.0) - live_beat(41.0)) < 0.01
+
+
+def test_transport_jump_resyncs_immediately():
+    clock = BeatClock(time_fn=lambda: 0.0)
+    clock.set_playing(True, t=0.0)
+    clock.add_sample(64.0, t=1.0)  # Loop/locate far from the prediction
+
+    assert clock.resyncs == 1
+    assert clock.beat_at(1.0) == 64.0
+
+
+def test_stopped_clock_holds_position():
+    clock = BeatClock(time_fn=lambda: 0.0)
+    clock.add_sample(8.0, t=5.0)
+    assert clock.beat_at(100.0) == 8.0
+    assert clock.time_of_beat(9.0) is None
@@ -0,0 +1,42 @@
+import os
+import sys
+
+# Ensure project root is on the import path for test execution
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from logic.cache import BoundedCache, CacheBudget
+
+
+def test_lru_ttl_and_prefix_invalidation():
+    now = [0.0]
+    evicted = []
+    cache = BoundedCache("clips", max_entries=3, ttl=10.0, time_fn=lambda: now[0],
+                         on_evict=lambda k, v, reason: evicted.append((k, reason)))
+    for scene in range(3):
+        cache.put((0, scene), {"name": f"Clip {scene}"})
+    assert cache.get((0, 0))["name"] == "Clip 0"   # (0, 1) is now least recent
+    cache.put((1, 0), {"name": "Bass"})
+    assert evicted == [((0, 1), "size")]
+
+    assert cache.invalidate_prefix((0,)) == 2
+    assert list(k for k, _ in cache.items()) == [(1, 0)]
+
+    now[0] = 11.0
+    assert cache.get((1, 0)) is None
+    stats = cache.get_stats()
+    assert (stats["hits"], stats["misses"], stats["expirations"]) == (1, 1, 1)
+
+
+def test_shared_budget_evicts_globally_oldest_entry():
+    budget = CacheBudget(max_bytes=300)
+    pages = BoundedCache("pages", budget=budget, size_fn=lambda v: 100)
+    colors = BoundedCache("colors", budget=budget, size_fn=lambda v: 100)
+
+    pages.put("p0", 0)
+    colors.put("c0", 0)
+    pages.put("p1", 1)
+    colors.put("c1", 1)  # Over budget: p0 is the oldest across both caches
+
+    assert "p0" not in pages
+    assert "c0" in colors
+    assert budget.used_bytes == 300
@@ -0,0 +1,107 @@
+import os
+import sys
+
+# Ensure project root is on the import path for test execution
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import pytest
+from kivy.clock import Clock
+
+from logic.bus import bus
+from ui.animation_ticker import animation_ticker
+from ui.widgets.clip_colors import EMPTY_RGBA, cell_rgba
+from ui.widgets.clip_grid_canvas import ClipGridCanvas
+from ui.widgets.virtual_clip_grid import VirtualClipGrid
+
+
+@pytest.fixture
+def make_grid(make_tracks):
+    def make(tracks=16, scenes=16):
+        grid = ClipGridCanvas(size=(88 * 4, 30 * 4), pos=(0, 0), cell_width=88, cell_height=30)
+        grid.set_data(make_tracks(tracks, scenes))
+        return grid
+    return make
+
+
+def test_status_change_updates_one_color(make_grid):
+    grid = make_grid()
+    before = grid.color_updates
+    grid.tracks[1]["clips"][2]["has_content"] = True
+    grid.refresh_cell(1, 2)
+    assert grid.color_updates == before + 1
+    assert tuple(grid._colors[1 * grid._rows + 2].rgba) == cell_rgba({"has_content": True}, (1, 0, 0, 1))
+    assert tuple(grid._colors[0].rgba) == EMPTY_RGBA
+
+    grid.refresh_cell(12, 12)  # Off screen: nothing to paint
+    assert grid.color_updates == before + 1
+
+
+def test_tap_hit_test_is_arithmetic_and_follows_scroll(make_grid):
+    grid = make_grid()
+    grid.scroll_to(x=88 * 3, y=30 * 2)
+    assert grid.cell_at(10, grid.top - 5) == (3, 2)
+    assert grid.cell_at(88 + 10, grid.top - 35) == (4, 3)
+    assert grid.cell_at(-5, 5) is None
+
+    triggered = []
+    bus.on("clip:trigger", lambda **kw: triggered.append((kw["track"], kw["scene"])))
+    grid.tracks[4]["clips"][3]["status"] = "queued"
+    grid._trigger_cell(4, 3)
+    Clock.tick()
+    assert triggered == [(4, 3)]
+
+
+def test_scrolling_allocates_nothing(make_grid):
+    grid = make_grid(256, 64)
+    allocated = grid.allocations
+    for step in range(100):
+        grid.scroll_to(x=step * 41, y=step * 13)
+    assert grid.allocations == allocated
+
+
+def test_playing_cells_are_handed_to_the_animation_ticker(make_grid):
+    grid = make_grid()
+    index = 1 * grid._rows + 2
+    grid.tracks[1]["clips"][2]["status"] = "playing"
+    grid.refresh_cell(1, 2)
+    assert (grid, index) in animation_ticker._cells
+
+    grid.tracks[1]["clips"][2]["status"] = "empty"
+    grid.refresh_cell(1, 2)
+    assert (grid, index) not in animation_ticker._cells
+
+
+def test_released_grids_leave_nothing_in_the_ticker(make_tracks):
+    baseline = len(animation_ticker)
+    grids = []
+    for grid_class in (VirtualClipGrid, ClipGridCanvas):
+        grid = grid_class(size=(88 * 4, 30 * 4), pos=(0, 0), cell_width=88, cell_height=30)
+        tracks = make_tracks(8, 8)
+        for track in tracks:
+            track["clips"][0]["status"] = "playing"
+        grid.set_data(tracks)
+        grids.append(grid)
+    assert len(animation_ticker) > baseline
+
+    for grid in grids:
+        grid.release()
+    assert len(animation_ticker) == baseline
+
+
+def test_leaving_clip_view_releases_grid_animations(make_grid):
+    from ui.screens.clip_view import ClipViewScreen
+
+    baseline = len(animation_ticker)
+    screen = ClipViewScreen(name="clip_leave_test")
+    screen.clip_grid = make_grid()
+    screen.live_tracks = screen.clip_grid.tracks
+    screen.live_tracks[1]["clips"][2]["status"] = "playing"
+    screen._populate_clips()
+    assert len(animation_ticker) == baseline + 1
+
+    screen.on_leave()
+    screen._on_clip_batch_update(updates=[("clip_status", {"track": 0, "scene": 0, "status": "queued"})])
+    assert len(animation_ticker) == baseline
+
+    screen.on_enter()
+    assert len(animation_ticker) == baseline + 2
@@ -0,0 +1,90 @@
+import os
+import sys
+
+# Ensure project root is on the import path for test execution
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from logic.beat_clock import BeatClock
+from logic.clip_manager import ClipManager
+from logic.state.app_state import AppState
+
+
+def make_manager(now, bpm=120.0, beat=0.0):
+    clock = BeatClock(time_fn=lambda: now[0])
+    clock.set_tempo(bpm, t=0.0)
+    clock.set_playing(True, t=0.0)
+    clock.add_sample(beat, t=0.0)
+    state = AppState()
+    state.init_project(tracks=2, scenes=4)
+    return state, ClipManager(state, clock=clock, time_fn=lambda: now[0])
+
+
+def clip_status(state, track, scene):
+    return state.m.tracks[track].clips[scene].status.value
+
+
+def test_launch_fires_on_next_bar_boundary_for_tempo():
+    now = [0.5]  # beat 1.0 at 120 BPM
+    state, manager = make_manager(now)
+    assert abs(manager.next_launch_time() - 2.0) < 1e-6  # bar 2 starts at beat 4
+
+    manager.trigger_clip(0, 1)
+    now[0] = 1.9
+    manager._service_launches()
+    assert clip_status(state, 0, 1) == "queued"
+
+    now[0] = 2.0
+    manager._service_launches()
+    assert clip_status(state, 0, 1) == "playing"
+    assert manager.playing_clips == {0: 1}
+
+
+def test_retrigger_cancels_previous_pending_launch():
+    now = [0.1]
+    state, manager = make_manager(now, bpm=90.0)
+    manager.trigger_clip(1, 0)
+    manager.trigger_clip(1, 2)
+
+    assert clip_status(state, 1, 0) == "empty"
+    now[0] = manager.next_launch_time(0.1)
+    manager._service_launches()
+    assert manager.playing_clips == {1: 2}
+    assert manager._launch_heap == []
+
+
+def test_live_playing_status_reconciles_prediction():
+    now = [0.0]
+    state, manager = make_manager(now)
+    manager.trigger_clip(0, 3)
+
+    now[0] = 2.01
+    manager.handle_live_clip_status(track=0, scene=3, status="playing")
+
+    assert manager.playing_clips == {0: 3}
+    assert manager._pending == {}
+    assert abs(manager.last_prediction_error - 0.01) < 1e-6
+
+
+def test_pending_launch_follows_tempo_change_and_transport():
+    now = [0.5]  # beat 1.0 at 120 BPM, launch at beat 4 (t=2.0)
+    state, manager = make_manager(now)
+    manager.trigger_clip(0, 1)
+
+    # Halve the tempo at beat 2: beat 4 is now 2 beats at 1 beat/s away
+    now[0] = 1.0
+    manager.clock.set_tempo(60.0)
+    assert abs(manager.next_launch_time() - 3.0) < 1e-6
+    now[0] = 2.0
+    manager._service_launches()
+    assert clip_status(state, 0, 1) == "queued"
+
+    # Stopped transport holds the launch; restarting re-plans it from the beat
+    manager.clock.set_playing(False)
+    assert manager._timer is None
+    now[0] = 10.0
+    manager._service_launches()
+    assert clip_status(state, 0, 1) == "queued"
+    manager.clock.set_playing(True)  # Resumes at beat 3
+    now[0] = 11.0
+    manager._service_launches()
+    assert manager.playing_clips == {0: 1}
@@ -0,0 +1,59 @@
+import os
+import sys
+
+# Ensure project root is on the import path for test execution
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import pytest
+
+from logic.state.app_state import AppState
+from logic.state.demo_data import builtin_set, synthetic_set
+
+
+def test_demo_set_is_built_once_and_read_only():
+    state = AppState()
+    demo = state.demo_set()
+    assert demo is state.demo_set() is builtin_set()
+    assert demo.names()[:3] == ["Kick", "Hats", "Bass"]
+    assert demo.tracks[0]["clips"][0]["status"] == "playing"
+    with pytest.raises(TypeError):
+        demo.tracks[0]["clips"][0]["status"] = "empty"
+
+    editable = demo.mutable_tracks()
+    editable[0]["clips"][0]["status"] = "empty"
+    assert demo.tracks[0]["clips"][0]["status"] == "playing"
+
+
+def test_synthetic_set_is_deterministic_and_cached_per_size():
+    state = AppState()
+    state.demo_size = (128, 32)
+    big = state.demo_set()
+    assert (len(big), big.scenes) == (128, 32)
+    assert big is state.demo_set(128, 32)
+    assert [c["name"] for c in big.tracks[5]["clips"]] == \
+        [c["name"] for c in synthetic_set(128, 32).tracks[5]["clips"]]
+
+
+def test_load_demo_set_fills_app_state():
+    state = AppState(use_grid_store=True)
+    demo = state.load_demo_set(16, 8)
+    assert len(state.m.tracks) == 16 and state.m.scenes_count == 8
+    for t, track in enumerate(demo.tracks):
+        for s, clip in enumerate(track["clips"]):
+            assert state.m.tracks[t].clips[s].name == clip["name"]
+            assert state.m.tracks[t].clips[s].status.value == clip["status"]
+
+
+def test_focus_event_does_not_re_emit():
+    from kivy.clock import Clock
+    from logic.bus import bus
+    from ui.screens.clip_view import ClipViewScreen
+
+    screen = ClipViewScreen(name="focus_test")
+    seen = []
+    bus.on("track:focus", lambda **kw: seen.append(kw["track"]))
+    screen._focus_track(3)
+    for _ in range(3):
+        Clock.tick()
+    assert seen == [3]
+    assert screen.current_track_text == "Tom"
@@ -0,0 +1,94 @@
+import os
+import sys
+
+# Ensure project root is on the import path for test execution
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from kivy.clock import Clock
+
+from logic.cache import CacheBudget
+from logic.device_service import METADATA_RETRY, DeviceDataService
+
+
+def test_only_visible_and_neighbour_pages_are_fetched(osc):
+    service = DeviceDataService(max_pages=8)
+    service.attach(osc)
+    service._handle_num_parameters("/live/device/get/num_parameters", 0, 0, 128)
+
+    assert service.get_page(0, 0, 5) is None
+    fetched = {args[2] // 8 for name, args in osc.sent if name == "get_device_parameter_value"}
+    assert fetched == {4, 5, 6}
+
+    for param in range(40, 48):
+        service._handle_param_value("/live/device/get/parameter/value", 0, 0, param, 0.5)
+        service._handle_param_value_string("/live/device/get/parameter/value_string", 0, 0, param, "50 %")
+    page = service.get_page(0, 0, 5)
+    assert [p["value"] for p in page] == [0.5] * 8
+
+
+def test_lru_evicts_oldest_page_and_stops_its_listeners(osc):
+    service = DeviceDataService(max_pages=2, prefetch=0)
+    service.attach(osc)
+    service._handle_num_parameters("/live/device/get/num_parameters", 0, 0, 64)
+
+    for page in range(3):
+        service.get_page(0, 0, page)
+
+    assert service.get_stats()["evictions"] == 1
+    stopped = {args[2] for name, args in osc.sent if name == "stop_listen_device_parameter"}
+    assert stopped == set(range(0, 8))
+
+
+def test_filled_pages_are_re_measured_in_the_shared_budget(osc):
+    budget = CacheBudget()
+    service = DeviceDataService(prefetch=0, budget=budget)
+    service.attach(osc)
+    service._handle_num_parameters("/live/device/get/num_parameters", 0, 0, 8)
+    service.get_page(0, 0, 0)
+    blank = budget.used_bytes
+
+    service._handle_param_meta("/live/device/get/parameters/name", 0, 0,
+                               *[f"Filter Cutoff Frequency {i}" for i in range(8)])
+    named = budget.used_bytes
+    assert named > blank
+
+    for param in range(8):
+        service._handle_param_value("/live/device/get/parameter/value", 0, 0, param, 0.5)
+        service._handle_param_value_string("/live/device/get/parameter/value_string", 0, 0, param,
+                                           f"{param * 1000} Hz")
+    assert budget.used_bytes > named
+
+
+def test_unanswered_metadata_request_is_retried(osc):
+    now = [0.0]
+    service = DeviceDataService(time_fn=lambda: now[0])
+    service.attach(osc)
+
+    def count_requests():
+        return sum(1 for name, _ in osc.sent if name == "get_device_num_parameters")
+
+    service.get_page(0, 0, 0)
+    service.get_page(0, 0, 0)
+    assert count_requests() == 1  # Still in flight
+
+    now[0] += METADATA_RETRY
+    service.get_page(0, 0, 0)
+    assert count_requests() == 2
+
+    service._handle_num_parameters("/live/device/get/num_parameters", 0, 0, 8)
+    now[0] += METADATA_RETRY
+    service.get_page(0, 0, 0)
+    assert count_requests() == 2
+
+
+def test_device_names_reach_app_state_on_the_ui_thread(make_state, osc):
+    state = make_state(tracks=2, scenes=1)
+    service = DeviceDataService(app_state=state)
+    service.attach(osc)
+    seen = state.version
+
+    service._handle_device_names("/live/track/get/devices/name", 1, "Operator", "Reverb")
+    assert state.m.tracks[1].devices == []
+    Clock.tick()
+    assert state.m.tracks[1].devices == ["Operator", "Reverb"]
+    assert state.changes_since(seen).tracks == {1}
@@ -0,0 +1,61 @@
+import os
+import sys
+
+# Ensure project root is on the import path for test execution
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from ui.frame_governor import MODE_ACTIVE, MODE_IDLE, FrameGovernor
+
+
+class FakeClock:
+    _max_fps = 60.0
+
+
+def make_governor():
+    now = [0.0]
+    clock = FakeClock()
+    governor = FrameGovernor(active_fps=60, idle_fps=10, idle_after=1.0,
+                             clock=clock, time_fn=lambda: now[0])
+    return governor, clock, now
+
+
+def test_drops_to_idle_rate_after_quiet_period_and_wakes_on_touch():
+    governor, clock, now = make_governor()
+    now[0] = 0.5
+    governor.update()
+    assert governor.mode == MODE_ACTIVE and clock._max_fps == 60
+
+    now[0] = 1.2
+    governor.update()
+    assert governor.mode == MODE_IDLE and clock._max_fps == 10
+
+    now[0] = 3.2
+    governor.notify_activity()  # Touch: full rate before the next frame
+    assert governor.mode == MODE_ACTIVE and clock._max_fps == 60
+
+    stats = governor.get_stats()
+    assert abs(stats["time_active_s"] - 1.2) < 1e-9  # Idle detected at the 1.2 s frame
+    assert abs(stats["time_idle_s"] - 2.0) < 1e-9
+    assert stats["wakeups"] == 1
+
+
+def test_animations_and_state_changes_keep_full_rate():
+    governor, clock, now = make_governor()
+    animating = [True]
+    version = [0]
+    governor.add_busy_source(lambda: animating[0])
+    governor.add_change_source(lambda: version[0])
+
+    now[0] = 5.0
+    governor.update()
+    assert governor.mode == MODE_ACTIVE
+
+    animating[0] = False
+    now[0] = 6.5
+    governor.update()
+    assert governor.mode == MODE_IDLE
+
+    version[0] += 1  # Incoming Live update changed AppState
+    now[0] = 7.0
+    governor.update()
+    assert governor.mode == MODE_ACTIVE and clock._max_fps == 60
@@ -0,0 +1,75 @@
+import os
+import sys
+
+# Ensure project root is on the import path for test execution
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from logic.state.app_state import SCENE_GROWTH_MARGIN
+from logic.state.grid_store import ClipGridStore
+from logic.state.models import ClipStatus
+
+
+def test_grid_backed_state_keeps_track_state_accessors(make_state):
+    state = make_state(tracks=3, scenes=4, use_grid_store=True)
+    track = state.m.tracks[1]
+
+    state.set_clip_status(1, 2, "playing")
+    state.set_clip_name(1, 2, "Bassline")
+
+    # Same TrackState object, updated in place through the view
+    assert state.m.tracks[1] is track
+    clip = track.clips[2]
+    assert clip.status == ClipStatus.PLAYING and clip.is_playing
+    assert clip.name == "Bassline"
+    assert len(track.clips) == 4
+    assert [s for s, c in track.clips.items() if c.is_playing] == [2]
+
+
+def test_vectorized_queries():
+    grid = ClipGridStore(tracks=4, scenes=6)
+    grid.set_status(0, 5, "playing")
+    grid.set_status(2, 5, "playing")
+    grid.set_status(3, 1, "queued")
+    grid.set_has_content(1, 5, True)
+
+    assert grid.tracks_with_status_in_scene(5).tolist() == [0, 2]
+    assert grid.tracks_with_any("queued").tolist() == [3]
+    assert grid.playing_scene_per_track().tolist() == [5, -1, 5, -1]
+    assert grid.fully_playing_scenes().tolist() == []  # track 1 has idle content in scene 5
+
+
+def test_resize_preserves_overlap_and_interns_names():
+    grid = ClipGridStore(tracks=2, scenes=2)
+    grid.set_name(0, 0, "Loop")
+    grid.set_name(1, 1, "Loop")
+    grid.resize(8, 4)
+
+    assert grid.shape == (8, 4)
+    assert grid.get_clip(1, 1).name == "Loop"
+    assert grid.names.count("Loop") == 1
+
+
+def test_grid_grows_for_scenes_beyond_the_initial_count(make_state):
+    state = make_state(names=["Kick", "Bass"], use_grid_store=True)  # 12 scenes until Live says otherwise
+    state.set_clip_status(0, 1, "playing")
+
+    state.set_clip_name(1, 20, "Outro")
+    assert state.m.scenes_count == 21
+    assert state.m.tracks[1].clips[20].name == "Outro"
+    assert state.m.tracks[0].clips[1].is_playing
+
+    state.set_scenes_count(32)
+    assert state.grid.shape == (2, 32) and len(state.m.tracks[0].clips) == 32
+    assert state.m.tracks[1].clips[20].name == "Outro"
+
+
+def test_scene_growth_is_capped_and_unknown_statuses_are_empty(make_state):
+    state = make_state(tracks=2, scenes=4, use_grid_store=True)
+
+    state.set_clip_status(0, 4 + SCENE_GROWTH_MARGIN, "playing")
+    state.set_clip_name(1, 1_000_000, "Corrupt")
+    assert state.grid.shape == (2, 4)
+
+    state.set_clip_status(1, 0, "playing")
+    state.set_clip_status(1, 0, "bogus")
+    assert state.m.tracks[1].clips[0].status == ClipStatus.EMPTY
@@ -0,0 +1,28 @@
+import os
+import shutil
+import sys
+
+# Ensure project root is on the import path for test execution
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from ui.icon_atlas import ICONS_DIR, IconAtlas, build_atlas, icon_files
+
+
+def test_build_packs_every_icon_into_one_page(tmp_path):
+    for png in icon_files(ICONS_DIR):
+        shutil.copy(png, tmp_path / png.name)
+    build_atlas(tmp_path)
+
+    atlas = IconAtlas()
+    assert atlas.load(tmp_path, textures=False)
+    assert atlas.ids == {p.stem for p in icon_files(ICONS_DIR)}
+    assert len(list(tmp_path.glob("icons-*.png"))) == 1
+    assert atlas.source("clip.png") == "atlas://icons/clip"
+    assert atlas.source("play") == "atlas://icons/play"
+    assert atlas.source("mixer.png") == "mixer.png"  # Not in the atlas: loose file
+
+
+def test_shipped_atlas_is_up_to_date():
+    atlas = IconAtlas()
+    assert atlas.load(ICONS_DIR, textures=False)
+    assert atlas.missing(p.name for p in icon_files(ICONS_DIR)) == []
@@ -0,0 +1,62 @@
+import os
+import sys
+
+# Ensure project root is on the import path for test execution
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from logic.state.app_state import AppState
+from logic.state.journal import DeltaJournal
+
+
+def test_drag_coalesces_and_undo_redo_restore_values():
+    now = [0.0]
+    state = AppState()
+    state.journal = DeltaJournal(time_fn=lambda: now[0])
+    state.init_project(tracks=2, scenes=1)
+
+    for step in range(10):  # One encoder drag
+        now[0] += 0.05
+        state.set_track_volume(0, 0.8 - step * 0.05, user=True)
+    now[0] += 2.0
+    state.set_track_mute(1, 1, user=True)
+    state.set_track_volume(1, 0.1)  # From Live: not journaled
+
+    assert len(state.journal) == 2
+    assert [d.field for d in state.undo()] == ["mute"]
+    assert state.m.tracks[1].mute is False
+    undone = state.undo()
+    assert abs(state.m.tracks[0].volume - 0.8) < 1e-6
+    assert abs(undone[0].new - 0.35) < 1e-6
+
+    state.redo()
+    assert abs(state.m.tracks[0].volume - 0.35) < 1e-6
+
+
+def test_ring_memory_is_bounded():
+    journal = DeltaJournal(capacity=16, coalesce_window=0.0, time_fn=lambda: 0.0)
+    for i in range(1000):
+        journal.record("solo", i % 8, 0.0, 1.0)
+
+    assert len(journal) == 16
+    assert journal.get_stats()["dropped"] == 1000 - 16
+    assert sum(1 for _ in iter(journal.undo, [])) == 16
+
+
+def test_setters_and_bundled_edits_share_addresses():
+    from logic.osc_client import OSCClient
+
+    client = OSCClient()
+    sent = []
+    client.send_message = lambda address, *args: sent.append((address, args))
+
+    client.set_track_volume(2, 1.4)
+    client.set_track_send(2, "B", 0.3)
+    client.set_track_solo(1, True)
+    client.set_device_parameter(0, 3, 7, 0.25)
+    assert sent == [
+        OSCClient.edit_message("volume", 2, 1.4),
+        OSCClient.edit_message("send", 2, 0.3, sub=1),
+        OSCClient.edit_message("solo", 1, 1.0),
+        OSCClient.edit_message("device_parameter", 0, 0.25, sub=3, param=7),
+    ]
+    assert sent[0] == ("/live/track/2/volume", (1.0,))
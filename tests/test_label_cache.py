@@ -0,0 +1,67 @@
+import os
+import sys
+
+# Ensure project root is on the import path for test execution
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from ui.label_cache import LabelTextureCache
+
+
+class FakeTexture:
+    def __init__(self, text):
+        self.text = text
+        self.size = (8 * len(text), 16)
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def make_cache(**kwargs):
+    rendered = []
+
+    def render(text, font_name, font_size, color, bold, max_width):
+        rendered.append(text)
+        return FakeTexture(text)
+
+    clock = Clock()
+    return LabelTextureCache(render_fn=render, time_fn=clock, **kwargs), rendered, clock
+
+
+def test_same_label_is_rasterized_once():
+    cache, rendered, _ = make_cache()
+    first = cache.get_texture("Kick Loop", 10)
+    assert cache.get_texture("Kick Loop", 10) is first
+    assert cache.get_texture("Kick Loop", 12) is not first  # Size is part of the key
+    assert cache.get_texture("", 10) is None
+    assert rendered == ["Kick Loop", "Kick Loop"]
+
+
+def test_memory_cap_evicts_least_recently_used():
+    # Each texture is 8 * 4 * 16 * 4 = 2048 bytes: three fit
+    cache, rendered, _ = make_cache(max_bytes=3 * 2048)
+    for name in ("aaaa", "bbbb", "cccc"):
+        cache.get_texture(name, 10)
+    cache.get_texture("aaaa", 10)  # Touch: "bbbb" is now the oldest
+    cache.get_texture("dddd", 10)
+    assert cache.get_stats()["bytes"] <= 3 * 2048
+
+    cache.get_texture("aaaa", 10)
+    cache.get_texture("bbbb", 10)
+    assert rendered == ["aaaa", "bbbb", "cccc", "dddd", "bbbb"]
+
+
+def test_rasterization_rate_is_a_sliding_second():
+    cache, _, clock = make_cache()
+    for i in range(5):
+        cache.get_texture(f"clip {i}", 10)
+    assert cache.rasterizations_per_second() == 5
+    clock.now = 0.5
+    cache.get_texture("late", 10)
+    clock.now = 1.2
+    assert cache.rasterizations_per_second() == 1
+    assert cache.get_stats()["rasterizations"] == 6
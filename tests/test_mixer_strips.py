@@ -0,0 +1,62 @@
+import os
+import sys
+
+# Ensure project root is on the import path for test execution
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from kivy.clock import Clock
+from kivy.uix.scrollview import ScrollView
+
+from logic.bus import bus
+from ui.widgets.mixer_strips import MixerStrips
+from ui.widgets.track_volume import TrackVolume
+
+
+def test_set_state_does_not_echo_to_bus():
+    heard = []
+    bus.on("track:volume", lambda **kw: heard.append(kw["value"]))
+    strip = TrackVolume(track_index=3)
+    strip.set_state(volume=0.2, is_mute=True)
+    Clock.tick()
+    assert (strip.volume, strip.is_mute, heard) == (0.2, True, [])
+
+    strip.volume = 0.4  # User edit still notifies
+    Clock.tick()
+    assert heard == [0.4]
+
+
+def test_reconcile_reuses_strips_across_structure_changes():
+    strips = MixerStrips()
+    assert strips.reconcile(["Kick", "Bass", "Pad"])
+    first = list(strips.strips)
+
+    assert not strips.reconcile(["Kick", "Bass", "Pad"])
+    assert strips.strips == first
+
+    assert strips.reconcile(["Kick"])
+    assert strips.reconcile(["Kick", "Snare", "Pad", "Lead"])
+    assert strips.strips[:3] == first
+    assert [s.track_index for s in strips.strips] == [0, 1, 2, 3]
+    assert strips.strips[1].track_name == "Snare"
+    assert (strips.created, strips.reused) == (4, 2)
+    assert list(strips.children) == list(reversed(strips.strips))
+
+
+def test_only_visible_strips_are_synced(make_state):
+    state = make_state(names=[f"Track {t}" for t in range(32)])
+    state.set_track_volume(20, 0.3)
+    scroll = ScrollView(size=(300, 300), do_scroll_y=False)
+    strips = MixerStrips(size_hint_x=None, strip_width=85, spacing=3, padding=(8, 10))
+    scroll.add_widget(strips)
+    strips.reconcile([f"Track {t}" for t in range(32)])
+    strips.do_layout()
+    strips.width = strips.minimum_width
+
+    assert strips.sync_visible(state) == len(strips.visible_range()) == 4
+    assert strips.strips[20].volume != 0.3
+
+    strips.app_state = state
+    scroll.scroll_x = 20 * 88 / (strips.width - scroll.width)
+    assert 20 in strips.visible_range()
+    assert strips.strips[20].volume == 0.3
+    assert strips.get_stats()["stale"] == 32 - strips.synced
@@ -0,0 +1,39 @@
+import os
+import sys
+
+import pytest
+
+# Ensure project root is on the import path for test execution
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from logic.state.models import DEFAULT_COLOR, EMPTY_CLIP, ClipSlotState, clip_slot, intern_color
+from logic.state import models
+
+
+def test_empty_cells_share_one_flyweight(make_state):
+    state = make_state(tracks=3, scenes=4)
+    state.set_clip_status(0, 0, "playing")
+    state.set_clip_status(0, 0, "empty")
+
+    clips = [c for t in state.m.tracks.values() for c in t.clips.values()]
+    assert all(c is EMPTY_CLIP for c in clips)
+
+
+def test_clip_colors_are_interned():
+    a = clip_slot("playing", "Bass", [1.0, 0.0, 0.5, 1.0])
+    b = clip_slot("queued", "Drums", (1.0, 0.0, 0.5, 1.0))
+    assert a.color is b.color
+
+
+@pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots need Python 3.10+")
+def test_clip_slots_have_no_dict():
+    assert not hasattr(ClipSlotState(), "__dict__")
+
+
+def test_color_pool_is_bounded():
+    pool = models._COLOR_POOL
+    for i in range(pool.max_entries + 500):
+        intern_color((i / 4096, 0.5, 0.5, 1.0))
+    assert len(pool) == pool.max_entries
+    assert intern_color(list(DEFAULT_COLOR)) is DEFAULT_COLOR
+    assert clip_slot("empty", "", (0.25, 0.25, 0.25, 1.0)) is EMPTY_CLIP
@@ -0,0 +1,73 @@
+import os
+import sys
+from dataclasses import replace
+
+# Ensure project root is on the import path for test execution
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from logic.live_integration import LiveIntegration
+from logic.osc_routes import ROUTES
+from logic.state.app_state import AppState
+
+ROUTE = {route.address: route for route in ROUTES}
+
+
+def test_routed_messages_are_applied_in_one_drain(make_state):
+    state = make_state(tracks=4, scenes=2)
+    live = LiveIntegration(state)
+
+    for track in range(4):
+        live._enqueue_update(ROUTE["/live/track/get/volume"], "/live/track/get/volume", track, 0.25)
+    live._enqueue_update(ROUTE["/live/track/get/solo"], "/live/track/get/solo", 2, 1)
+    live._enqueue_update(ROUTE["/live/clip/get/name"], "/live/clip/get/name", 1, 0, "Intro")
+    live._drain_updates()
+
+    assert [t.volume for t in state.m.tracks.values()] == [0.25] * 4
+    assert state.m.tracks[2].solo is True
+    assert state.m.tracks[1].clips[0].name == "Intro"
+    stats = live.get_dispatch_stats()
+    assert stats["messages"] == 6 and stats["drains"] == 1
+    assert live.is_syncing is False
+
+
+def test_short_messages_are_dropped_by_decoder():
+    live = LiveIntegration(AppState())
+    live._enqueue_update(ROUTE["/live/track/get/volume"], "/live/track/get/volume", 0)
+    assert live.dispatch_stats["dropped"] == 1
+    assert not live._inbox
+
+
+def test_every_address_is_routed_once():
+    addresses = [route.address for route in ROUTES]
+    assert len(addresses) == len(set(addresses))
+
+
+def test_failing_update_is_logged_and_the_drain_continues(make_state):
+    state = make_state(tracks=2, scenes=2, use_grid_store=True)
+    live = LiveIntegration(state)
+    status = ROUTE["/live/clip/get/playing_status"]
+
+    broken = replace(status, setter=lambda s, u: s.set_clip_status(u["track"], u["scene"], None, "x"))
+
+    live._enqueue_update(broken, status.address, 0, 0, "playing")  # Setter raises TypeError
+    live._enqueue_update(ROUTE["/live/track/get/volume"], "/live/track/get/volume", 1, 0.5)
+    live._enqueue_update(status, status.address, 1, 1, "playing")
+    live._drain_updates()
+
+    assert not live._inbox
+    assert state.m.tracks[1].volume == 0.5
+    assert state.m.tracks[1].clips[1].is_playing
+    assert not state.m.tracks[0].clips[0].is_playing
+    assert live.dispatch_stats["errors"] == 1
+
+
+def test_track_names_reconcile_is_queued_for_the_ui_thread():
+    state = AppState()
+    live = LiveIntegration(state)
+    route = ROUTE["/live/song/get/track_names"]
+
+    live._enqueue_update(route, route.address, "Kick", "Bass", "Pad")
+    assert state.m.tracks == {}  # Nothing written on the receiving thread
+    live._drain_updates()
+    assert [t.name for t in state.m.tracks.values()] == ["Kick", "Bass", "Pad"]
+    assert live.dispatch_stats["errors"] == 0
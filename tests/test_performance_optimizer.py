@@ -0,0 +1,131 @@
+import os
+import random
+import sys
+
+# Ensure project root is on the import path for test execution
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from kivy.clock import Clock
+
+from logic.bus import bus
+from logic.performance_optimizer import (PRIORITY_HIGH, PRIORITY_LOW, FrameScheduler,
+                                         PerformanceOptimizer)
+
+
+def test_burst_of_1000_msgs_per_second_never_drops_a_cell():
+    optimizer = PerformanceOptimizer(batch_window=0.05)
+    delivered = {}
+    bus.on("ui:clip_batch_update",
+           lambda track, updates: delivered.update(
+               {(d["track"], d["scene"]): d["status"] for _, d in updates}))
+
+    rng = random.Random(7)
+    latest = {}
+    for i in range(1000):  # 1 s at 1000 msg/s, flushed every 50 ms window
+        track, scene = rng.randrange(16), rng.randrange(16)
+        status = rng.choice(["playing", "queued", "empty"])
+        latest[(track, scene)] = status
+        optimizer.batch_ui_update("clip_status", {"track": track, "scene": scene, "status": status})
+        if i % 50 == 49:
+            optimizer.flush()
+            Clock.tick()
+
+    assert delivered == latest
+    stats = optimizer.get_batch_stats()
+    assert stats["flushes"] == 20
+    assert stats["flushed"] + stats["coalesced"] == 1000
+
+
+def test_flush_keeps_first_insertion_order():
+    optimizer = PerformanceOptimizer()
+    order = []
+    bus.on("ui:clip_batch_update",
+           lambda track, updates: order.extend((d["track"], d["scene"], d["status"]) for _, d in updates))
+
+    for track, scene, status in [(9, 0, "queued"), (9, 1, "queued"), (9, 0, "playing")]:
+        optimizer.batch_ui_update("clip_status", {"track": track, "scene": scene, "status": status})
+    optimizer.flush()
+    Clock.tick()
+
+    assert order[-2:] == [(9, 0, "playing"), (9, 1, "queued")]
+
+
+def test_throttled_final_status_is_delivered_on_trailing_edge():
+    now = [100.0]
+    optimizer = PerformanceOptimizer(time_fn=lambda: now[0])
+    delivered = []
+
+    for status, t in (("queued", 100.0), ("playing", 100.02), ("empty", 100.05)):
+        now[0] = t
+        if not optimizer.should_throttle("clip_status", "0:1",
+                                         trailing=lambda s=status: delivered.append(s)):
+            delivered.append(status)
+
+    assert delivered == ["queued"]
+    now[0] = 100.09
+    optimizer.trailers.advance()
+    assert delivered == ["queued"]
+    now[0] = 100.11
+    optimizer.trailers.advance()
+    assert delivered == ["queued", "empty"]  # Latest value, exactly once
+    assert len(optimizer.trailers) == 0
+
+
+def test_clear_cache_cancels_pending_trailers():
+    now = [100.0]
+    optimizer = PerformanceOptimizer(time_fn=lambda: now[0])
+    delivered = []
+    for status, t in (("queued", 100.0), ("playing", 100.02)):
+        now[0] = t
+        if not optimizer.should_throttle("clip_status", "0:1",
+                                         trailing=lambda s=status: delivered.append(s)):
+            delivered.append(status)
+    assert len(optimizer.trailers) == 1
+
+    optimizer.clear_cache()
+    now[0] = 101.0
+    optimizer.trailers.advance()
+    assert delivered == ["queued"]
+    assert len(optimizer.trailers) == 0
+
+
+def test_throttle_key_table_is_bounded():
+    optimizer = PerformanceOptimizer()
+    optimizer.max_throttle_keys = 100
+    for i in range(1000):
+        optimizer.should_throttle("clip_status", str(i))
+    assert len(optimizer._last_event_times) == 100
+
+
+def test_frame_scheduler_runs_by_priority_within_budget():
+    now = [0.0]
+    scheduler = FrameScheduler(budget_ms=5.0, time_fn=lambda: now[0])
+    ran = []
+
+    def rebuild():
+        for column in range(4):
+            now[0] += 0.002  # 2 ms per column
+            ran.append(("column", column))
+            yield
+
+    def feedback():
+        now[0] += 0.001
+        ran.append("feedback")
+
+    scheduler.submit("rebuild", rebuild, priority=PRIORITY_LOW, cost_ms=2.0)
+    scheduler.submit("feedback", feedback, priority=PRIORITY_HIGH, cost_ms=1.0)
+
+    scheduler.run_frame(1 / 60)
+    assert ran == ["feedback", ("column", 0), ("column", 1)]
+    scheduler.run_frame(1 / 60)
+    assert ran[3:] == [("column", 2), ("column", 3)]
+    scheduler.run_frame(1 / 60)
+    assert len(scheduler) == 0
+    assert scheduler.get_stats()["completed"] == 2
+
+
+def test_frame_scheduler_shrinks_budget_on_slow_frames():
+    scheduler = FrameScheduler(budget_ms=8.0)
+    scheduler.run_frame(0.040)  # 40 ms frame on a 16.7 ms target
+    assert scheduler.budget_ms < 8.0
+    assert scheduler.get_stats()["overruns"] == 1
@@ -0,0 +1,34 @@
+import os
+import sys
+
+# Ensure project root is on the import path for test execution
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+
+
+def test_selector_recomputes_only_when_its_fields_change(make_state):
+    state = make_state(tracks=3, scenes=2)
+    state.set_clip_status(1, 1, "playing")
+
+    assert state.selectors.get("playing_clips") == {1: 1}
+    state.set_track_volume(0, 0.3)  # Unrelated field
+    assert state.selectors.get("playing_clips") == {1: 1}
+    assert state.selectors.get_stats()["playing_clips"] == {"hits": 1, "misses": 1}
+
+    state.set_clip_status(1, 1, "empty")
+    assert state.selectors.get("playing_clips") == {}
+    assert state.selectors.get_stats()["playing_clips"]["misses"] == 2
+
+
+def test_dependent_selectors_and_grid_store_agree(make_state):
+    for use_grid in (False, True):
+        state = make_state(tracks=2, scenes=3, use_grid_store=use_grid)
+        state.set_clip_status(0, 2, "playing")
+        state.set_clip_status(1, 2, "playing")
+        state.set_clip_name(1, 0, "Idle")
+        assert state.selectors.get("fully_playing_scenes") == (2,)
+
+        assert state.selectors.get("any_soloed") is False
+        state.set_track_solo(1, 1)
+        assert state.selectors.get("any_soloed") is True
+        assert state.selectors.dependencies("any_soloed") == ("track_solo",)
@@ -0,0 +1,58 @@
+import os
+import sys
+
+# Ensure project root is on the import path for test execution
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from logic.state.shared_mirror import CMD_TRIGGER_CLIP, CMD_VOLUME, SharedStateMirror
+
+
+def test_reader_sees_published_grid_and_incremental_changes(make_state):
+    state = make_state(tracks=4, scenes=3, use_grid_store=True)
+    writer = SharedStateMirror(max_tracks=8, max_scenes=8)
+    reader = SharedStateMirror(writer.name, create=False)
+    try:
+        writer.publish(state)
+        state.set_clip_status(2, 1, "playing")
+        state.set_track_volume(3, 0.25)
+        state.set_track_solo(3, 1)
+        writer.sync(state)
+
+        snap = reader.read()
+        assert snap.status.shape == (4, 3)
+        assert snap.status[2, 1] == 1
+        assert abs(snap.volume[3] - 0.25) < 1e-6
+        assert snap.flags[3] == 2
+        assert snap.seq % 2 == 0
+    finally:
+        reader.close()
+        writer.close()
+
+
+def test_command_ring_is_fifo_and_bounded():
+    mirror = SharedStateMirror(max_tracks=2, max_scenes=2, ring_capacity=4)
+    hardware = SharedStateMirror(mirror.name, create=False)
+    try:
+        pushed = [hardware.push_command(CMD_VOLUME, 1, value=i / 10) for i in range(6)]
+        assert pushed == [True] * 4 + [False] * 2
+
+        commands = mirror.drain_commands()
+        assert [round(c[3], 2) for c in commands] == [0.0, 0.1, 0.2, 0.3]
+        assert mirror.drain_commands() == []
+        assert hardware.push_command(CMD_VOLUME, 0, value=1.0)
+    finally:
+        hardware.close()
+        mirror.close()
+
+
+def test_out_of_range_hardware_commands_are_dropped(make_state):
+    state = make_state(tracks=2, scenes=2, use_grid_store=True)
+    mirror = SharedStateMirror(max_tracks=2, max_scenes=2)
+    try:
+        mirror._apply_command(state, CMD_TRIGGER_CLIP, 1, 9, 0.0)
+        mirror._apply_command(state, CMD_VOLUME, 7, 0, 0.5)
+        mirror._apply_command(state, CMD_TRIGGER_CLIP, 1, 1, 0.0)
+        stats = mirror.get_stats()
+        assert (stats["commands_dropped"], stats["commands_applied"]) == (2, 1)
+    finally:
+        mirror.close()
@@ -0,0 +1,84 @@
+import os
+import sys
+
+# Ensure project root is on the import path for test execution
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from logic.state.app_state import AppState
+from logic.state.snapshot import SnapshotStore, decode_snapshot, encode_snapshot, set_fingerprint
+
+
+def test_snapshot_round_trip_keeps_grid_and_mixer(tmp_path, make_state):
+    """A saved snapshot restores clip statuses, names and mixer values."""
+    state = make_state(names=["Kick", "Bass"], scenes=4)
+    state.set_clip_status(1, 2, "playing")
+    state.set_track_volume(0, 0.5)
+    state.set_track_solo(1, 1)
+    state.m.tracks[1].devices = ["Operator", "EQ Eight"]
+
+    store = SnapshotStore(tmp_path / "set.snapshot")
+    fingerprint = set_fingerprint(["Kick", "Bass"])
+    assert store.save(state.m, fingerprint)
+
+    loaded_fp, model = store.load()
+    assert loaded_fp == fingerprint
+    assert model.scenes_count == 4
+    assert model.tracks[1].clips[2].status.value == "playing"
+    assert model.tracks[0].volume == 0.5
+    assert model.tracks[1].solo is True
+    assert model.tracks[1].devices == ["Operator", "EQ Eight"]
+
+
+def test_corrupt_snapshot_is_ignored(tmp_path):
+    """Unreadable snapshots fall back to a cold start instead of raising."""
+    path = tmp_path / "set.snapshot"
+    path.write_bytes(b"PSHS\x01\x00garbage")
+    assert SnapshotStore(path).load() is None
+
+
+def test_fingerprint_changes_with_track_order():
+    assert set_fingerprint(["A", "B"]) != set_fingerprint(["B", "A"])
+    data = encode_snapshot(AppState().m, set_fingerprint([]))
+    assert decode_snapshot(data)[0] == set_fingerprint([])
+
+
+def receive_track_names(live, *names):
+    """Deliver a track_names reply the way the OSC thread does (queued, then drained)"""
+    from logic.osc_routes import ROUTES
+    route = next(r for r in ROUTES if r.address == "/live/song/get/track_names")
+    live._enqueue_update(route, route.address, *names)
+    live._drain_updates()
+
+
+def test_fingerprint_hit_revalidates_mixer_clips_and_devices(tmp_path, make_state, osc):
+    """A matching set still re-reads every mixer field, known clips and devices."""
+    from kivy.clock import Clock
+    from logic.bus import bus
+    from logic.live_integration import LiveIntegration
+
+    state = make_state(names=["Kick", "Bass"], scenes=4)
+    state.set_clip_name(1, 2, "Sub")
+    store = SnapshotStore(tmp_path / "set.snapshot")
+    store.save(state.m, set_fingerprint(["Kick", "Bass"]))
+
+    live = LiveIntegration(AppState(), snapshot_store=store)
+    assert live.load_snapshot()
+    live.osc_client = osc
+    live.devices.attach(osc)
+    receive_track_names(live, "Kick", "Bass")
+
+    sent = set(osc.sent)
+    for getter in ("volume", "pan", "mute", "solo", "arm", "color"):
+        assert (f"/live/track/get/{getter}", (1,)) in sent
+    assert ("/live/track/get/send", (1, 2)) in sent
+    assert ("/live/clip/get/name", (1, 2)) in sent
+    assert ("/live/clip/get/length", (1, 2)) in sent
+    assert ("get_track_devices", (0,)) in sent
+
+    # Later polls of an unchanged set send nothing and re-emit nothing
+    osc.sent.clear()
+    heard = []
+    bus.on("live:track_names", lambda **kw: heard.append(kw["names"]))
+    receive_track_names(live, "Kick", "Bass")
+    Clock.tick()
+    assert osc.sent == [] and heard == []
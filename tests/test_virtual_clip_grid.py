@@ -0,0 +1,70 @@
+import os
+import sys
+
+# Ensure project root is on the import path for test execution
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from ui.widgets.virtual_clip_grid import VirtualClipGrid
+
+
+def test_scrolling_rebinds_pool_without_allocating(make_tracks):
+    grid = VirtualClipGrid(size=(88 * 4, 30 * 4), cell_width=88, cell_height=30)
+    grid.set_data(make_tracks(256, 64, labelled=True))
+    allocated = grid.allocations
+    assert allocated == 5 * 5
+
+    for step in range(200):
+        grid.scroll_to(x=step * 37, y=step * 11)
+    assert grid.allocations == allocated
+
+    grid.scroll_to(x=88 * 10 + 5, y=30 * 3)
+    slot = grid.slot_for(10, 3)
+    assert (slot.track_index, slot.scene_index, slot.label_text) == (10, 3, "10/3")
+    assert grid.slot_for(0, 0) is None
+    assert grid.visible_range() == (10, 15, 3, 8)
+
+
+def test_cells_past_the_set_are_hidden(make_tracks):
+    grid = VirtualClipGrid(size=(88 * 4, 30 * 4), cell_width=88, cell_height=30)
+    grid.set_data(make_tracks(2, 3, labelled=True))
+    assert grid.visible_range() == (0, 2, 0, 3)
+    assert grid.slot_for(1, 2).opacity == 1
+    assert grid.slot_for(3, 0) is None
+    assert sum(slot.opacity == 0 for slot in grid._pool) == 5 * 5 - 2 * 3
+
+
+def test_clip_batch_update_repaints_indexed_slots(make_tracks):
+    from ui.screens.clip_view import ClipViewScreen
+
+    screen = ClipViewScreen(name="clip_test")
+    screen.live_tracks = make_tracks(16, 8, labelled=True)
+    screen.clip_grid = VirtualClipGrid(size=(88 * 4, 30 * 4), cell_width=88, cell_height=30)
+    screen.clip_grid.set_data(screen.live_tracks)
+
+    screen._on_clip_batch_update(track=1, updates=[
+        ("clip_status", {"track": 1, "scene": 2, "status": "queued"}),
+        ("clip_status", {"track": 1, "scene": 2, "status": "playing"}),
+        ("clip_status", {"track": 9, "scene": 0, "status": "playing"}),  # Off screen
+    ])
+    assert screen.clip_grid.slot_for(1, 2).status == "playing"
+    assert screen.live_tracks[9]["clips"][0]["status"] == "playing"
+    screen.clip_grid.scroll_to(x=88 * 9)
+    assert screen.clip_grid.slot_for(9, 0).status == "playing"
+
+
+def test_scene_count_change_extends_clip_rows(make_state):
+    from ui.screens.clip_view import ClipViewScreen
+
+    state = make_state(names=["Kick", "Bass"])
+    screen = ClipViewScreen(app_state=state, name="clip_scenes_test")
+    screen.clip_grid = VirtualClipGrid(size=(88 * 4, 30 * 4), cell_width=88, cell_height=30)
+    screen._use_state_data()
+
+    state.set_scenes_count(40)
+    state.set_clip_name(1, 30, "Outro")
+    screen._on_scene_count_changed(count=40)
+
+    assert screen.clip_grid.scenes == 40
+    assert [len(t["clips"]) for t in screen.live_tracks] == [40, 40]
+    screen.clip_grid.scroll_to(y=30 * 30)
+    assert screen.clip_grid.slot_for(1, 30).label_text == "Outro"
@@ -0,0 +1,131 @@
+# ui/animation_ticker.py
+"""One clock for every UI animation (clip blink/pulse, meters).
+
+Widgets register the ``Color`` instruction of an animated cell with a
+base color and an effect instead of scheduling their own intervals. A
+single Kivy interval walks the registry, derives the phase from the beat
+clock (or from wall time at the current tempo while Live is stopped) and
+writes only colors whose level actually changed. The interval is
+cancelled as soon as the registry is empty, so an idle controller does
+no animation work at all.
+"""
+from typing import Callable, Dict, Hashable
+import logging
+import time
+
+from logic.beat_clock import beat_clock as default_beat_clock
+
+BLINK = "blink"   # On for the first half of each beat, dimmed for the second
+PULSE = "pulse"   # Full brightness on the beat, decaying until the next one
+
+BLINK_OFF = 0.25
+PULSE_FLOOR = 0.55
+LEVEL_STEPS = 16  # Quantize levels so slow decays don't rewrite every frame
+
+
+def effect_level(effect: str, phase: float) -> float:
+    """Brightness multiplier for ``effect`` at beat ``phase`` in [0, 1)"""
+    if effect == BLINK:
+        return 1.0 if phase < 0.5 else BLINK_OFF
+    if effect == PULSE:
+        return 1.0 - (1.0 - PULSE_FLOOR) * phase
+    return 1.0
+
+
+class AnimationTicker:
+    """Registry of animated color instructions driven by one interval"""
+
+    def __init__(self, fps: float = 30.0, beat_clock=None,
+                 time_fn: Callable[[], float] = time.monotonic, schedule: bool = True):
+        self.logger = logging.getLogger(__name__)
+        self.fps = fps
+        self.beat_clock = beat_clock or default_beat_clock
+        self.time_fn = time_fn
+        self.schedule = schedule  # False: caller drives tick() (tests, benchmarks)
+
+        # key -> [color instruction, effect, (r, g, b, a), last level]
+        self._cells: Dict[Hashable, list] = {}
+        self._event = None
+
+        # Statistics
+        self.ticks = 0
+        self.color_writes = 0
+        self.starts = 0
+
+    @property
+    def active(self) -> bool:
+        """True while something is animating (the interval is running)"""
+        return bool(self._cells)
+
+    def __len__(self) -> int:
+        return len(self._cells)
+
+    # === REGISTRY ===
+
+    def animate(self, key: Hashable, color, effect: str, rgba):
+        """Animate ``color`` (a kivy Color) around base ``rgba`` until stop(key)"""
+        self._cells[key] = [color, effect, tuple(rgba), None]
+        self._apply(self._cells[key], self.phase())
+        self._ensure_running()
+
+    def stop(self, key: Hashable):
+        """Stop animating ``key``; the owner repaints its static color"""
+        if self._cells.pop(key, None) is not None and not self._cells:
+            self._pause()
+
+    def stop_owner(self, owner):
+        """Drop every ``(owner, ...)`` key (widget being rebuilt)"""
+        for key in [k for k in self._cells if isinstance(k, tuple) and k and k[0] is owner]:
+            del self._cells[key]
+        if not self._cells:
+            self._pause()
+
+    # === TICKING ===
+
+    def phase(self) -> float:
+        """Position inside the current beat, in [0, 1)"""
+        clock = self.beat_clock
+        if clock.playing:
+            beat = clock.beat_at()
+        else:
+            beat = self.time_fn() * clock.tempo / 60.0
+        return beat % 1.0
+
+    def tick(self, dt: float = 0.0):
+        self.ticks += 1
+        phase = self.phase()
+        for entry in self._cells.values():
+            self._apply(entry, phase)
+
+    def _apply(self, entry: list, phase: float):
+        level = round(effect_level(entry[1], phase) * LEVEL_STEPS) / LEVEL_STEPS
+        if level == entry[3]:
+            return
+        entry[3] = level
+        r, g, b, a = entry[2]
+        entry[0].rgba = (r * level, g * level, b * level, a)
+        self.color_writes += 1
+
+    def _ensure_running(self):
+        if self._event is None and self.schedule:
+            from kivy.clock import Clock
+            self._event = Clock.schedule_interval(self.tick, 1.0 / self.fps)
+            self.starts += 1
+
+    def _pause(self):
+        if self._event is not None:
+            self._event.cancel()
+            self._event = None
+
+    def get_stats(self) -> Dict[str, float]:
+        return {
+            "animated": len(self._cells),
+            "running": self._event is not None,
+            "ticks": self.ticks,
+            "color_writes": self.color_writes,
+            "starts": self.starts,
+        }
+
+
+# Global instance
+animation_ticker = AnimationTicker()
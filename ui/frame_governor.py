@@ -0,0 +1,137 @@
+# ui/frame_governor.py
+"""Idle-aware frame rate control.
+
+Kivy's main loop sleeps to honour ``Clock._max_fps``. The governor keeps
+that at the full rate while anything is happening and drops it to a low
+idle rate once a quiet period passes with no touch/key input, no
+animation, no pending frame jobs and no AppState change. Input switches
+back to full rate immediately, so the next frame already runs at full
+rate. Time spent in each mode is reported for power/thermal tuning.
+"""
+from typing import Callable, Dict, List
+import logging
+import time
+
+MODE_ACTIVE = "active"
+MODE_IDLE = "idle"
+
+
+class FrameGovernor:
+    """Switch Kivy's max fps between an active and an idle rate"""
+
+    def __init__(self, active_fps: int = 60, idle_fps: int = 10, idle_after: float = 1.5,
+                 clock=None, time_fn: Callable[[], float] = time.monotonic):
+        self.logger = logging.getLogger(__name__)
+        self.active_fps = active_fps
+        self.idle_fps = idle_fps
+        self.idle_after = idle_after  # Quiet seconds before dropping to idle_fps
+        self.time_fn = time_fn
+        if clock is None:
+            from kivy.clock import Clock as clock
+        self.clock = clock
+
+        self._busy_sources: List[Callable[[], bool]] = []    # True while busy
+        self._change_sources: List[list] = []                # [counter fn, last value]
+        self._event = None
+        self._window = None
+
+        now = time_fn()
+        self.mode = MODE_ACTIVE
+        self._last_activity = now
+        self._mode_since = now
+        self._time_in: Dict[str, float] = {MODE_ACTIVE: 0.0, MODE_IDLE: 0.0}
+        self._apply_fps()
+
+        # Statistics
+        self.switches = 0
+        self.wakeups = 0  # Idle -> active caused by input/events
+
+    # === ACTIVITY SOURCES ===
+
+    def add_busy_source(self, busy: Callable[[], bool]):
+        """Keep full rate while ``busy()`` is true (e.g. animations running)"""
+        self._busy_sources.append(busy)
+
+    def add_change_source(self, counter: Callable[[], int]):
+        """Count as activity whenever ``counter()`` changes (e.g. AppState.version)"""
+        self._change_sources.append([counter, counter()])
+
+    def notify_activity(self, *_):
+        """Touch, key or event activity: back to full rate right away"""
+        self._last_activity = self.time_fn()
+        if self.mode == MODE_IDLE:
+            self.wakeups += 1
+            self._set_mode(MODE_ACTIVE)
+
+    # === PER-FRAME CHECK ===
+
+    def update(self, dt: float = 0.0):
+        now = self.time_fn()
+        if self._polled_activity():
+            self._last_activity = now
+            if self.mode == MODE_IDLE:
+                self.wakeups += 1
+        quiet = now - self._last_activity
+        self._set_mode(MODE_IDLE if quiet >= self.idle_after else MODE_ACTIVE)
+
+    def _polled_activity(self) -> bool:
+        changed = False
+        for source in self._change_sources:
+            value = source[0]()
+            if value != source[1]:
+                source[1] = value
+                changed = True
+        return changed or any(busy() for busy in self._busy_sources)
+
+    def _set_mode(self, mode: str):
+        if mode == self.mode:
+            return
+        now = self.time_fn()
+        self._time_in[self.mode] += now - self._mode_since
+        self._mode_since = now
+        self.mode = mode
+        self.switches += 1
+        self._apply_fps()
+        self.logger.debug(f"Frame governor: {mode} ({self.fps} fps)")
+
+    @property
+    def fps(self) -> int:
+        return self.active_fps if self.mode == MODE_ACTIVE else self.idle_fps
+
+    def _apply_fps(self):
+        self.clock._max_fps = float(self.fps)
+
+    # === KIVY WIRING ===
+
+    def attach(self, window=None):
+        """Check every frame and treat window input as activity"""
+        if self._event is None:
+            self._event = self.clock.schedule_interval(self.update, 0)
+        if window is not None:
+            window.bind(on_motion=self.notify_activity, on_key_down=self.notify_activity)
+            self._window = window
+
+    def detach(self):
+        if self._event is not None:
+            self._event.cancel()
+            self._event = None
+        if self._window is not None:
+            self._window.unbind(on_motion=self.notify_activity, on_key_down=self.notify_activity)
+            self._window = None
+        self.mode = MODE_ACTIVE
+        self._apply_fps()
+
+    def get_stats(self) -> Dict[str, float]:
+        now = self.time_fn()
+        time_in = dict(self._time_in)
+        time_in[self.mode] += now - self._mode_since
+        total = time_in[MODE_ACTIVE] + time_in[MODE_IDLE]
+        return {
+            "mode": self.mode,
+            "fps": self.fps,
+            "time_active_s": time_in[MODE_ACTIVE],
+            "time_idle_s": time_in[MODE_IDLE],
+            "idle_ratio": time_in[MODE_IDLE] / total if total else 0.0,
+            "switches": self.switches,
+            "wakeups": self.wakeups,
+        }
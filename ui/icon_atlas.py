@@ -0,0 +1,103 @@
+# ui/icon_atlas.py
+"""Icon lookup backed by a single Kivy atlas of ``assets/icons/*.png``.
+
+Build (re-run whenever an icon changes)::
+
+    python -m ui.icon_atlas
+
+packs every icon into ``assets/icons/icons.atlas`` + ``icons-0.png``. At
+startup ``icon_atlas.load()`` reads that one file into one texture and
+registers it with Kivy's atlas cache, so icon widgets asking
+``icon_source("clip")`` get ``atlas://icons/clip`` regions of the same
+texture. Icons missing from the atlas fall back to their loose PNG.
+"""
+from pathlib import Path
+from typing import Iterable, List, Set
+import json
+import logging
+
+ATLAS_NAME = "icons"
+ATLAS_SIZE = 256
+ICONS_DIR = Path(__file__).resolve().parent.parent / "assets" / "icons"
+
+
+def _icon_id(name: str) -> str:
+    """'clip.png' / 'clip' -> 'clip'"""
+    return Path(name).stem if name.endswith(".png") else name
+
+
+def icon_files(icons_dir: Path) -> List[Path]:
+    """Source PNGs, excluding the atlas pages themselves"""
+    return sorted(p for p in icons_dir.glob("*.png") if not p.name.startswith(f"{ATLAS_NAME}-"))
+
+
+def build_atlas(icons_dir: Path = ICONS_DIR, size: int = ATLAS_SIZE) -> Path:
+    """Pack the icons into <icons_dir>/icons.atlas (needs PIL)"""
+    from kivy.atlas import Atlas
+    files = icon_files(icons_dir)
+    if not files:
+        raise FileNotFoundError(f"No icons in {icons_dir}")
+    Atlas.create(str(icons_dir / ATLAS_NAME), [str(p) for p in files], size)
+    return icons_dir / f"{ATLAS_NAME}.atlas"
+
+
+class IconAtlas:
+    """Which icons live in the atlas, and their image sources"""
+
+    def __init__(self):
+        self.logger = logging.getLogger(__name__)
+        self.ids: Set[str] = set()
+        self.loaded = False
+
+    def load(self, icons_dir: Path = ICONS_DIR, textures: bool = True) -> bool:
+        """Read the atlas once; ``textures=False`` only indexes ids (no GL needed)"""
+        path = icons_dir / f"{ATLAS_NAME}.atlas"
+        if not path.exists():
+            self.logger.warning(f"Icon atlas not built ({path}), using loose PNGs")
+            return False
+        if self._stale(icons_dir, path):
+            self.logger.warning("Icon atlas is older than assets/icons, run: python -m ui.icon_atlas")
+
+        with open(path) as f:
+            meta = json.load(f)
+        self.ids = {uid for regions in meta.values() for uid in regions}
+
+        if textures:
+            from kivy.atlas import Atlas
+            from kivy.cache import Cache
+            # Same cache key Kivy uses for "atlas://icons/<id>" lookups
+            Cache.append("kv.atlas", ATLAS_NAME, Atlas(str(path)))
+        self.loaded = True
+        self.logger.info(f"Icon atlas loaded: {len(self.ids)} icons")
+        return True
+
+    def _stale(self, icons_dir: Path, path: Path) -> bool:
+        built = path.stat().st_mtime
+        return any(p.stat().st_mtime > built for p in icon_files(icons_dir))
+
+    def source(self, name: str) -> str:
+        """Image source for an icon name ('clip' or 'clip.png')"""
+        if not name:
+            return ""
+        uid = _icon_id(name)
+        if uid in self.ids:
+            return f"atlas://{ATLAS_NAME}/{uid}"
+        return f"{uid}.png"  # Loose file via resource_add_path
+
+    def missing(self, names: Iterable[str]) -> List[str]:
+        return [n for n in names if _icon_id(n) not in self.ids]
+
+
+# Global instance
+icon_atlas = IconAtlas()
+
+
+def icon_source(name: str) -> str:
+    """kv-friendly shortcut: ``source: icon_source("play")``"""
+    return icon_atlas.source(name)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    out = build_atlas()
+    print(f"Wrote {out} ({len(icon_files(ICONS_DIR))} icons)")
@@ -0,0 +1,104 @@
+# ui/label_cache.py
+"""Shared texture cache for short UI labels (clip names, track headers).
+
+Rasterizing text through Kivy's text provider is the expensive part of a
+Label; during a resync hundreds of cells re-render the same handful of
+names. Widgets ask this cache for a texture keyed by
+``(text, font, size, color, bold, max_width)`` and draw it on their own
+canvas, so each distinct label is rasterized once until evicted.
+Entries are LRU-evicted past an entry bound or a texture memory cap.
+"""
+from collections import deque
+from typing import Any, Callable, Dict, Optional, Tuple
+import logging
+import time
+
+from logic.cache import BoundedCache, CacheBudget
+
+DEFAULT_FONT = "Roboto"
+
+
+def texture_bytes(texture) -> int:
+    """RGBA bytes held by a texture"""
+    width, height = texture.size
+    return int(width * height * 4)
+
+
+def render_label(text: str, font_name: str, font_size: float, color: Tuple,
+                 bold: bool, max_width: Optional[float]):
+    """Rasterize with the core text provider (None until a GL window exists)"""
+    from kivy.base import EventLoop
+    if EventLoop.window is None:
+        return None
+    from kivy.core.text import Label as CoreLabel
+    label = CoreLabel(text=text, font_name=font_name, font_size=font_size, color=color,
+                      bold=bold, text_size=(max_width, None), shorten=max_width is not None,
+                      max_lines=1)
+    label.refresh()
+    return label.texture
+
+
+class LabelTextureCache:
+    """LRU of label textures with a texture memory cap and a raster-rate metric"""
+
+    def __init__(self, max_entries: int = 1024, max_bytes: int = 4 * 1024 * 1024,
+                 render_fn: Callable[..., Any] = render_label,
+                 time_fn: Callable[[], float] = time.monotonic):
+        self.logger = logging.getLogger(__name__)
+        self.render_fn = render_fn
+        self.time_fn = time_fn
+        # Own budget: texture memory is accounted separately from data caches
+        self.budget = CacheBudget(max_bytes)
+        self._textures = BoundedCache("label_textures", max_entries, budget=self.budget,
+                                      size_fn=texture_bytes, time_fn=time_fn)
+        self._raster_times = deque()
+
+        # Statistics
+        self.rasterizations = 0
+
+    def get_texture(self, text: str, font_size: float, color: Tuple = (1, 1, 1, 1),
+                    bold: bool = False, font_name: str = DEFAULT_FONT,
+                    max_width: Optional[float] = None):
+        """Cached texture for a label, rasterizing on first use (None for empty text)"""
+        if not text:
+            return None
+        max_width = None if max_width is None else int(max_width)
+        key = (text, font_name, float(font_size), tuple(color), bold, max_width)
+        texture = self._textures.get(key)
+        if texture is None:
+            texture = self.render_fn(text, font_name, font_size, tuple(color), bold, max_width)
+            if texture is None:
+                return None
+            self._textures.put(key, texture)
+            self._note_rasterization()
+        return texture
+
+    def _note_rasterization(self):
+        self.rasterizations += 1
+        now = self.time_fn()
+        self._raster_times.append(now)
+        while self._raster_times and self._raster_times[0] <= now - 1.0:
+            self._raster_times.popleft()
+
+    def rasterizations_per_second(self) -> int:
+        """Rasterizations over the last second"""
+        now = self.time_fn()
+        while self._raster_times and self._raster_times[0] <= now - 1.0:
+            self._raster_times.popleft()
+        return len(self._raster_times)
+
+    def clear(self):
+        self._textures.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        stats = self._textures.get_stats()
+        stats.update(
+            max_bytes=self.budget.max_bytes,
+            rasterizations=self.rasterizations,
+            rasterizations_per_second=self.rasterizations_per_second(),
+        )
+        return stats
+
+
+# One texture cache for every label-drawing widget
+label_cache = LabelTextureCache()
@@ -1,18 +1,28 @@
+from kivy.metrics import dp
 from kivy.uix.screenmanager import Screen
-from kivy.uix.boxlayout import BoxLayout
 from kivy.properties import StringProperty, NumericProperty
 from logic.bus import bus
-from logic.performance_optimizer import performance_optimizer
+from logic.performance_optimizer import performance_optimizer, frame_scheduler, PRIORITY_LOW
+from ui.widgets.virtual_clip_grid import VirtualClipGrid
+from ui.widgets.clip_grid_canvas import ClipGridCanvas
+from logic.state.demo_data import builtin_set
 from typing import Optional
 import logging
 
+# Selectable clip grid renderers (AppConfig.clip_grid_mode)
+GRID_MODES = {
+    "widgets": VirtualClipGrid,  # Pooled ClipSlot widgets
+    "canvas": ClipGridCanvas,    # One canvas, per-cell Color instructions
+}
+
 class ClipViewScreen(Screen):
     
     # Track state
     focused_track = NumericProperty(0)
     current_track_text = StringProperty("Kick")
     
-    def __init__(self, app_state=None, clip_manager=None, live_integration=None, **kwargs):
+    def __init__(self, app_state=None, clip_manager=None, live_integration=None,
+                 grid_mode: str = "widgets", **kwargs):
         super().__init__(**kwargs)
         self.app_state = app_state
         self.clip_manager = clip_manager
@@ -23,6 +33,23 @@ class ClipViewScreen(Screen):
         self.live_tracks = []
         self.live_scenes = []
         
+        # Last AppState version painted (see AppState.changes_since)
+        self._seen_version = 0
+        
+        # track -> TrackHeader, maintained by _populate_headers_job
+        self._headers = {}
+        
+        # Clip cells already requested from Live (lazy, visible-only)
+        self._requested_cells = set()
+        
+        # Clip grid renderer, created into the kv placeholder
+        self.clip_grid = None
+        self.grid_mode = grid_mode
+        
+        # Grid animations handed back while another screen is shown
+        self._grid_released = False
+        self.set_grid_mode(grid_mode)
+        
         # Setup event listeners
         self._setup_events()
     
@@ -33,11 +60,13 @@ class ClipViewScreen(Screen):
         
         # Live data listeners
         bus.on("live:track_names", self._on_live_track_names)
-        bus.on("live:clip_status", self._on_live_clip_status)
+        # live:clip_status reaches the grid through the batched path below
         bus.on("live:clip_name", self._on_live_clip_name)  # NEW
         bus.on("live:track_color", self._on_live_track_color)  # NEW
         bus.on("live:connection_confirmed", self._on_live_connected)
         bus.on("live:structure_changed", self._on_structure_changed)
+        bus.on("live:num_scenes", self._on_scene_count_changed)
+        bus.on("state:tracks_changed", self._on_scene_count_changed)  # Scene growth from clip updates
         bus.on("live:clip_has_content", self._on_live_clip_has_content)  # NEW
         
         # PERFORMANCE: Batched UI update listeners
@@ -58,43 +87,41 @@ class ClipViewScreen(Screen):
         else:
             self.logger.error("❌ No live_integration provided to ClipView!")
         
+        # Rebind the grid: restarts the animations released in on_leave
+        if self._grid_released:
+            self._grid_released = False
+            self._populate_clips()
+        
+        # Warm start: paint whatever the state already holds (e.g. snapshot)
+        if self.app_state and self.app_state.m.tracks:
+            if self.live_tracks and self._seen_version:
+                self._refresh_dirty()
+            else:
+                self._use_state_data()
+        
         if self.live_integration and self.live_integration.osc_client and self.live_integration.osc_client.is_connected:
             # Usar datos reales de Live
             self.logger.info("📡 Using REAL Live data")
             self._request_live_data()
-        else:
+        elif not self.live_tracks:
             # Fallback a datos demo si Live no conectado
             self.logger.warning("⚠️ Live not connected, using DEMO data")
             self._use_demo_data()
     
-    def _create_demo_tracks(self):
-        """Create demo track data"""
-        tracks = [
-            {"name": "Kick", "color": (0, 0.016, 1, 1)},
-            {"name": "Hats", "color": (0, 1, 0.05, 1)},
-            {"name": "Bass", "color": (1, 0.6, 0, 1)},
-            {"name": "Tom", "color": (1, 0.85, 0, 1)},
-            {"name": "FX", "color": (1, 0, 0.48, 1)},
-            {"name": "Pad", "color": (0, 1, 0.97, 1)},
-            {"name": "Lead", "color": (1, 0.57, 0, 1)},
-            {"name": "Keys", "color": (0, 0.016, 1, 1)},
-            {"name": "Perc", "color": (0.8, 0.2, 0.8, 1)},
-            {"name": "Vocal", "color": (0.2, 0.8, 0.2, 1)},
-        ]
-        
-        # Add clips to each track
-        for track in tracks:
-            track["clips"] = [{"status": "empty", "name": ""} for _ in range(12)]
-        
-        # Add some demo clips
-        tracks[0]["clips"][0] = {"status": "playing", "name": "Kick Loop"}
-        tracks[1]["clips"][1] = {"status": "queued", "name": "Hats Pattern"}
-        tracks[2]["clips"][2] = {"status": "empty", "name": "Bass Line"}
-        tracks[3]["clips"][0] = {"status": "playing", "name": "Tom Beat"}
-        tracks[8]["clips"][0] = {"status": "playing", "name": "Perc Loop"}
-        tracks[9]["clips"][1] = {"status": "queued", "name": "Vocal Chop"}
-        
-        return tracks
+    def on_leave(self):
+        """Called when another screen is shown"""
+        # Off-screen cells must not keep the animation ticker (and frame rate) busy
+        if self.clip_grid is not None:
+            self.clip_grid.release()
+            self._grid_released = True
+    
+    def _demo_set(self):
+        """Shared read-only demo dataset (from AppState when available)"""
+        return self.app_state.demo_set() if self.app_state else builtin_set()
+    
+    def _tracks(self):
+        """Tracks on screen: Live/state data, else the shared demo set"""
+        return self.live_tracks if self.live_tracks else self._demo_set().tracks
     
     def _request_live_data(self):
         """Request real data from Live"""
@@ -115,22 +142,30 @@ class ClipViewScreen(Screen):
         names = kwargs.get('names', [])
         self.logger.info(f"📋 Received track names from Live: {names}")
         
-        # Crear estructura de tracks con datos reales
-        self.live_tracks = []
-        for i, name in enumerate(names):
-            track = {
-                "name": name,
-                "color": self._get_track_color(i),  # Se actualizará con color real
-                "clips": [{"status": "empty", "name": ""} for _ in range(12)]
-            }
-            self.live_tracks.append(track)
+        # Reuse state data when it matches (warm snapshot or already synced)
+        state_tracks = self._tracks_from_state()
+        if [t["name"] for t in state_tracks] == list(names):
+            self.live_tracks = state_tracks
+        else:
+            # Crear estructura de tracks con datos reales
+            self.live_tracks = []
+            scenes = self.app_state.m.scenes_count if self.app_state else 12
+            for i, name in enumerate(names):
+                track = {
+                    "name": name,
+                    "color": self._get_track_color(i),  # Se actualizará con color real
+                    "clips": [{"status": "empty", "name": ""} for _ in range(scenes)]
+                }
+                self.live_tracks.append(track)
         
         # Poblar UI con datos reales
         self._populate_headers()
         self._populate_clips()
         
-        # PERFORMANCE: Request clips lazily only for visible area
-        self._request_visible_clips_lazy(len(names))
+        # PERFORMANCE: Request clips lazily only for visible area.
+        # Also on a name match: snapshot clips may be stale, so visible cells are re-read
+        self._requested_cells.clear()
+        self._request_visible_clips_lazy()
 
     def _on_live_clip_status(self, **kwargs):
         """Handle clip status updates from Live"""
@@ -145,6 +180,28 @@ class ClipViewScreen(Screen):
             # Actualizar UI
             self._update_clip_visual(track, scene, status)
 
+    # Batched update type -> field in the live_tracks clip dict
+    _BATCH_FIELDS = {"clip_status": "status", "clip_name": "name", "clip_has_content": "has_content"}
+
+    def _on_clip_batch_update(self, **kwargs):
+        """Apply one track's coalesced clip updates, repainting each cell once"""
+        dirty = set()
+        for update_type, data in kwargs.get('updates', []):
+            field = self._BATCH_FIELDS.get(update_type)
+            if field is None or field not in data:
+                continue
+            track, scene = data.get('track', 0), data.get('scene', 0)
+            if track < len(self.live_tracks) and scene < len(self.live_tracks[track]["clips"]):
+                self.live_tracks[track]["clips"][scene][field] = data[field]
+                dirty.add((track, scene))
+        for track, scene in dirty:
+            self._refresh_cell(track, scene)
+
+    def _on_track_batch_update(self, **kwargs):
+        """Apply merged track-level updates"""
+        if 'color' in kwargs:
+            self._on_live_track_color(**kwargs)
+
     def _on_live_clip_name(self, **kwargs):
         """Handle clip name updates from Live"""
         track = kwargs.get('track', 0)
@@ -163,11 +220,7 @@ class ClipViewScreen(Screen):
 
     def _update_clip_name_visual(self, track_id, scene_id, name):
         """Update clip name in UI"""
-        # Encontrar el widget ClipSlot y actualizar su texto
-        if hasattr(self.ids, 'clips_container'):
-            # Buscar el slot específico y actualizar
-            # (implementación depende de cómo esté estructurada la UI)
-            pass
+        self._refresh_cell(track_id, scene_id)
 
     def _on_live_clip_has_content(self, **kwargs):
         """Handle clip content updates from Live"""
@@ -199,21 +252,90 @@ class ClipViewScreen(Screen):
         ]
         return colors[track_index % len(colors)]
 
+    @staticmethod
+    def _clip_from_state(track_state, scene_id):
+        """One clip dict of the screen's track data from a TrackState"""
+        clip = track_state.clips.get(scene_id) if track_state else None
+        status = clip.status.value if clip else "empty"
+        name = clip.name if clip else ""
+        return {
+            "status": status,
+            "name": name,
+            "has_content": bool(name) or status != "empty",
+        }
+
+    def _tracks_from_state(self):
+        """Convert AppState tracks into the screen's track dicts"""
+        if not self.app_state:
+            return []
+        
+        tracks = []
+        for track_id in sorted(self.app_state.m.tracks):
+            track_state = self.app_state.m.tracks[track_id]
+            clips = [self._clip_from_state(track_state, scene_id)
+                     for scene_id in range(self.app_state.m.scenes_count)]
+            tracks.append({
+                "name": track_state.name,
+                "color": track_state.color,
+                "clips": clips,
+            })
+        return tracks
+
+    def _use_state_data(self):
+        """Populate from AppState (snapshot or previous sync)"""
+        self._seen_version = self.app_state.version
+        self.live_tracks = self._tracks_from_state()
+        self._populate_headers()
+        self._populate_clips()
+
+    def _refresh_dirty(self):
+        """Repaint only what changed in AppState since the last paint"""
+        changes = self.app_state.changes_since(self._seen_version)
+        if changes.structure or len(self.app_state.m.tracks) != len(self.live_tracks):
+            self._use_state_data()
+            return
+        self._seen_version = changes.version
+        
+        tracks = self.app_state.m.tracks
+        for track_id, scene_id in changes.cells:
+            if track_id >= len(self.live_tracks) or scene_id >= len(self.live_tracks[track_id]["clips"]):
+                continue
+            clip = tracks[track_id].clips[scene_id]
+            status = clip.status.value
+            has_content = bool(clip.name) or status != "empty"
+            self.live_tracks[track_id]["clips"][scene_id].update(
+                status=status, name=clip.name, has_content=has_content)
+            self._refresh_cell(track_id, scene_id)
+        
+        for track_id in changes.tracks:
+            if track_id < len(self.live_tracks) and track_id in tracks:
+                self.live_tracks[track_id]["color"] = tracks[track_id].color
+                self._update_track_header_color(track_id, tracks[track_id].color)
+
     def _use_demo_data(self):
         """Fallback to demo data if Live not available"""
-        self.live_tracks = self._create_demo_tracks()
+        # Editable copy: live updates are applied on top of it
+        self.live_tracks = self._demo_set().mutable_tracks()
         self._populate_headers()
         self._populate_clips()
 
     def _populate_headers(self):
-        """Create track headers with real data"""
+        """Rebuild track headers spread over frames (see FrameScheduler)"""
+        frame_scheduler.submit("clip_view:headers", self._populate_headers_job(), priority=PRIORITY_LOW)
+    
+    def _populate_headers_job(self, per_slice: int = 8):
+        """Create track headers with real data, a few per slice"""
         from ui.widgets.track_header import TrackHeader
         
         if hasattr(self.ids, 'track_headers_container'):
             headers_container = self.ids.track_headers_container
             headers_container.clear_widgets()
+            self._headers.clear()
             
-            tracks_to_use = self.live_tracks if self.live_tracks else self._create_demo_tracks()
+            tracks_to_use = self._tracks()
+            # Same pitch as the grid columns so headers stay aligned at any density
+            cell_width = self.clip_grid.cell_width if self.clip_grid is not None else dp(88)
+            headers_container.width = len(tracks_to_use) * cell_width
             
             for track_idx, track in enumerate(tracks_to_use):
                 header = TrackHeader(
@@ -222,68 +344,88 @@ class ClipViewScreen(Screen):
                     color_rgba=track["color"]
                 )
                 headers_container.add_widget(header)
-            
-            headers_container.width = len(tracks_to_use) * 88
+                self._headers[track_idx] = header
+                if track_idx % per_slice == per_slice - 1:
+                    yield  # Resume next slice
     
-    def _populate_clips(self):
-        """OPTIMIZED: Only create visible clips initially"""
-        from ui.widgets.clip_slot import ClipSlot
+    def set_grid_mode(self, mode: str):
+        """Swap the clip grid renderer ("widgets" or "canvas") keeping data and scroll"""
+        if mode not in GRID_MODES:
+            self.logger.warning(f"Unknown clip grid mode '{mode}', using widgets")
+            mode = "widgets"
+        if not hasattr(self.ids, 'clip_grid_holder'):
+            return
+        previous = self.clip_grid
+        if previous is not None and type(previous) is GRID_MODES[mode]:
+            return
         
-        if hasattr(self.ids, 'clips_container'):
-            clips_container = self.ids.clips_container
-            clips_container.clear_widgets()
-            
-            tracks_to_use = self.live_tracks if self.live_tracks else self._create_demo_tracks()
-            
-            # OPTIMIZATION: Limit initial creation to visible area
-            max_visible_tracks = min(8, len(tracks_to_use))  # Only first 8 tracks
-            
-            for track_idx in range(max_visible_tracks):
-                track = tracks_to_use[track_idx]
-                clips_column = BoxLayout(
-                    orientation='vertical',
-                    size_hint_x=None,
-                    width=88,
-                    spacing=0
-                )
-                
-                # Only create first 8 scenes initially (visible area)
-                for scene_idx in range(8):  # Era 12, ahora 8
-                    clip_info = track["clips"][scene_idx] if scene_idx < len(track["clips"]) else {}
-                    
-                    slot = ClipSlot(
-                        track_index=track_idx,
-                        scene_index=scene_idx,
-                        status=clip_info.get("status", "empty"),
-                        has_content=clip_info.get("has_content", False),
-                    )
-                    slot.label_text = clip_info.get("name", "")
-                    clips_column.add_widget(slot)
-                
-                clips_container.add_widget(clips_column)
-            
-            clips_container.width = max_visible_tracks * 88
+        if previous is not None:
+            # The shared ticker holds the old grid's cells until released
+            previous.unbind(scroll_x_px=self._on_grid_scroll, scroll_y_px=self._on_grid_scroll)
+            previous.release()
+        
+        grid = GRID_MODES[mode]()
+        grid.bind(scroll_x_px=self._on_grid_scroll, scroll_y_px=self._on_grid_scroll)
+        holder = self.ids.clip_grid_holder
+        holder.clear_widgets()
+        holder.add_widget(grid)
+        self.clip_grid = grid
+        self.grid_mode = mode
+        
+        if previous is not None and previous.tracks:
+            grid.set_data(previous.tracks, previous.scenes)
+            grid.scroll_to(previous.scroll_x_px, previous.scroll_y_px)
+    
+    def _populate_clips(self):
+        """Bind the clip grid to the current tracks (no widget rebuild)"""
+        if self.clip_grid is not None and not self._grid_released:
+            tracks_to_use = self._tracks()
+            self.clip_grid.set_data(tracks_to_use)
+    
+    def _request_visible_clips_lazy(self, *_):
+        """Ask Live only for clip cells that are on screen and not yet requested"""
+        if not (self.live_integration and self.live_integration.osc_client
+                and self.live_integration.osc_client.is_connected and self.clip_grid is not None):
+            return
+        osc = self.live_integration.osc_client
+        grid = self.clip_grid
+        first_track, last_track, first_scene, last_scene = grid.visible_range()
+        for track_id in range(first_track, last_track):
+            for scene_id in range(first_scene, last_scene):
+                if (track_id, scene_id) in self._requested_cells:
+                    continue
+                self._requested_cells.add((track_id, scene_id))
+                osc.send_message("/live/clip/get/name", track_id, scene_id)
+                osc.send_message("/live/clip/get/playing_status", track_id, scene_id)
+                osc.send_message("/live/clip/get/length", track_id, scene_id)
+    
+    def _on_grid_scroll(self, grid, value):
+        """Keep headers aligned with the grid and fetch newly visible cells"""
+        if grid.max_scroll_x > 0:
+            self._sync_header_scroll(grid.scroll_x_px / grid.max_scroll_x)
+        self._request_visible_clips_lazy()
     
     def _sync_header_scroll(self, scroll_x):
         """Sync header scroll with content scroll"""
         if hasattr(self.ids, 'headers_scroll'):
             self.ids.headers_scroll.scroll_x = scroll_x
     
-    def _focus_track(self, track_id: int):
+    def _focus_track(self, track_id: int, emit: bool = True):
         """Focus on a specific track"""
-        tracks_to_use = self.live_tracks if self.live_tracks else self._create_demo_tracks()
+        tracks_to_use = self._tracks()
         if 0 <= track_id < len(tracks_to_use):
             self.focused_track = track_id
             self.current_track_text = tracks_to_use[track_id]["name"]
             
-            # Emit focus event
-            bus.emit("track:focus", track=track_id)
+            # Emit focus event (not when reacting to one: it would re-enter forever)
+            if emit:
+                bus.emit("track:focus", track=track_id)
     
     # Event Handlers
     def _on_track_focus(self, **kwargs):
         """Handle track focus events from other components"""
         track_id = kwargs.get('track', 0)
-        self._focus_track(track_id)
+        self._focus_track(track_id, emit=False)
     
     def _on_clip_changed(self, **kwargs):
         """Handle clip state changes"""
@@ -307,6 +449,22 @@ class ClipViewScreen(Screen):
         # Re-request data to update UI
         self._request_live_data()
 
+    def _on_scene_count_changed(self, **kwargs):
+        """Scene count changed in AppState: resize clip rows and rebind the grid"""
+        if not self.app_state or not self.live_tracks:
+            return
+        scenes = self.app_state.m.scenes_count
+        if all(len(track["clips"]) == scenes for track in self.live_tracks):
+            return
+        tracks = self.app_state.m.tracks
+        for track_id, track in enumerate(self.live_tracks):
+            clips = track["clips"][:scenes]
+            clips.extend(self._clip_from_state(tracks.get(track_id), scene_id)
+                         for scene_id in range(len(clips), scenes))
+            track["clips"] = clips
+        self._populate_clips()
+        self._request_visible_clips_lazy()
+
     def _on_live_track_color(self, **kwargs):
         """Handle track color updates from Live"""
         track = kwargs.get('track', 0)
@@ -321,32 +479,19 @@ class ClipViewScreen(Screen):
 
     def _update_track_header_color(self, track_id, color):
         """Update track header color in UI"""
-        if hasattr(self.ids, 'track_headers_container'):
-            headers = self.ids.track_headers_container.children
-            if track_id < len(headers):
-                header = headers[-(track_id + 1)]  # Kivy reverses children
-                header.color_rgba = color
+        header = self._headers.get(track_id)
+        if header is not None:
+            header.color_rgba = color
 
     def _update_clip_content_visual(self, track_id, scene_id, has_content):
         """Update clip visual to show if it has content"""
-        if hasattr(self.ids, 'clips_container'):
-            # Encontrar el widget ClipSlot específico y actualizar
-            clips_container = self.ids.clips_container
-            if track_id < len(clips_container.children):
-                # Kivy reversa el orden de children
-                track_column = clips_container.children[-(track_id + 1)]
-                if scene_id < len(track_column.children):
-                    clip_slot = track_column.children[-(scene_id + 1)]
-                    clip_slot.has_content = has_content
-                    self.logger.debug(f"📁 Updated clip T{track_id}S{scene_id} content: {has_content}")
+        self._refresh_cell(track_id, scene_id)
 
     def _update_clip_visual(self, track_id, scene_id, status):
         """Update clip status visual"""
-        if hasattr(self.ids, 'clips_container'):
-            clips_container = self.ids.clips_container
-            if track_id < len(clips_container.children):
-                track_column = clips_container.children[-(track_id + 1)]
-                if scene_id < len(track_column.children):
-                    clip_slot = track_column.children[-(scene_id + 1)]
-                    clip_slot.status = status
-                    self.logger.debug(f"🎵 Updated clip T{track_id}S{scene_id} status: {status}")
\ No newline at end of file
+        self._refresh_cell(track_id, scene_id)
+
+    def _refresh_cell(self, track_id, scene_id):
+        """Repaint one cell from live_tracks (no-op when scrolled out of view or off screen)"""
+        if self.clip_grid is not None and not self._grid_released:
+            self.clip_grid.refresh_cell(track_id, scene_id)
\ No newline at end of file
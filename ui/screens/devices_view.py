@@ -2,6 +2,7 @@ from kivy.uix.screenmanager import Screen
 from kivy.properties import StringProperty, NumericProperty, BooleanProperty, ListProperty
 from kivy.clock import Clock
 from logic.bus import bus
+from logic.state.demo_data import builtin_set
 from typing import Optional, Dict, List
 import logging
 
@@ -29,11 +30,8 @@ class DevicesViewScreen(Screen):
         self.live_integration = live_integration  # AGREGAR ESTO
         self.logger = logging.getLogger(__name__)
         
-        # Track names (same as ClipView demo tracks)
-        self.track_names = [
-            "Kick", "Hats", "Bass", "Tom", "FX", 
-            "Pad", "Lead", "Keys", "Perc", "Vocal"
-        ]
+        # Track names (shared demo set until Live sends real ones)
+        self.track_names = (app_state.demo_set() if app_state else builtin_set()).names()
         
         # Track -> Devices mapping (each track can have multiple devices)
         self.track_devices = {
@@ -124,6 +122,8 @@ class DevicesViewScreen(Screen):
         bus.on("track:focus", self._on_track_focus)
         bus.on("live:track_names", self._on_live_track_names)  # NUEVO
         bus.on("live:devices", self._on_live_devices)  # NUEVO
+        bus.on("live:device_info", self._on_live_device_page)
+        bus.on("live:device_page", self._on_live_device_page)
     
     def on_enter(self):
         """Called when screen becomes active"""
@@ -133,16 +133,51 @@ class DevicesViewScreen(Screen):
         if hasattr(self.ids, 'knob_grid'):
             self._set_active_encoder(0)
     
+    def _device_service(self):
+        """Paged Live device data, or None when running on demo data"""
+        live = self.live_integration
+        if live and live.osc_client and live.osc_client.is_connected:
+            return live.devices
+        return None
+    
+    def _device_names(self) -> List[str]:
+        """Device names for the current track"""
+        service = self._device_service()
+        if service:
+            return service.devices(self.current_track) or []
+        return list(self.track_devices.get(self.current_track, {}).keys())
+    
+    def _current_device_index(self) -> int:
+        names = self._device_names()
+        if self.current_device_name in names:
+            return names.index(self.current_device_name)
+        return 0
+    
+    def _current_page_param_list(self) -> List[dict]:
+        """Parameters shown on the 8 encoders for the current page"""
+        params_per_page = 8
+        service = self._device_service()
+        if service:
+            # Never blocks: a miss returns None and the page arrives via live:device_page
+            page = service.get_page(self.current_track, self._current_device_index(),
+                                    self.current_page - 1)
+            return page or []
+        
+        track_devices = self.track_devices.get(self.current_track, {})
+        device = track_devices.get(self.current_device_name, {"params": []})
+        start_idx = (self.current_page - 1) * params_per_page
+        return device["params"][start_idx:start_idx + params_per_page]
+    
     def _update_track_info(self):
         """Update track information and reset to first device"""
         if self.current_track < len(self.track_names):
             self.current_track_name = self.track_names[self.current_track]
         
         # Get devices for current track
-        track_devices = self.track_devices.get(self.current_track, {})
-        if track_devices:
+        device_names = self._device_names()
+        if device_names:
             # Set first device as current
-            first_device = list(track_devices.keys())[0]
+            first_device = device_names[0]
             self.current_device_name = first_device
             self.current_page = 1
             self._update_device_info()
@@ -150,9 +185,13 @@ class DevicesViewScreen(Screen):
     
     def _update_device_info(self):
         """Update device information and pagination"""
-        track_devices = self.track_devices.get(self.current_track, {})
-        device = track_devices.get(self.current_device_name, {"pages": 1})
-        self.total_pages = device["pages"]
+        service = self._device_service()
+        if service:
+            self.total_pages = service.page_count(self.current_track, self._current_device_index())
+        else:
+            track_devices = self.track_devices.get(self.current_track, {})
+            device = track_devices.get(self.current_device_name, {"pages": 1})
+            self.total_pages = device["pages"]
         
         # Ensure current page is valid
         if self.current_page > self.total_pages:
@@ -160,14 +199,7 @@ class DevicesViewScreen(Screen):
     
     def _update_current_page_params(self):
         """Update parameters for current page"""
-        track_devices = self.track_devices.get(self.current_track, {})
-        device = track_devices.get(self.current_device_name, {"params": []})
-        
-        params_per_page = 8
-        start_idx = (self.current_page - 1) * params_per_page
-        end_idx = start_idx + params_per_page
-        
-        current_params = device["params"][start_idx:end_idx]
+        current_params = self._current_page_param_list()
         
         # Update knob widgets
         if hasattr(self, 'ids') and hasattr(self.ids, 'knob_grid'):
@@ -183,9 +215,18 @@ class DevicesViewScreen(Screen):
                         param = current_params[param_idx]
                         knob.param_name = param["name"]
                         knob.display_value = param["display"]
-                        knob.knob_value = param["value"]
+                        knob.knob_value = self._normalized_value(param)
                         knob.encoder_id = param_idx
     
+    def _normalized_value(self, param: dict) -> float:
+        """Knob position 0..1 (Live params carry native ranges)"""
+        if self._device_service() is None:
+            return param["value"]
+        if param["value"] is None:
+            return 0.0
+        span = param["max"] - param["min"]
+        return (param["value"] - param["min"]) / span if span else 0.0
+    
     def _set_active_encoder(self, encoder_id: int):
         """Set which encoder is currently active (highlighted)"""
         self.active_encoder = encoder_id
@@ -214,6 +255,22 @@ class DevicesViewScreen(Screen):
     
     def _adjust_parameter(self, encoder_id: int, delta: float):
         """Adjust parameter value with bounds checking"""
+        service = self._device_service()
+        if service:
+            page = self._current_page_param_list()
+            if encoder_id < len(page) and page[encoder_id]["value"] is not None:
+                param = page[encoder_id]
+                span = param["max"] - param["min"]
+                new_value = max(param["min"], min(param["max"], param["value"] + delta * span))
+                service.set_value(self.current_track, self._current_device_index(),
+                                  param["index"], new_value)
+                if self.app_state:
+                    self.app_state.set_device_parameter(
+                        self.current_track, self._current_device_index(), param["index"],
+                        new_value, user=True, previous=param["value"])
+                self._update_current_page_params()
+            return
+        
         track_devices = self.track_devices.get(self.current_track, {})
         device = track_devices.get(self.current_device_name, {"params": []})
         params_per_page = 8
@@ -274,8 +331,7 @@ class DevicesViewScreen(Screen):
     
     def previous_device(self):
         """Navigate to previous device IN CURRENT TRACK"""
-        track_devices = self.track_devices.get(self.current_track, {})
-        device_names = list(track_devices.keys())
+        device_names = self._device_names()
         
         if device_names and self.current_device_name in device_names:
             current_idx = device_names.index(self.current_device_name)
@@ -289,8 +345,7 @@ class DevicesViewScreen(Screen):
     
     def next_device(self):
         """Navigate to next device IN CURRENT TRACK"""
-        track_devices = self.track_devices.get(self.current_track, {})
-        device_names = list(track_devices.keys())
+        device_names = self._device_names()
         
         if device_names and self.current_device_name in device_names:
             current_idx = device_names.index(self.current_device_name)
@@ -323,7 +378,7 @@ class DevicesViewScreen(Screen):
     def _on_device_change(self, **kwargs):
         """Handle device change from external source"""
         new_device = kwargs.get('device')
-        if new_device and new_device in self.track_devices.get(self.current_track, {}):
+        if new_device and new_device in self._device_names():
             self.current_device_name = new_device
             self.current_page = 1  # Reset to first page
             self._update_device_info()
@@ -348,41 +403,24 @@ class DevicesViewScreen(Screen):
         self._update_track_info()
 
     def _on_live_devices(self, **kwargs):
-        """Update device data from Live"""
+        """Device names for a track arrived from Live"""
         track_id = kwargs.get('track', 0)
         devices = kwargs.get('devices', [])
         
         self.logger.info(f"🎚️ Received devices for track {track_id}: {devices}")
         
-        # Update device mapping with real Live data
-        if track_id not in self.track_devices:
-            self.track_devices[track_id] = {}
-        
-        for device in devices:
-            device_name = device.get('name', 'Unknown Device')
-            params = device.get('parameters', [])
-            
-            # Convert Live device data to our format
-            self.track_devices[track_id][device_name] = {
-                "pages": max(1, len(params) // 8),
-                "params": self._convert_live_params(params)
-            }
-        
         # Update UI if we're viewing this track
         if self.current_track == track_id:
-            self._update_device_info()
-            self._update_current_page_params()
+            self._update_track_info()
 
-    def _convert_live_params(self, live_params):
-        """Convert Live parameter format to our internal format"""
-        converted = []
-        for i, param in enumerate(live_params):
-            converted.append({
-                "name": param.get('name', f'Param {i+1}'),
-                "value": param.get('value', 0.5),
-                "display": param.get('display_value', '50%'),
-                "min": param.get('min', 0),
-                "max": param.get('max', 127),
-                "unit": param.get('unit', '')
-            })
-        return converted
+    def _on_live_device_page(self, **kwargs):
+        """Page count or parameter page arrived from the device service"""
+        if kwargs.get('track') != self.current_track:
+            return
+        if kwargs.get('device') != self._current_device_index():
+            return
+        
+        self._update_device_info()
+        page = kwargs.get('page')
+        if page is None or page == self.current_page - 1:
+            self._update_current_page_params()
@@ -1,9 +1,9 @@
 from kivy.uix.screenmanager import Screen
 from kivy.properties import NumericProperty, StringProperty, ListProperty
 from logic.bus import bus
+from logic.state.demo_data import builtin_set
 from typing import Optional
 import logging
-from kivy.metrics import dp
 
 class MixerViewScreen(Screen):
     """Dedicated mixer view for all tracks with enhanced controls"""
@@ -21,8 +21,11 @@ class MixerViewScreen(Screen):
         self.live_integration = live_integration  # AGREGAR ESTO
         self.logger = logging.getLogger(__name__)
         
-        # Create demo tracks data (same as ClipView)
-        self.demo_tracks = self._create_demo_tracks()
+        # Tracks from Live (empty: fall back to the shared demo set)
+        self.demo_tracks = []
+        
+        # Last AppState version pushed into the strips (see AppState.changes_since)
+        self._seen_version = 0
         
         # Setup event listeners
         self._setup_events()
@@ -42,54 +45,27 @@ class MixerViewScreen(Screen):
         self.logger.info("Entering Mixer View")
         self._populate_mixers()
     
-    def _create_demo_tracks(self):
-        """Create demo track data (same as ClipView)"""
-        return [
-            {"name": "Kick", "color": (0, 0.016, 1, 1)},
-            {"name": "Hats", "color": (0, 1, 0.05, 1)},
-            {"name": "Bass", "color": (1, 0.6, 0, 1)},
-            {"name": "Tom", "color": (1, 0.85, 0, 1)},
-            {"name": "FX", "color": (1, 0, 0.48, 1)},
-            {"name": "Pad", "color": (0, 1, 0.97, 1)},
-            {"name": "Lead", "color": (1, 0.57, 0, 1)},
-            {"name": "Keys", "color": (0, 0.016, 1, 1)},
-            {"name": "Perc", "color": (0.8, 0.2, 0.8, 1)},
-            {"name": "Vocal", "color": (0.2, 0.8, 0.2, 1)},
-        ]
+    def _demo_set(self):
+        """Shared read-only demo dataset (from AppState when available)"""
+        return self.app_state.demo_set() if self.app_state else builtin_set()
     
     def _populate_mixers(self):
-        """Create mixer widgets for all tracks - ENHANCED VERSION"""
-        from ui.widgets.track_volume import TrackVolume
-        
+        """Reconcile the pooled mixer strips with the tracks, then sync values"""
         if hasattr(self.ids, 'mixers_container'):
-            mixers_container = self.ids.mixers_container
-            mixers_container.clear_widgets()
+            strips = self.ids.mixers_container
+            strips.app_state = self.app_state
             
             # Use Live tracks if available, otherwise demo tracks
-            tracks_to_use = self.demo_tracks if self.demo_tracks else self._create_demo_tracks()
-            
-            for track_idx, track in enumerate(tracks_to_use):
-                # Enhanced mixer widget with better sizing for full screen
-                mixer = TrackVolume(
-                    track_index=track_idx,
-                    track_name=track["name"],  # PASS REAL TRACK NAME
-                    size_hint_x=None,
-                    width=dp(85),  # Reduced width to fit more tracks on screen
-                )
-                
-                # Update mixer with track state if available
-                if self.app_state and track_idx in self.app_state.m.tracks:
-                    track_state = self.app_state.m.tracks[track_idx]
-                    mixer.volume = track_state.volume
-                    mixer.pan = track_state.pan
-                    mixer.is_mute = track_state.mute
-                    mixer.is_solo = track_state.solo
-                    mixer.is_arm = track_state.arm
-                
-                mixers_container.add_widget(mixer)
+            tracks_to_use = self.demo_tracks if self.demo_tracks else self._demo_set().tracks
+            if strips.reconcile([track["name"] for track in tracks_to_use]):
+                self.logger.debug(f"Mixer strips reconciled: {strips.get_stats()}")
             
-            # Set container width for scrolling
-            mixers_container.width = len(tracks_to_use) * 88  # 85 + 3 spacing
+            # Only tracks changed since the last sync need their values pushed
+            if self.app_state:
+                changes = self.app_state.changes_since(self._seen_version)
+                self._seen_version = changes.version
+                strips.mark_stale(None if changes.structure else changes.tracks)
+            strips.sync_visible(self.app_state)
     
     # Event Handlers
     def _on_track_volume_changed(self, **kwargs):
@@ -100,7 +76,7 @@ class MixerViewScreen(Screen):
         
         # Update app state if available
         if self.app_state:
-            self.app_state.set_track_volume(track, value)
+            self.app_state.set_track_volume(track, value, user=True)
     
     def _on_track_pan_changed(self, **kwargs):
         """Handle track pan changes"""
@@ -109,7 +85,7 @@ class MixerViewScreen(Screen):
         self.logger.debug(f"Track {track} pan: {value:.2f}")
         
         if self.app_state:
-            self.app_state.set_track_pan(track, value)
+            self.app_state.set_track_pan(track, value, user=True)
     
     def _on_track_mute_changed(self, **kwargs):
         """Handle track mute changes"""
@@ -118,7 +94,7 @@ class MixerViewScreen(Screen):
         self.logger.debug(f"Track {track} mute: {value}")
         
         if self.app_state:
-            self.app_state.set_track_mute(track, int(value))
+            self.app_state.set_track_mute(track, int(value), user=True)
     
     def _on_track_solo_changed(self, **kwargs):
         """Handle track solo changes"""
@@ -127,7 +103,7 @@ class MixerViewScreen(Screen):
         self.logger.debug(f"Track {track} solo: {value}")
         
         if self.app_state:
-            self.app_state.set_track_solo(track, int(value))
+            self.app_state.set_track_solo(track, int(value), user=True)
     
     def _on_track_arm_changed(self, **kwargs):
         """Handle track arm changes"""
@@ -136,7 +112,7 @@ class MixerViewScreen(Screen):
         self.logger.debug(f"Track {track} arm: {value}")
         
         if self.app_state:
-            self.app_state.set_track_arm(track, int(value))
+            self.app_state.set_track_arm(track, int(value), user=True)
     
     def _on_track_send_changed(self, **kwargs):
         """Handle track send changes"""
@@ -146,7 +122,7 @@ class MixerViewScreen(Screen):
         self.logger.debug(f"Track {track} send {send}: {value:.2f}")
         
         if self.app_state:
-            self.app_state.set_track_send(track, send, value)
+            self.app_state.set_track_send(track, send, value, user=True)
 
     def _on_live_track_names(self, **kwargs):
         """Update mixer with real Live tracks"""
@@ -0,0 +1,26 @@
+"""Clip cell colors shared by ClipSlot and ClipGridCanvas"""
+from typing import Dict
+
+# Cell fill per clip status; stopped clips with content use the track color
+STATUS_RGBA = {
+    "playing": (0.1, 0.85, 0.3, 1),
+    "queued": (0.95, 0.75, 0.1, 1),
+    "recording": (0.9, 0.15, 0.15, 1),
+}
+EMPTY_RGBA = (0.15, 0.15, 0.15, 1)
+HIDDEN_RGBA = (0, 0, 0, 0)
+CONTENT_DIM = 0.45
+
+# Statuses animated by the shared AnimationTicker, and how
+ANIMATED_STATUSES = {"queued": "blink", "playing": "pulse", "recording": "pulse"}
+
+
+def cell_rgba(clip: Dict, track_color) -> tuple:
+    """Fill color for one clip cell"""
+    status_rgba = STATUS_RGBA.get(clip.get("status", "empty"))
+    if status_rgba is not None:
+        return status_rgba
+    if clip.get("has_content") or clip.get("name"):
+        r, g, b = track_color[:3]
+        return (r * CONTENT_DIM, g * CONTENT_DIM, b * CONTENT_DIM, 1)
+    return EMPTY_RGBA
@@ -0,0 +1,151 @@
+from kivy.graphics import Color, PopMatrix, PushMatrix, Rectangle, Translate
+from kivy.metrics import dp
+from typing import Dict, List
+import math
+
+from logic.bus import bus
+from ui.animation_ticker import animation_ticker
+from ui.label_cache import label_cache
+from .clip_colors import ANIMATED_STATUSES, EMPTY_RGBA, HIDDEN_RGBA, cell_rgba
+from .virtual_clip_grid import VirtualClipGrid
+
+CELL_GAP = 1
+
+
+class ClipGridCanvas(VirtualClipGrid):
+    """Clip grid drawn as one canvas instead of one widget per slot
+
+    Drop-in alternative to VirtualClipGrid (same data, scrolling and tap
+    API). Every visible cell is a Color + Rectangle pair in this widget's
+    canvas, positioned once per resize under a single Translate:
+
+    - sub-cell scrolling only moves the Translate;
+    - crossing a cell boundary rewrites the Color of each visible cell;
+    - a status change rewrites only that cell's Color;
+    - queued/playing cells hand their Color to the shared animation_ticker.
+
+    Clip names are textured Rectangles from the shared label_cache.
+
+    Touches are resolved arithmetically (see VirtualClipGrid.cell_at).
+    """
+
+    def __init__(self, **kwargs):
+        self._colors: List[Color] = []
+        self._labels: List[Rectangle] = []
+        self._translate = None
+        self.color_updates = 0
+        super().__init__(**kwargs)
+
+    # === DRAWING ===
+
+    def _on_resize(self, *_):
+        cols = int(math.ceil(self.width / self.cell_width)) + 1 if self.width > 0 else 0
+        rows = int(math.ceil(self.height / self.cell_height)) + 1 if self.height > 0 else 0
+        if (cols, rows) != (self._cols, self._rows) or self._translate is None:
+            self._build_canvas(cols, rows)
+        self._relayout(force=True)
+
+    def release(self):
+        """Hand back this grid's animated cells (grid is being dropped)"""
+        animation_ticker.stop_owner(self)
+
+    def _build_canvas(self, cols: int, rows: int):
+        """(Re)create the cell instructions; only happens on resize"""
+        cw, ch = self.cell_width, self.cell_height
+        animation_ticker.stop_owner(self)
+        self.canvas.clear()
+        self._colors = []
+        self._labels = []
+        with self.canvas:
+            PushMatrix()
+            self._translate = Translate(0, 0)
+            for col in range(cols):
+                for row in range(rows):
+                    self._colors.append(Color(*HIDDEN_RGBA))
+                    Rectangle(pos=(col * cw + CELL_GAP, -(row + 1) * ch + CELL_GAP),
+                              size=(cw - 2 * CELL_GAP, ch - 2 * CELL_GAP))
+            Color(1, 1, 1, 1)
+            for _ in range(cols * rows):
+                self._labels.append(Rectangle(size=(0, 0)))
+            PopMatrix()
+        self._cols, self._rows = cols, rows
+        self.allocations += cols * rows
+
+    def _relayout(self, *_, force: bool = False):
+        if not self._cols or not self._rows or self._translate is None:
+            return
+        cw, ch = self.cell_width, self.cell_height
+        first_track = int(self.scroll_x_px // cw)
+        first_scene = int(self.scroll_y_px // ch)
+        rebind = force or (first_track, first_scene) != (self._first_track, self._first_scene)
+        self._first_track, self._first_scene = first_track, first_scene
+
+        self._translate.xy = (self.x - (self.scroll_x_px - first_track * cw),
+                              self.top + (self.scroll_y_px - first_scene * ch))
+        if rebind:
+            for col in range(self._cols):
+                for row in range(self._rows):
+                    self._paint(col, row)
+            self.rebinds += 1
+
+    def _paint(self, col: int, row: int):
+        track, scene = self._first_track + col, self._first_scene + row
+        name, effect = "", None
+        if track < len(self.tracks) and scene < self.scenes:
+            data = self.tracks[track]
+            clips = data["clips"]
+            clip = clips[scene] if scene < len(clips) else {}
+            rgba = cell_rgba(clip, data.get("color", EMPTY_RGBA))
+            name = clip.get("name", "")
+            effect = ANIMATED_STATUSES.get(clip.get("status"))
+        else:
+            rgba = HIDDEN_RGBA
+        index = col * self._rows + row
+        color = self._colors[index]
+        if tuple(color.rgba) != rgba:
+            color.rgba = rgba
+            self.color_updates += 1
+        if effect:
+            animation_ticker.animate((self, index), color, effect, rgba)
+        else:
+            animation_ticker.stop((self, index))
+        self._paint_label(index, col, row, name)
+
+    def _paint_label(self, index: int, col: int, row: int, name: str):
+        cw, ch = self.cell_width, self.cell_height
+        texture = label_cache.get_texture(name, dp(10), max_width=cw - dp(6))
+        rect = self._labels[index]
+        if rect.texture is texture:
+            return
+        rect.texture = texture
+        w, h = texture.size if texture else (0, 0)
+        rect.size = (w, h)
+        rect.pos = (col * cw + (cw - w) / 2, -(row + 1) * ch + (ch - h) / 2)
+
+    # === CELL API ===
+
+    def slot_for(self, track: int, scene: int):
+        """No per-cell widgets in canvas mode"""
+        return None
+
+    def refresh_cell(self, track: int, scene: int):
+        """Repaint one cell: a single Color update when it is on screen"""
+        col = track - self._first_track
+        row = scene - self._first_scene
+        if 0 <= col < self._cols and 0 <= row < self._rows:
+            self._paint(col, row)
+
+    def _trigger_cell(self, track: int, scene: int):
+        """Same bus topics as ClipSlot.trigger"""
+        clips = self.tracks[track]["clips"]
+        status = clips[scene].get("status", "empty") if scene < len(clips) else "empty"
+        if status == "empty":
+            return
+        topic = "clip:stop" if status == "playing" else "clip:trigger"
+        bus.emit(topic, track=track, scene=scene)
+
+    def get_stats(self) -> Dict[str, int]:
+        stats = super().get_stats()
+        stats["pool"] = len(self._colors)
+        stats["color_updates"] = self.color_updates
+        return stats
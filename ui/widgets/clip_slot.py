@@ -1,7 +1,11 @@
 from kivy.uix.boxlayout import BoxLayout
-from kivy.properties import NumericProperty, StringProperty, BooleanProperty
-from kivy.clock import Clock
+from kivy.properties import NumericProperty, StringProperty, BooleanProperty, ListProperty
+from kivy.graphics import Color, Rectangle
+from kivy.metrics import dp
 from logic.bus import bus
+from ui.label_cache import label_cache
+from ui.animation_ticker import animation_ticker
+from .clip_colors import ANIMATED_STATUSES, EMPTY_RGBA, cell_rgba
 import logging
 
 class ClipSlot(BoxLayout):
@@ -10,19 +14,58 @@ class ClipSlot(BoxLayout):
     status      = StringProperty("empty")  # empty|stopped|queued|playing
     label_text  = StringProperty("")
     has_content = BooleanProperty(False)  # NUEVO: indica si el clip tiene contenido
+    color_rgba  = ListProperty(list(EMPTY_RGBA))  # Track color (clips with content)
 
     def __init__(self, **kwargs):
+        self._label_rect = None
         super().__init__(**kwargs)
         self.logger = logging.getLogger(__name__)
-        # peq. auto-anim/refresh si cambian estados
-        Clock.schedule_once(lambda *_: self._apply_status())
+        # Cell background; animated through the shared animation_ticker
+        with self.canvas.before:
+            self._bg_color = Color(*EMPTY_RGBA)
+            self._bg_rect = Rectangle(pos=self.pos, size=self.size)
+        # Clip name drawn from the shared label texture cache (no Label widget)
+        with self.canvas.after:
+            Color(1, 1, 1, 1)
+            self._label_rect = Rectangle(size=(0, 0))
+        self.bind(pos=self._layout_label, size=self._update_label)
+        self.bind(has_content=self._apply_status, color_rgba=self._apply_status)
+        self._update_label()
+        self._apply_status()
+
+    def on_label_text(self, *_):
+        self._update_label()
+        self._apply_status()
+
+    def _update_label(self, *_):
+        if self._label_rect is None:
+            return  # Still inside __init__
+        texture = label_cache.get_texture(self.label_text, dp(10), max_width=self.width - dp(6))
+        self._label_rect.texture = texture
+        self._label_rect.size = texture.size if texture else (0, 0)
+        self._layout_label()
+
+    def _layout_label(self, *_):
+        self._bg_rect.pos = self.pos
+        self._bg_rect.size = self.size
+        w, h = self._label_rect.size
+        self._label_rect.pos = (self.center_x - w / 2, self.center_y - h / 2)
 
     def on_status(self, *_):
         self._apply_status()
 
-    def _apply_status(self):
-        # Aquí podrías animar colores o bordes según estado
-        pass
+    def _apply_status(self, *_):
+        """Static fill, or register the fill with the shared animation ticker"""
+        if self._label_rect is None:
+            return  # Still inside __init__
+        rgba = cell_rgba({"status": self.status, "has_content": self.has_content,
+                          "name": self.label_text}, self.color_rgba)
+        self._bg_color.rgba = rgba
+        effect = ANIMATED_STATUSES.get(self.status)
+        if effect:
+            animation_ticker.animate(self, self._bg_color, effect, rgba)
+        else:
+            animation_ticker.stop(self)
 
     def trigger(self):
         """Trigger this clip slot"""
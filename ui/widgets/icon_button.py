@@ -1,12 +1,17 @@
 from kivy.uix.image import Image
 from kivy.uix.behaviors import ButtonBehavior
-from kivy.properties import BooleanProperty, ListProperty
+from kivy.properties import BooleanProperty, ListProperty, StringProperty
+from ui.icon_atlas import icon_source
 
 class IconButton(ButtonBehavior, Image):
+    icon = StringProperty("")  # Icon name, resolved through the icon atlas
     active = BooleanProperty(False)
     tint_active = ListProperty([1, 1, 1, 1])
     tint_inactive = ListProperty([0.53, 0.53, 0.53, 1])
 
+    def on_icon(self, *_):
+        self.source = icon_source(self.icon)
+
     # Image.color multiplica la textura → sirve para “tinte”
     def on_active(self, *_):
         pass
@@ -0,0 +1,140 @@
+# ui/widgets/mixer_strips.py
+"""Pooled row of TrackVolume mixer strips.
+
+The mixer used to clear its row and build one TrackVolume per track on
+every screen switch. This row keeps its strips instead: ``reconcile()``
+only adds or removes strips when the track list changes shape (removed
+strips are parked for reuse) and renames the rest in place, and
+``sync_visible()`` pushes AppState values through
+``TrackVolume.set_state`` so they are not echoed back onto the bus. Only
+strips inside the ScrollView viewport are synced; the others stay marked
+stale until they scroll into view.
+"""
+from typing import Dict, Iterable, List, Optional, Set
+import logging
+
+from kivy.metrics import dp
+from kivy.properties import NumericProperty
+from kivy.uix.boxlayout import BoxLayout
+from kivy.uix.scrollview import ScrollView
+
+from .track_volume import TrackVolume
+
+
+class MixerStrips(BoxLayout):
+    """Horizontal row of mixer strips, reused across screen switches"""
+
+    strip_width = NumericProperty(dp(85))
+
+    def __init__(self, strip_class=TrackVolume, **kwargs):
+        super().__init__(**kwargs)
+        self.logger = logging.getLogger(__name__)
+        self.strip_class = strip_class
+        self.app_state = None  # Source for sync_visible() on scroll
+
+        self.strips: List = []     # Attached, strips[i] shows track i
+        self._spare: List = []     # Detached strips kept for reuse
+        self._stale: Set[int] = set()  # Tracks whose values were not pushed yet
+        self._scroll = None
+
+        # Statistics
+        self.created = 0
+        self.reused = 0
+        self.synced = 0
+
+        self.bind(parent=self._on_parent)
+
+    # === STRUCTURE ===
+
+    def reconcile(self, names: List[str]) -> bool:
+        """Match the strips to ``names``; True if strips were added/removed"""
+        changed = len(self.strips) != len(names)
+        while len(self.strips) > len(names):
+            strip = self.strips.pop()
+            self.remove_widget(strip)
+            self._spare.append(strip)
+            self._stale.discard(len(self.strips))
+
+        while len(self.strips) < len(names):
+            index = len(self.strips)
+            if self._spare:
+                strip = self._spare.pop()
+                strip.set_state(track_index=index)
+                self.reused += 1
+            else:
+                strip = self.strip_class(track_index=index, size_hint_x=None, width=self.strip_width)
+                self.created += 1
+            self.strips.append(strip)
+            self.add_widget(strip)
+            self._stale.add(index)
+
+        for strip, name in zip(self.strips, names):
+            if strip.track_name != name:
+                strip.set_state(track_name=name)
+        return changed
+
+    # === VALUES ===
+
+    def mark_stale(self, tracks: Optional[Iterable[int]] = None):
+        """Values of ``tracks`` (default: all) changed in AppState"""
+        count = len(self.strips)
+        if tracks is None:
+            self._stale.update(range(count))
+        else:
+            self._stale.update(t for t in tracks if 0 <= t < count)
+
+    def visible_range(self) -> range:
+        """Strips inside the ScrollView viewport (all of them if not scrolled)"""
+        scroll = self._scroll
+        if scroll is None or scroll.width <= 0:
+            return range(len(self.strips))
+        pitch = self.strip_width + self.spacing
+        left = scroll.scroll_x * max(0, self.width - scroll.width) - self.padding[0]
+        first = max(0, int(left // pitch))
+        last = min(len(self.strips), int((left + scroll.width) // pitch) + 1)
+        return range(first, last)
+
+    def sync_visible(self, app_state=None) -> int:
+        """Push AppState values into stale visible strips; returns how many"""
+        app_state = app_state or self.app_state
+        if app_state is None or not self._stale:
+            return 0
+        tracks = app_state.m.tracks
+        count = 0
+        for index in self.visible_range():
+            if index not in self._stale:
+                continue
+            self._stale.discard(index)
+            track = tracks.get(index)
+            if track is None:
+                continue
+            self.strips[index].set_state(
+                volume=track.volume, pan=track.pan,
+                send_a=track.sends[0], send_b=track.sends[1], send_c=track.sends[2],
+                is_mute=track.mute, is_solo=track.solo, is_arm=track.arm,
+            )
+            count += 1
+        self.synced += count
+        return count
+
+    # === SCROLLING ===
+
+    def _on_parent(self, _, parent):
+        if self._scroll is not None:
+            self._scroll.unbind(scroll_x=self._on_scroll, width=self._on_scroll)
+        self._scroll = parent if isinstance(parent, ScrollView) else None
+        if self._scroll is not None:
+            self._scroll.bind(scroll_x=self._on_scroll, width=self._on_scroll)
+
+    def _on_scroll(self, *_):
+        self.sync_visible()
+
+    def get_stats(self) -> Dict[str, int]:
+        return {
+            "strips": len(self.strips),
+            "spare": len(self._spare),
+            "stale": len(self._stale),
+            "created": self.created,
+            "reused": self.reused,
+            "synced": self.synced,
+        }
@@ -1,11 +1,23 @@
 from kivy.uix.boxlayout import BoxLayout
-from kivy.properties import StringProperty, ListProperty, NumericProperty
+from kivy.properties import StringProperty, ListProperty, NumericProperty, ObjectProperty
 from kivy.uix.behaviors import ButtonBehavior
+from kivy.metrics import dp
+from ui.label_cache import label_cache
 
 class TrackHeader(ButtonBehavior, BoxLayout):
     track_index = NumericProperty(0)
     track_name  = StringProperty("")
     color_rgba  = ListProperty([0.0, 0.016, 1.0, 1.0])
+    name_texture = ObjectProperty(None, allownone=True)  # From label_cache
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.bind(track_name=self._update_name, width=self._update_name)
+        self._update_name()
+
+    def _update_name(self, *_):
+        self.name_texture = label_cache.get_texture(
+            self.track_name, dp(12), bold=True, max_width=self.width - dp(20))
 
     def on_release(self):
         """Útil para abrir/cambiar la vista de mixer del track."""
@@ -20,14 +20,28 @@ class TrackVolume(BoxLayout):
     is_solo = BooleanProperty(False)
     is_arm  = BooleanProperty(False)
 
+    # True while set_state() applies external values (no bus echo)
+    _silent = False
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self._knob_touch_start_y = 0
         self._knob_start_value = 0
         self._current_knob = None
 
+    def set_state(self, **values):
+        """Apply values from AppState/Live without emitting them back to the bus"""
+        self._silent = True
+        try:
+            for name, value in values.items():
+                setattr(self, name, value)
+        finally:
+            self._silent = False
+
     def _notify(self, what, value):
         """Emit state changes to bus"""
+        if self._silent:
+            return
         bus.emit(f"track:{what}", track=self.track_index, value=value)
         
         # TAMBIÉN enviar directamente a Live si está conectado
@@ -36,18 +50,15 @@ class TrackVolume(BoxLayout):
     # TOGGLE METHODS for SMA buttons
     def toggle_solo(self):
         """Toggle solo state"""
-        self.is_solo = not self.is_solo
-        self._notify("solo", self.is_solo)
+        self.is_solo = not self.is_solo  # on_is_solo notifies
 
     def toggle_mute(self):
         """Toggle mute state"""
-        self.is_mute = not self.is_mute
-        self._notify("mute", self.is_mute)
+        self.is_mute = not self.is_mute  # on_is_mute notifies
 
     def toggle_arm(self):
         """Toggle arm state"""
-        self.is_arm = not self.is_arm
-        self._notify("arm", self.is_arm)
+        self.is_arm = not self.is_arm  # on_is_arm notifies
 
     # Pan Knob Touch Handlers
     def _on_pan_knob_touch_down(self, touch):
@@ -69,8 +80,7 @@ class TrackVolume(BoxLayout):
         new_value = self._knob_start_value + (delta_y * sensitivity)
         new_value = max(-1.0, min(1.0, new_value))  # Clamp to range
         
-        self.pan = new_value
-        self._notify("pan", new_value)
+        self.pan = new_value  # on_pan notifies
         return True
 
     # Send Knob Touch Handlers
@@ -102,13 +112,10 @@ class TrackVolume(BoxLayout):
         
         if send_name == 'A':
             self.send_a = new_value
-            self._notify("send_a", new_value)
         elif send_name == 'B':
             self.send_b = new_value
-            self._notify("send_b", new_value)
         elif send_name == 'C':
             self.send_c = new_value
-            self._notify("send_c", new_value)
         
         return True
 
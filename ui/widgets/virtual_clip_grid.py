@@ -0,0 +1,220 @@
+from kivy.uix.stencilview import StencilView
+from kivy.properties import NumericProperty
+from kivy.metrics import dp
+from typing import Dict, List, Optional, Tuple
+import math
+import logging
+
+from .clip_slot import ClipSlot
+
+class VirtualClipGrid(StencilView):
+    """Scrollable clip grid that only owns enough ClipSlots to fill the viewport
+
+    The pool is (visible columns + 1) x (visible rows + 1) slots, allocated
+    when the widget is resized. Scrolling only moves the pool and rebinds
+    each slot to the (track, scene) cell now under it, so no widgets are
+    created while scrolling, whatever the size of the set.
+    """
+    cell_width = NumericProperty(dp(88))
+    cell_height = NumericProperty(dp(30))
+    scroll_x_px = NumericProperty(0)  # Content offset in pixels
+    scroll_y_px = NumericProperty(0)
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.logger = logging.getLogger(__name__)
+        self.tracks: List[Dict] = []  # [{"clips": [{"status", "name", "has_content"}]}]
+        self.scenes = 0
+        self._pool: List[ClipSlot] = []
+        self._slot_index: Dict[Tuple[int, int], ClipSlot] = {}  # (track, scene) -> bound slot
+        self._cols = 0
+        self._rows = 0
+        self._first_track = 0
+        self._first_scene = 0
+        self._drag = None
+
+        # Statistics
+        self.allocations = 0
+        self.rebinds = 0
+
+        self.bind(size=self._on_resize, pos=self._relayout,
+                  scroll_x_px=self._relayout, scroll_y_px=self._relayout)
+        self._on_resize()  # Size given as a kwarg is set before the binding
+
+    # === DATA ===
+
+    def set_data(self, tracks: List[Dict], scenes: Optional[int] = None):
+        """Point the grid at new track data (no widget allocation)"""
+        self.tracks = tracks
+        self.scenes = scenes if scenes is not None else max((len(t["clips"]) for t in tracks), default=0)
+        self.scroll_x_px = min(self.scroll_x_px, self.max_scroll_x)
+        self.scroll_y_px = min(self.scroll_y_px, self.max_scroll_y)
+        self._relayout(force=True)
+
+    @property
+    def content_width(self) -> float:
+        return len(self.tracks) * self.cell_width
+
+    @property
+    def content_height(self) -> float:
+        return self.scenes * self.cell_height
+
+    @property
+    def max_scroll_x(self) -> float:
+        return max(0.0, self.content_width - self.width)
+
+    @property
+    def max_scroll_y(self) -> float:
+        return max(0.0, self.content_height - self.height)
+
+    def scroll_to(self, x: Optional[float] = None, y: Optional[float] = None):
+        if x is not None:
+            self.scroll_x_px = max(0.0, min(self.max_scroll_x, x))
+        if y is not None:
+            self.scroll_y_px = max(0.0, min(self.max_scroll_y, y))
+
+    def slot_for(self, track: int, scene: int) -> Optional[ClipSlot]:
+        """Pooled slot currently showing a cell (None when off-screen)"""
+        return self._slot_index.get((track, scene))
+
+    def visible_range(self) -> Tuple[int, int, int, int]:
+        """(first_track, end_track, first_scene, end_scene) of cells on screen"""
+        end_track = min(len(self.tracks), self._first_track + self._cols)
+        end_scene = min(self.scenes, self._first_scene + self._rows)
+        return self._first_track, end_track, self._first_scene, end_scene
+
+    def refresh_cell(self, track: int, scene: int):
+        """Rebind one cell after its data changed"""
+        slot = self.slot_for(track, scene)
+        if slot is not None:
+            self._bind_slot(slot, track, scene)
+
+    def release(self):
+        """Stop every pooled slot's animation (grid is being dropped)"""
+        for slot in self._pool:
+            slot.status = "empty"
+
+    # === POOL ===
+
+    def _on_resize(self, *_):
+        cols = int(math.ceil(self.width / self.cell_width)) + 1 if self.width > 0 else 0
+        rows = int(math.ceil(self.height / self.cell_height)) + 1 if self.height > 0 else 0
+        if (cols, rows) != (self._cols, self._rows):
+            needed = cols * rows
+            while len(self._pool) < needed:
+                slot = ClipSlot(size_hint=(None, None))
+                self._pool.append(slot)
+                self.add_widget(slot)
+                self.allocations += 1
+            for slot in self._pool[needed:]:
+                slot.status = "empty"  # Parked slots must not keep animating
+                slot.opacity = 0
+                slot.disabled = True
+            self._cols, self._rows = cols, rows
+        self._relayout(force=True)
+
+    def _relayout(self, *_, force: bool = False):
+        """Position the pool for the current scroll offset and rebind cells"""
+        if not self._cols or not self._rows:
+            return
+        cw, ch = self.cell_width, self.cell_height
+        first_track = int(self.scroll_x_px // cw)
+        first_scene = int(self.scroll_y_px // ch)
+        rebind = force or (first_track, first_scene) != (self._first_track, self._first_scene)
+        self._first_track, self._first_scene = first_track, first_scene
+        if rebind:
+            self._slot_index.clear()
+
+        x0 = self.x - (self.scroll_x_px - first_track * cw)
+        top = self.top + (self.scroll_y_px - first_scene * ch)
+        for col in range(self._cols):
+            track = first_track + col
+            x = x0 + col * cw
+            for row in range(self._rows):
+                slot = self._pool[col * self._rows + row]
+                slot.pos = (x, top - (row + 1) * ch)
+                if rebind:
+                    slot.size = (cw, ch)
+                    self._bind_slot(slot, track, first_scene + row)
+
+    def _bind_slot(self, slot: ClipSlot, track: int, scene: int):
+        if track < len(self.tracks) and scene < self.scenes:
+            data = self.tracks[track]
+            clips = data["clips"]
+            clip = clips[scene] if scene < len(clips) else {}
+            slot.track_index = track
+            slot.scene_index = scene
+            self._slot_index[(track, scene)] = slot
+            slot.status = clip.get("status", "empty")
+            slot.has_content = clip.get("has_content", False)
+            slot.label_text = clip.get("name", "")
+            slot.color_rgba = data.get("color", slot.color_rgba)
+            slot.opacity = 1
+            slot.disabled = False
+        else:
+            slot.status = "empty"  # Hidden slots must not keep animating
+            slot.opacity = 0
+            slot.disabled = True
+        self.rebinds += 1
+
+    # === TOUCH SCROLLING ===
+
+    def on_touch_down(self, touch):
+        if not self.collide_point(*touch.pos):
+            return False
+        if touch.is_mouse_scrolling:
+            step = self.cell_height
+            if touch.button in ("scrolldown", "scrollup"):
+                self.scroll_to(y=self.scroll_y_px + (step if touch.button == "scrolldown" else -step))
+            else:
+                step = self.cell_width
+                self.scroll_to(x=self.scroll_x_px + (step if touch.button == "scrollright" else -step))
+            return True
+        touch.grab(self)
+        self._drag = (touch.x, touch.y, self.scroll_x_px, self.scroll_y_px, False)
+        return True
+
+    def on_touch_move(self, touch):
+        if touch.grab_current is not self or self._drag is None:
+            return super().on_touch_move(touch)
+        x0, y0, sx, sy, moved = self._drag
+        dx, dy = touch.x - x0, touch.y - y0
+        if moved or abs(dx) > dp(6) or abs(dy) > dp(6):
+            self._drag = (x0, y0, sx, sy, True)
+            self.scroll_to(x=sx - dx, y=sy + dy)
+        return True
+
+    def on_touch_up(self, touch):
+        if touch.grab_current is not self:
+            return super().on_touch_up(touch)
+        touch.ungrab(self)
+        drag, self._drag = self._drag, None
+        if drag and not drag[4]:
+            # A tap, not a drag: trigger the cell under the finger
+            cell = self.cell_at(*touch.pos)
+            if cell is not None:
+                self._trigger_cell(*cell)
+        return True
+
+    def cell_at(self, x: float, y: float) -> Optional[Tuple[int, int]]:
+        """(track, scene) under a window point, by arithmetic instead of collide_point"""
+        if not self.collide_point(x, y):
+            return None
+        track = int((x - self.x + self.scroll_x_px) // self.cell_width)
+        scene = int((self.top - y + self.scroll_y_px) // self.cell_height)
+        if 0 <= track < len(self.tracks) and 0 <= scene < self.scenes:
+            return track, scene
+        return None
+
+    def _trigger_cell(self, track: int, scene: int):
+        slot = self.slot_for(track, scene)
+        if slot is not None:
+            slot.trigger()
+
+    def get_stats(self) -> Dict[str, int]:
+        return {
+            "pool": len(self._pool),
+            "visible": self._cols * self._rows,
+            "allocations": self.allocations,
+            "rebinds": self.rebinds,
+        }